@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, List
 
 from openai import OpenAI
 
+from app.helpers.LLMUsage import tracked_chat_completion
 from app.helpers.RapidAPIScraper import RapidAPIScraper
 from app.config.speaker_profile_chatbot import (
     TOPICS as ALLOWED_TOPICS,
@@ -141,6 +142,8 @@ Full content:
 
 Return a single JSON object with keys: event_name, location, topics, start_date, end_date, speaking_format, delivery_mode, target_audiences, metadata. Use start_date and end_date in ISO format (YYYY-MM-DD); for one-day events set end_date equal to start_date. Use ONLY: topics from """ + _TOPICS_LIST_STR + """; speaking_format from """ + _SPEAKING_FORMATS_STR + """; delivery_mode from """ + _DELIVERY_MODE_STR + """; target_audiences from """ + _TARGET_AUDIENCES_STR + """."""
 
+    TEMPERATURE = 0.1
+
     def __init__(self, rapidapi_scraper: RapidAPIScraper = None):
         self.rapidapi_scraper = rapidapi_scraper or RapidAPIScraper()
 
@@ -164,6 +167,10 @@ Return a single JSON object with keys: event_name, location, topics, start_date,
         ])
         return missing >= 2
 
+    def needs_enrichment(self, opp: Dict[str, Any]) -> bool:
+        """True if enrich_opportunities will try to enrich opp (has a link and is missing key details)."""
+        return bool(opp.get("link") or opp.get("url")) and self._is_opportunity_incomplete(opp)
+
     def _parse_llm_json_object(self, text: str) -> Optional[Dict[str, Any]]:
         """Parse JSON object from LLM response."""
         text = (text or "").strip()
@@ -240,25 +247,68 @@ Return a single JSON object with keys: event_name, location, topics, start_date,
             result["metadata"] = meta
         return result
 
-    def _enrich_opportunity(self, opp: Dict[str, Any]) -> Dict[str, Any]:
-        """Enrich a single opportunity by scraping its link and extracting via LLM."""
+    def prepare_enrichment(self, opp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Scrape the opportunity link and build the enrichment chat messages.
+        Returns {"messages": [...], "og_url": ...} or None when the opportunity needs no (or cannot get) enrichment.
+        Also used to build offline batch requests (see app/helpers/BatchExtraction.py).
+        """
         link = (opp.get("link") or opp.get("url") or "").strip()
         if not link:
-            return opp
+            return None
         if not self._is_opportunity_incomplete(opp):
-            return opp
+            return None
 
         result = self.rapidapi_scraper.scrape(link)
         if not result.get("success"):
-            return opp
+            return None
 
         data = result.get("data", {})
         content = (data.get("content") or "").strip()
         name = data.get("name") or ""
         description = data.get("description") or ""
-        og_url = data.get("ogUrl")
-
         if not content:
+            return None
+        return {
+            "messages": [
+                {"role": "system", "content": self.ENRICHER_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": self.ENRICHER_USER_PROMPT_TEMPLATE.format(
+                        name=name or "(not provided)",
+                        description=description or "(not provided)",
+                        content=content[:8000],
+                    ),
+                },
+            ],
+            "og_url": data.get("ogUrl"),
+        }
+
+    def apply_enrichment(self, opp: Dict[str, Any], text: Optional[str], og_url: Optional[str] = None) -> Dict[str, Any]:
+        """Merge an enrichment LLM response into opp and re-filter catalog fields. Returns opp unchanged if unparseable."""
+        enriched_data = self._parse_llm_json_object(text) if text else None
+        if not enriched_data:
+            return opp
+
+        merged = self._merge_enriched(opp, enriched_data)
+        raw_topics = merged.get("topics") or []
+        merged["topics"] = _filter_topics_to_allowed([str(t).strip() for t in raw_topics if t]) if raw_topics else self._ensure_topics_non_empty(merged)
+        merged["speaking_format"] = _filter_speaking_format((merged.get("speaking_format") or "").strip())
+        merged["delivery_mode"] = _filter_delivery_mode((merged.get("delivery_mode") or "").strip())
+        raw_audiences = merged.get("target_audiences") or []
+        merged["target_audiences"] = _filter_target_audiences_to_allowed([str(a).strip() for a in raw_audiences if a])
+        if og_url:
+            meta = merged.get("metadata")
+            if not isinstance(meta, dict):
+                meta = {}
+            meta["ogUrl"] = og_url
+            merged["metadata"] = meta
+        return merged
+
+    def _enrich_opportunity(self, opp: Dict[str, Any]) -> Dict[str, Any]:
+        """Enrich a single opportunity by scraping its link and extracting via LLM."""
+        prepared = self.prepare_enrichment(opp)
+        if prepared is None:
             return opp
 
         api_key = os.getenv("OPENAI_API_KEY")
@@ -268,47 +318,22 @@ Return a single JSON object with keys: event_name, location, topics, start_date,
         try:
             client = OpenAI(api_key=api_key)
             model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            response = client.chat.completions.create(
+            response = tracked_chat_completion(
+                client,
+                "enricher",
                 model=model,
-                messages=[
-                    {"role": "system", "content": self.ENRICHER_SYSTEM_PROMPT},
-                    {
-                        "role": "user",
-                        "content": self.ENRICHER_USER_PROMPT_TEMPLATE.format(
-                            name=name or "(not provided)",
-                            description=description or "(not provided)",
-                            content=content[:8000],
-                        ),
-                    },
-                ],
-                temperature=0.1,
+                messages=prepared["messages"],
+                temperature=self.TEMPERATURE,
             )
             text = response.choices[0].message.content
-            enriched_data = self._parse_llm_json_object(text) if text else None
-            if not enriched_data:
-                return opp
-
-            merged = self._merge_enriched(opp, enriched_data)
-            raw_topics = merged.get("topics") or []
-            merged["topics"] = _filter_topics_to_allowed([str(t).strip() for t in raw_topics if t]) if raw_topics else self._ensure_topics_non_empty(merged)
-            merged["speaking_format"] = _filter_speaking_format((merged.get("speaking_format") or "").strip())
-            merged["delivery_mode"] = _filter_delivery_mode((merged.get("delivery_mode") or "").strip())
-            raw_audiences = merged.get("target_audiences") or []
-            merged["target_audiences"] = _filter_target_audiences_to_allowed([str(a).strip() for a in raw_audiences if a])
-            if og_url:
-                meta = merged.get("metadata")
-                if not isinstance(meta, dict):
-                    meta = {}
-                meta["ogUrl"] = og_url
-                merged["metadata"] = meta
-            return merged
+            return self.apply_enrichment(opp, text, prepared["og_url"])
         except Exception:
             return opp
 
     def enrich_opportunities(self, opportunities: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
         """Enrich opportunities that have link but missing details."""
         enriched = []
-        to_enrich = [o for o in opportunities if self._is_opportunity_incomplete(o) and (o.get("link") or o.get("url"))]
+        to_enrich = [o for o in opportunities if self.needs_enrichment(o)]
         if not to_enrich:
             return opportunities
 
@@ -10,6 +10,7 @@ from typing import Any, Dict
 
 from openai import OpenAI
 
+from app.helpers.LLMUsage import tracked_chat_completion
 from app.helpers.PineconeOpportunityStore import OpportunityTextBuilder
 
 logger = logging.getLogger(__name__)
@@ -120,7 +121,9 @@ Is this opportunity a good match for this speaker? Reply with JSON only: {{"matc
         try:
             client = self._get_client()
             model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            response = client.chat.completions.create(
+            response = tracked_chat_completion(
+                client,
+                "match_agent",
                 model=model,
                 messages=[
                     {"role": "system", "content": self.SYSTEM_PROMPT},
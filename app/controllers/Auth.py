@@ -69,12 +69,13 @@ async def reset_password(password_data: ResetPassword, service = Depends(get_aut
 async def get_all_users(
     page: int=1,
     limit: int=10,
+    cursor: str=None,
     service = Depends(get_auth_service),
     jwt_payload: dict = Depends(jwt_validator)
     
 ):
     try:
-        data = await service.get_all_users(page=page, limit=limit)
+        data = await service.get_all_users(page=page, limit=limit, cursor=cursor)
         return Utils.create_response(data["data"], data["success"], data.get("error", ""))
     except Exception as e:
         raise HTTPException(status_code=400, detail={"data": None, "error": str(e), "success": False})
@@ -83,6 +84,7 @@ async def get_all_users(
 async def get_users_by_admin(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
     service = Depends(get_auth_service),
     jwt_payload: dict = Depends(jwt_validator)
 ):
@@ -103,7 +105,7 @@ async def get_users_by_admin(
                 detail={"data": None, "error": "Only admins can access this resource", "success": False}
             )
         
-        data = await service.get_users_by_admin(admin_id, page, limit)
+        data = await service.get_users_by_admin(admin_id, page, limit, cursor)
         if not data["success"]:
             raise HTTPException(
                 status_code=400,
@@ -1,20 +1,28 @@
-from datetime import datetime, timedelta
-
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from app.config.dashboard import DASHBOARD_TOTAL_AGENTS
+from app.dependencies import get_dashboard_service
 from app.helpers.Utilities import Utils
-from app.models.Opportunity import OpportunityModel
-from app.models.RecentActivity import RecentActivityModel
-from app.models.SpeakerProfile import SpeakerProfileModel
-from app.models.User import UserModel
 from app.schemas.ServerResponse import ServerResponse
 
-RECENT_ACTIVITY_FALLBACK_LIMIT = 5
-
 router = APIRouter(prefix="/api/v1/dashboard", tags=["Dashboard"])
 
 
+@router.get("/summary", response_model=ServerResponse)
+async def get_dashboard_summary(service=Depends(get_dashboard_service)):
+    """
+    Everything the dashboard shows in one call: counts (agents, users, speakerProfiles, opportunities;
+    cached for DASHBOARD_COUNTS_TTL_SECONDS) and the recent activity feed (same rules as /recent-activities).
+    """
+    try:
+        return Utils.create_response(await service.get_summary(), True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
 @router.get("/agents-count", response_model=ServerResponse)
 async def get_agents_count():
     """Total agents used in the system (fixed; see app/config/dashboard.py)."""
@@ -28,12 +36,11 @@ async def get_agents_count():
 
 
 @router.get("/users-count", response_model=ServerResponse)
-async def get_users_count():
-    """Total users in the users collection."""
+async def get_users_count(service=Depends(get_dashboard_service)):
+    """Total users in the users collection (estimated, cached)."""
     try:
-        user_model = UserModel()
-        count = await user_model.get_documents_count({})
-        return Utils.create_response({"count": count}, True)
+        counts = await service.get_counts()
+        return Utils.create_response({"count": counts["users"]}, True)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -42,12 +49,11 @@ async def get_users_count():
 
 
 @router.get("/speaker-profiles-count", response_model=ServerResponse)
-async def get_speaker_profiles_count():
-    """Total documents in speaker_profiles collection."""
+async def get_speaker_profiles_count(service=Depends(get_dashboard_service)):
+    """Total documents in speaker_profiles collection (estimated, cached)."""
     try:
-        profile_model = SpeakerProfileModel()
-        count = await profile_model.count()
-        return Utils.create_response({"count": count}, True)
+        counts = await service.get_counts()
+        return Utils.create_response({"count": counts["speakerProfiles"]}, True)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -56,12 +62,11 @@ async def get_speaker_profiles_count():
 
 
 @router.get("/opportunities-count", response_model=ServerResponse)
-async def get_opportunities_count():
-    """Total opportunities in the Opportunities collection."""
+async def get_opportunities_count(service=Depends(get_dashboard_service)):
+    """Total opportunities in the Opportunities collection (estimated, cached)."""
     try:
-        opportunity_model = OpportunityModel()
-        count = await opportunity_model.count()
-        return Utils.create_response({"count": count}, True)
+        counts = await service.get_counts()
+        return Utils.create_response({"count": counts["opportunities"]}, True)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -70,26 +75,13 @@ async def get_opportunities_count():
 
 
 @router.get("/recent-activities", response_model=ServerResponse)
-async def get_recent_activities():
+async def get_recent_activities(service=Depends(get_dashboard_service)):
     """
     Recent activity feed: entries for today (UTC), else yesterday (UTC), else up to 5 most recent.
+    Read with one indexed query over the newest DASHBOARD_ACTIVITY_SCAN_LIMIT entries.
     """
     try:
-        model = RecentActivityModel()
-        now = datetime.utcnow()
-        today_start = datetime(now.year, now.month, now.day)
-        today_end = today_start + timedelta(days=1)
-        yesterday_start = today_start - timedelta(days=1)
-
-        activities = await model.list_created_between(today_start, today_end)
-        source = "today"
-        if not activities:
-            activities = await model.list_created_between(yesterday_start, today_start)
-            source = "yesterday"
-        if not activities:
-            activities = await model.list_recent(RECENT_ACTIVITY_FALLBACK_LIMIT)
-            source = "recent"
-
+        source, activities = await service.get_recent_activities()
         return Utils.create_response({"source": source, "activities": activities}, True)
     except Exception as e:
         raise HTTPException(
@@ -13,14 +13,15 @@ router = APIRouter(prefix="/api/v1/google-query-scraper", tags=["Google Query Sc
 async def get_all_google_queries(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
     service=Depends(get_google_query_scraper_service),
     jwt_payload: dict = Depends(jwt_validator),
 ):
     """List all Google queries for the current user with pagination."""
     try:
         user_id = jwt_payload.get("id")
-        result = await service.get_list(user_id=user_id, skip=skip, limit=limit)
-        return Utils.create_response(result, True)
+        result = await service.get_list(user_id=user_id, skip=skip, limit=limit, cursor=cursor)
+        return Utils.create_fast_response(result, True)
     except HTTPException:
         raise
     except Exception as e:
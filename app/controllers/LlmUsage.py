@@ -0,0 +1,59 @@
+"""
+LLM usage accounting: prompt/completion tokens, cache hits and latency per stage.
+Per job (UrlCollection / GoogleQuery / chat session / speaker profile matching) and aggregated per day.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.helpers.Utilities import Utils
+from app.middleware.JWTVerification import jwt_validator
+from app.models.LlmUsage import LlmUsageModel
+from app.schemas.ServerResponse import ServerResponse
+
+router = APIRouter(prefix="/api/v1/llm-usage", tags=["LLM Usage"])
+
+# Path segment -> job id field stored on llmUsage documents
+_JOB_TYPES = {
+    "url-collections": "urlCollectionId",
+    "google-queries": "googleQueryId",
+    "chat-sessions": "chatSessionId",
+    "speaker-profiles": "speakerProfileId",
+}
+
+
+@router.get("/daily", response_model=ServerResponse)
+async def get_daily_llm_usage(
+    days: int = Query(7, ge=1, le=90),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """Tokens, cache hits and latency per day, stage and model for the last `days` days."""
+    try:
+        rows = await LlmUsageModel().aggregate_daily(days=days)
+        return Utils.create_response({"days": days, "rows": rows}, True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.get("/{job_type}/{job_id}", response_model=ServerResponse)
+async def get_job_llm_usage(
+    job_type: str,
+    job_id: str,
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """Per-stage LLM usage for one job. job_type: url-collections | google-queries | chat-sessions | speaker-profiles."""
+    job_field = _JOB_TYPES.get(job_type)
+    if not job_field:
+        raise HTTPException(
+            status_code=404,
+            detail={"data": None, "error": f"Unknown job type: {job_type}", "success": False},
+        )
+    try:
+        summary = await LlmUsageModel().summarize_job(job_field, job_id)
+        return Utils.create_response(summary, True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
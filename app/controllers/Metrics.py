@@ -0,0 +1,53 @@
+"""
+Runtime metrics: Mongo driver command latency per (collection, command) and connection pool checkout waits.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.helpers import MongoMetrics
+from app.helpers.auth_roles import is_admin_role
+from app.helpers.Database import MongoDB
+from app.helpers.Utilities import Utils
+from app.middleware.JWTVerification import jwt_validator
+from app.schemas.ServerResponse import ServerResponse
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["Metrics"])
+
+
+def _require_admin(jwt_payload: dict) -> None:
+    if not is_admin_role(jwt_payload.get("userType")):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "data": None,
+                "error": "Only admins can access this resource",
+                "success": False,
+            },
+        )
+
+
+@router.get("/mongo", response_model=ServerResponse)
+async def get_mongo_metrics():
+    """Command duration histograms per (collection, command), pool checkout waits and connection counts since start (or last reset)."""
+    try:
+        data = MongoMetrics.snapshot(MongoDB.client_options)
+        return Utils.create_response(data, True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.post("/mongo/reset", response_model=ServerResponse)
+async def reset_mongo_metrics(jwt_payload: dict = Depends(jwt_validator)):
+    """Admin only: return the current snapshot and clear the histograms and counters."""
+    _require_admin(jwt_payload)
+    try:
+        data = MongoMetrics.snapshot(MongoDB.client_options)
+        MongoMetrics.reset()
+        return Utils.create_response(data, True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
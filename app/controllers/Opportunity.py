@@ -1,4 +1,6 @@
-"""Controller for Opportunities - list, delete, match-by-speaker (background job), and get matched."""
+"""Controller for Opportunities - list, search, delete, match-by-speaker (background job), and get matched."""
+
+from datetime import date
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from app.schemas.ServerResponse import ServerResponse
@@ -15,18 +17,77 @@ async def list_opportunities(
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_by_start_date: str = Query(None, description="Sort by start_date: asc or desc"),
     sort_by_end_date: str = Query(None, description="Sort by end_date: asc or desc"),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
+    include_archived: bool = Query(False, description="Also list archived (past) opportunities"),
     service=Depends(get_opportunity_service),
     jwt_payload: dict = Depends(jwt_validator),
 ):
-    """List opportunities with pagination. Optional sort by start_date and/or end_date (asc | desc)."""
+    """
+    List opportunities with pagination. Optional sort by start_date and/or end_date (asc | desc).
+    For deep pages pass the returned nextCursor as cursor (with the same sort).
+    """
     try:
         result = await service.list_opportunities(
             page=page,
             limit=limit,
             sort_by_start_date=sort_by_start_date,
             sort_by_end_date=sort_by_end_date,
+            cursor=cursor,
+            include_archived=include_archived,
         )
-        return Utils.create_response(result, True)
+        return Utils.create_fast_response(result, True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.get("/search", response_model=ServerResponse)
+async def search_opportunities(
+    topics: str = Query(None, description="Comma-separated topics (any match)"),
+    speaking_format: str = Query(None, description="Comma-separated speaking formats (any match)"),
+    delivery_mode: str = Query(None, description="Comma-separated delivery modes (any match), e.g. Virtual"),
+    target_audiences: str = Query(None, description="Comma-separated target audiences (any match)"),
+    start_date_from: date = Query(None, description="start_date on or after (YYYY-MM-DD)"),
+    start_date_to: date = Query(None, description="start_date on or before (YYYY-MM-DD)"),
+    is_qualified: bool = Query(None, description="Only qualified (true) or unqualified (false) opportunities"),
+    location: str = Query(None, description="Case-insensitive substring of location"),
+    q: str = Query(None, description="Free-text search over event name and description"),
+    fields: str = Query(None, description="Comma-separated fields to return (_id is always included)"),
+    sort_by_start_date: str = Query(None, description="asc (default) or desc"),
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
+    include_archived: bool = Query(False, description="Also search archived (past) opportunities"),
+    service=Depends(get_opportunity_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """
+    Search opportunities by topics, speaking format, delivery mode, target audiences, start date range,
+    qualification, location and free text, ordered by start_date. Pass nextCursor back as cursor (same filters).
+    """
+    try:
+        result = await service.search_opportunities(
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            sort_by_start_date=sort_by_start_date,
+            fields=fields,
+            include_archived=include_archived,
+            topics=topics,
+            speaking_format=speaking_format,
+            delivery_mode=delivery_mode,
+            target_audiences=target_audiences,
+            start_date_from=start_date_from,
+            start_date_to=start_date_to,
+            is_qualified=is_qualified,
+            location=location,
+            q=q,
+        )
+        return Utils.create_fast_response(result, True)
     except HTTPException:
         raise
     except Exception as e:
@@ -128,7 +189,7 @@ async def get_matched_opportunities_by_speaker(
         opportunities, status = await service.get_matched_opportunities_by_speaker_id(
             speaker_profile_id
         )
-        return Utils.create_response(
+        return Utils.create_fast_response(
             {"opportunities": opportunities, "status": status}, True
         )
     except HTTPException:
@@ -143,12 +204,13 @@ async def get_matched_opportunities_by_speaker(
 @router.get("/{opportunity_id}", response_model=ServerResponse)
 async def get_opportunity_by_id(
     opportunity_id: str,
+    include_archived: bool = Query(False, description="Also look up archived (past) opportunities"),
     service=Depends(get_opportunity_service),
     jwt_payload: dict = Depends(jwt_validator),
 ):
     """Get a single opportunity by ID. Link in emails points to this API."""
     try:
-        opportunity = await service.get_opportunity_by_id(opportunity_id)
+        opportunity = await service.get_opportunity_by_id(opportunity_id, include_archived=include_archived)
         if not opportunity:
             raise HTTPException(
                 status_code=404,
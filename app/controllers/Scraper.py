@@ -36,18 +36,19 @@ async def create_scraper(
 async def list_scrapers(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
     jwt_payload: dict = Depends(jwt_validator),
     service=Depends(get_url_scraper_rapidapi_service),
 ):
     """List all scrapers from UrlCollection (sourceName, description updated after RapidAPI scrape)."""
     try:
-        result = await service.get_list(skip=skip, limit=limit)
+        result = await service.get_list(skip=skip, limit=limit, cursor=cursor)
         if not result["success"]:
             raise HTTPException(
                 status_code=400,
                 detail={"data": None, "error": result["error"], "success": False},
             )
-        return Utils.create_response(result["data"], True)
+        return Utils.create_fast_response(result["data"], True)
     except HTTPException:
         raise
     except Exception as e:
@@ -190,12 +190,12 @@ async def get_my_speaker_profiles(
                     detail={"data": None, "error": "You can only access your own speaker profiles.", "success": False},
                 )
             profiles = await model.get_profiles_by_user_id(uid)
-            return Utils.create_response(profiles, True)
+            return Utils.create_fast_response(profiles, True)
         if is_admin_role(jwt_payload.get("userType")):
             profiles = await model.get_all_profiles()
         else:
             profiles = await model.get_profiles_by_user_id(str(token_user_id))
-        return Utils.create_response(profiles, True)
+        return Utils.create_fast_response(profiles, True)
     except HTTPException:
         raise
     except Exception as e:
@@ -235,7 +235,7 @@ async def get_speaker_profiles_by_user_id(
                 detail={"data": None, "error": "You can only access your own speaker profiles.", "success": False},
             )
         profiles = await model.get_profiles_by_user_id(user_id)
-        return Utils.create_response(profiles, True)
+        return Utils.create_fast_response(profiles, True)
     except HTTPException:
         raise
     except Exception as e:
@@ -465,7 +465,7 @@ async def resume_onboarding(
             status_code=403,
             detail={"data": None, "error": "You do not have access to this profile.", "success": False},
         )
-    conversation = profile.get("conversation") or []
+    conversation = await model.get_conversation(profile_id, profile)
     current_step_name = profile.get("current_step")
     if current_step_name:
         step_def = get_step_by_name(current_step_name)
@@ -497,6 +497,40 @@ async def resume_onboarding(
     }
 
 
+@router.get("/{profile_id}/conversation", response_model=ServerResponse)
+async def get_onboarding_conversation(
+    profile_id: str,
+    after_seq: Optional[int] = Query(None, description="Return buckets after this bucket seq (omit to start from the first)"),
+    buckets: int = Query(4, ge=1, le=50, description="Buckets per page"),
+    jwt_payload: dict = Depends(jwt_validator),
+    model=Depends(get_speaker_profile_model),
+):
+    """
+    Onboarding transcript, oldest first, paged by bucket. Pass nextSeq back as after_seq for the next page.
+    Admins may read any profile; other users only their own.
+    """
+    token_user_id = jwt_payload.get("id") or jwt_payload.get("user_id")
+    if not token_user_id:
+        raise HTTPException(
+            status_code=401,
+            detail={"data": None, "error": "User ID not found in token.", "success": False},
+        )
+    profile = await model.get_profile(profile_id, projection="summary")
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail={"data": None, "error": "Profile not found.", "success": False},
+        )
+    owner_id = profile.get("user_id")
+    if not is_admin_role(jwt_payload.get("userType")) and (owner_id is None or str(owner_id) != str(token_user_id)):
+        raise HTTPException(
+            status_code=403,
+            detail={"data": None, "error": "You do not have access to this profile.", "success": False},
+        )
+    messages, next_seq = await model.conversations.get_page(profile_id, after_seq=after_seq, buckets=buckets)
+    return Utils.create_response({"messages": messages, "nextSeq": next_seq}, True)
+
+
 @router.post("/init")
 async def init_onboarding():
     """
@@ -734,15 +768,10 @@ async def verify_step(
 
     profile_id = body.profile_id
     if body.step == "full_name" and not body.profile_id:
-        doc = await model.create_profile(normalized, user_id=user_id)
+        doc = await model.create_profile(normalized, user_id=user_id, last_assistant_message=assistant_message)
         profile_id = str(doc["_id"])
         await model.append_conversation(profile_id, agent_message_for_step, normalized)
-        await model.update_last_assistant_message(profile_id, assistant_message)
     elif body.profile_id and profile:
-        completed = list(profile.get("completed_steps") or [])
-        if body.step not in completed:
-            completed.append(body.step)
-        await model.append_conversation(profile_id, agent_message_for_step, display_value)
         # past_speaking_examples and video_links are stored as arrays; when skipped (normalized None) store []
         if body.step == "past_speaking_examples":
             if normalized is None:
@@ -766,12 +795,14 @@ async def verify_step(
                 step_updates = {"linkedin_url": normalized}
         else:
             step_updates = {body.step: normalized}
-        await model.update_step(
+        await model.apply_step_result(
             body.profile_id,
+            body.step,
             updates=step_updates,
             next_step_name=next_step_name,
-            completed_steps=completed,
             last_assistant_message=assistant_message,
+            agent_content=agent_message_for_step,
+            user_content=display_value,
         )
         if is_last:
             to_email = profile.get("email")
@@ -2,8 +2,8 @@
 Controller for URL scraping via RapidAPI.
 Separate from Scraper controller - no connection with existing Scraper/Scrapers.
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from app.schemas.Opportunity import UrlScrapeCreateSchema
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from app.schemas.Opportunity import UrlCrawlCreateSchema, UrlDiscoveryCreateSchema, UrlScrapeCreateSchema
 from app.schemas.ServerResponse import ServerResponse
 from app.helpers.Utilities import Utils
 from app.dependencies import get_url_scraper_rapidapi_service
@@ -56,6 +56,144 @@ async def create_url_scrape(
         )
 
 
+@router.post("/crawl", response_model=ServerResponse, status_code=201)
+async def create_url_crawl(
+    data: UrlCrawlCreateSchema,
+    background_tasks: BackgroundTasks,
+    service=Depends(get_url_scraper_rapidapi_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """
+    Crawl a site (same host as url, up to max_depth/max_urls) and create one UrlCollection per discovered page.
+    Returns immediately; the crawl and the usual scrape + extract pipeline for each created job run in the background.
+    """
+    try:
+        url = data.url.strip()
+        if not url:
+            raise HTTPException(
+                status_code=400,
+                detail={"data": None, "error": "URL is required", "success": False},
+            )
+
+        user_id = jwt_payload.get("id")
+        background_tasks.add_task(
+            service.crawl_and_run, url, data.max_depth, data.max_urls, user_id=user_id, topics=data.topics
+        )
+
+        return Utils.create_response(
+            {"url": url, "message": "Crawl started. Discovered pages are queued and processed in background."},
+            True,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.post("/discover", response_model=ServerResponse, status_code=201)
+async def create_url_discovery(
+    data: UrlDiscoveryCreateSchema,
+    background_tasks: BackgroundTasks,
+    service=Depends(get_url_scraper_rapidapi_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """
+    Find event/CFP pages of a domain via robots.txt, sitemaps and RSS/Atom feeds and queue only new or
+    changed URLs as UrlCollection jobs. Returns immediately; discovery and the usual scrape + extract pipeline
+    for the queued jobs run in the background.
+    """
+    try:
+        domain = data.domain.strip()
+        if not domain:
+            raise HTTPException(
+                status_code=400,
+                detail={"data": None, "error": "Domain is required", "success": False},
+            )
+
+        user_id = jwt_payload.get("id")
+        background_tasks.add_task(
+            service.discover_and_run, domain, data.max_urls, data.since_days, user_id=user_id, topics=data.topics
+        )
+
+        return Utils.create_response(
+            {"domain": domain, "message": "Discovery started. New or changed pages are queued and processed in background."},
+            True,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.get("/dead-letter", response_model=ServerResponse)
+async def get_dead_letter_jobs(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, skip is ignored"),
+    service=Depends(get_url_scraper_rapidapi_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """Scrape jobs that failed SCRAPE_RETRY_MAX_ATTEMPTS times with retryable errors."""
+    try:
+        result = await service.get_dead_letter_jobs(skip=skip, limit=limit, cursor=cursor)
+        return Utils.create_fast_response(result["data"], True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.post("/{url_collection_id}/requeue", response_model=ServerResponse)
+async def requeue_url_collection(
+    url_collection_id: str,
+    service=Depends(get_url_scraper_rapidapi_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """Move a failed or dead-lettered scrape job back to the retry queue (due immediately)."""
+    try:
+        result = await service.requeue_job(url_collection_id)
+        if not result["success"]:
+            raise HTTPException(
+                status_code=404,
+                detail={"data": None, "error": result["error"], "success": False},
+            )
+        return Utils.create_response(result["data"], True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
+@router.get("/stats/change-detection", response_model=ServerResponse)
+async def get_change_detection_stats(
+    service=Depends(get_url_scraper_rapidapi_service),
+    jwt_payload: dict = Depends(jwt_validator),
+):
+    """Unchanged re-scrapes (same content hash) and LLM calls spent vs saved by skipping extraction."""
+    try:
+        result = await service.get_change_detection_stats()
+        return Utils.create_response(result["data"], True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"data": None, "error": str(e), "success": False},
+        )
+
+
 @router.get("/{url_collection_id}", response_model=ServerResponse)
 async def get_url_collection(
     url_collection_id: str,
@@ -49,12 +49,13 @@ def _require_admin(jwt_payload: dict) -> None:
 async def list_users_with_profiles(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str = Query(None, description="nextCursor from the previous page; when set, page/skip is ignored"),
     service=Depends(get_user_management_service),
     jwt_payload: dict = Depends(jwt_validator),
 ):
     _require_admin(jwt_payload)
     try:
-        data = await service.list_users_with_profiles(page=page, limit=limit)
+        data = await service.list_users_with_profiles(page=page, limit=limit, cursor=cursor)
         if not data["success"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -64,7 +65,7 @@ async def list_users_with_profiles(
                     "success": False,
                 },
             )
-        return Utils.create_response(data["data"], True, "")
+        return Utils.create_fast_response(data["data"], True, "")
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,46 @@
+"""
+Normalized content fingerprint for scraped pages.
+Volatile parts of a page (timestamps, relative times, copyright/"last updated" lines,
+cookie/newsletter boilerplate, tracking query strings) are stripped before hashing so that a re-scrape of an unchanged
+page produces the same hash and the LLM extraction can be skipped.
+"""
+import hashlib
+import re
+
+_BOILERPLATE_LINE_RE = re.compile(
+    r"(cookie|all rights reserved|privacy policy|terms of (use|service)|subscribe to|sign up for our newsletter|"
+    r"last updated|last modified|posted on|published on|©|\(c\)\s*\d{4})",
+    re.IGNORECASE,
+)
+# Full timestamps only; bare calendar dates are kept because event dates are real content changes.
+_ISO_TIMESTAMP_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?\b")
+_TIME_RE = re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?\s*(?:am|pm)?\b")
+_RELATIVE_TIME_RE = re.compile(r"\b\d+\s+(?:seconds?|minutes?|hours?|days?|weeks?)\s+ago\b")
+_QUERY_STRING_RE = re.compile(r"(https?://[^\s)\]?#]+)[?#][^\s)\]]*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_content(content: str) -> str:
+    """Lowercase, drop boilerplate lines and volatile timestamps, strip URL query strings, collapse whitespace."""
+    if not content:
+        return ""
+    kept = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or _BOILERPLATE_LINE_RE.search(stripped):
+            continue
+        kept.append(stripped)
+    text = "\n".join(kept).lower()
+    text = _QUERY_STRING_RE.sub(r"\1", text)
+    text = _ISO_TIMESTAMP_RE.sub(" ", text)
+    text = _TIME_RE.sub(" ", text)
+    text = _RELATIVE_TIME_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalized_content_hash(content: str) -> str:
+    """sha256 hex digest of normalize_content(content). Empty string when content is empty after normalization."""
+    normalized = normalize_content(content)
+    if not normalized:
+        return ""
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -1,127 +1,289 @@
-"""Crawler for extracting links from web pages."""
+"""
+Crawler for extracting same-site links from web pages.
+Async frontier: N worker tasks share one queue; each host is capped at CRAWL_PER_HOST_CONCURRENCY
+in-flight fetches. Pages are fetched over a pooled aiohttp session; when the site blocks that fetch
+(403/429/503) or serves an empty HTML shell, and a browser is configured (PLAYWRIGHT_WSS or
+PLAYWRIGHT_LOCAL_FALLBACK=true), a fixed pool of reusable Playwright pages renders them instead. Missing pages
+(404/410, other errors) are not rendered. Links are extracted with lxml; their canonical form is the dedupe key,
+so the same page under different query/fragment/trailing-slash variants is visited once, but pages are fetched
+and returned under the URL the site links to (the canonical form drops "www." and query params, which not every
+host serves). Output feeds the UrlCollection scrape pipeline (UrlScraperRapidAPIService.crawl_and_enqueue).
+"""
 import asyncio
+import logging
 import os
-from collections import deque
-from typing import List, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import aiohttp
+import lxml.html
 
-from app.helpers.Scraper import WebsiteScraper
+from app.helpers.UrlCanonical import canonicalize_url, url_host
 
+logger = logging.getLogger(__name__)
 
-class Crawler:
-    """Crawls websites to extract links within the same domain."""
-
-    def __init__(self):
-        self.scraper = WebsiteScraper()
-
-    def is_same_domain(self, url: str, root_netloc: str) -> bool:
-        """Check if URL belongs to the same domain as root."""
-        return urlparse(url).netloc == root_netloc
-
-    def extract_links_spider(self, html: str, base_url: str) -> List[str]:
-        """Extract links from HTML using BeautifulSoup."""
-        soup = BeautifulSoup(html, "html.parser")
-        links = set()
-        for tag in soup.find_all("a", href=True):
-            full_url = urljoin(base_url, tag["href"])
-            links.add(full_url)
-        return list(links)
-
-    def try_spider(self, url: str) -> List[str] | None:
-        """Try to extract links via spider. Returns None on failure."""
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "8"))
+CRAWL_PER_HOST_CONCURRENCY = int(os.getenv("CRAWL_PER_HOST_CONCURRENCY", "4"))
+CRAWL_PAGE_POOL_SIZE = int(os.getenv("CRAWL_PAGE_POOL_SIZE", "4"))
+CRAWL_FETCH_TIMEOUT_SECONDS = 20
+CRAWL_MAX_HTML_BYTES = 5 * 1024 * 1024
+CRAWL_USER_AGENT = "Mozilla/5.0 (compatible; HDAICrawler/1.0)"
+# Responses a browser render may get past (bot protection, rate limiting, challenge pages)
+CRAWL_RENDER_FALLBACK_STATUSES = {403, 429, 503}
+
+# Non-HTML resources are never enqueued
+_SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico", ".css", ".js", ".json", ".xml",
+    ".zip", ".gz", ".rar", ".mp3", ".mp4", ".mov", ".avi", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+)
+
+
+def extract_links(html: str, base_url: str) -> List[str]:
+    """Absolute href targets of <a> tags (lxml; honours <base href>). Empty list on unparsable HTML."""
+    if not html or not html.strip():
+        return []
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return []
+    base_hrefs = doc.xpath("//base/@href")
+    base = urljoin(base_url, base_hrefs[0].strip()) if base_hrefs else base_url
+    links = []
+    for href in doc.xpath("//a/@href"):
+        href = href.strip()
+        if not href or href.startswith(("#", "mailto:", "tel:", "javascript:")):
+            continue
+        links.append(urldefrag(urljoin(base, href))[0])
+    return links
+
+
+def is_crawlable(url: str) -> bool:
+    """True for http(s) URLs that do not point at a known non-HTML resource."""
+    path = urlsplit(url).path.lower()
+    return not path.endswith(_SKIP_EXTENSIONS)
+
+
+class PlaywrightPagePool:
+    """
+    Fixed pool of reusable Playwright pages on one browser (remote CDP via PLAYWRIGHT_WSS, or local
+    Chromium when PLAYWRIGHT_LOCAL_FALLBACK=true). start() returns False when no browser is available.
+    """
+
+    def __init__(self, size: int = CRAWL_PAGE_POOL_SIZE):
+        self.size = size
+        self._playwright_cm = None
+        self._playwright = None
+        self._browser = None
+        self._pages: asyncio.Queue = asyncio.Queue()
+
+    async def _connect_browser(self):
+        wss_url = os.getenv("PLAYWRIGHT_WSS")
+        if wss_url:
+            retries = int(os.getenv("PLAYWRIGHT_WSS_RETRIES", "5"))
+            timeout_ms = int(os.getenv("PLAYWRIGHT_WSS_TIMEOUT_MS", "60000"))
+            for attempt in range(1, retries + 1):
+                try:
+                    browser = await self._playwright.chromium.connect_over_cdp(wss_url, timeout=timeout_ms)
+                    logger.info("Playwright WSS connected")
+                    return browser
+                except Exception as e:
+                    logger.warning("Playwright WSS connect failed attempt %d/%d: %s", attempt, retries, e)
+                    if attempt < retries:
+                        await asyncio.sleep(min(5 * attempt, 20))
+        if os.getenv("PLAYWRIGHT_LOCAL_FALLBACK", "false").lower() == "true":
+            try:
+                browser = await self._playwright.chromium.launch(headless=True)
+                logger.info("Playwright local Chromium launched")
+                return browser
+            except Exception as e:
+                logger.warning("Playwright local launch failed: %s", e)
+        return None
+
+    async def start(self) -> bool:
+        if not os.getenv("PLAYWRIGHT_WSS") and os.getenv("PLAYWRIGHT_LOCAL_FALLBACK", "false").lower() != "true":
+            return False
+        from playwright.async_api import async_playwright
+
+        self._playwright_cm = async_playwright()
+        self._playwright = await self._playwright_cm.start()
+        self._browser = await self._connect_browser()
+        if self._browser is None:
+            await self.close()
+            return False
+        for _ in range(self.size):
+            self._pages.put_nowait(await self._browser.new_page())
+        return True
+
+    async def _replace(self, page) -> Optional[object]:
+        """A fresh page in place of one that failed or was closed; None if the browser cannot open one."""
+        if page is not None and not page.is_closed():
+            try:
+                await page.close()
+            except Exception:
+                pass
         try:
-            result = self.scraper._scrape_url_with_spider(url, limit=1)
-            if (
-                isinstance(result, list)
-                and result
-                and result[0].get("status") == 200
-                and result[0].get("content")
-            ):
-                html = result[0]["content"]
-                return self.extract_links_spider(html, url)
+            return await self._browser.new_page()
         except Exception as e:
-            print(f"[Spider Failed] {url} - {e}")
-        return None
+            logger.warning("Playwright new page failed: %s", e)
+            return None
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Borrow a page. One that raised or was closed (crashed tab) is replaced before it goes back to the pool;
+        if no replacement can be opened the slot goes back empty (None) and the next borrower retries it.
+        """
+        page = await self._pages.get()
+        if page is None:
+            page = await self._replace(None)
+            if page is None:
+                self._pages.put_nowait(None)
+                raise RuntimeError("No Playwright page available")
+        failed = False
+        try:
+            yield page
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed or page.is_closed():
+                page = await self._replace(page)
+            self._pages.put_nowait(page)
 
-    async def _try_playwright_async(self, url: str, browser) -> List[str] | None:
-        """Try to extract links via Playwright."""
+    async def render(self, url: str) -> Optional[str]:
+        """Rendered HTML of url, or None on failure."""
         try:
-            page = await browser.new_page()
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            links = await page.eval_on_selector_all("a[href]", "els => els.map(el => el.href)")
-            await page.close()
-            return links
+            async with self.page() as page:
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                return await page.content()
         except Exception as e:
-            print(f"[Playwright Failed] {url} - {e}")
+            logger.info("Playwright render failed url=%s: %s", url[:120], e)
             return None
 
-    async def hybrid_crawl_async(self, root_url: str, max_depth: int, max_urls: int) -> List[str]:
-        """Crawl using spider + Playwright fallback. Returns list of visited URLs."""
-        visited: Set[str] = set()
-        queue: deque[Tuple[str, int]] = deque([(root_url, 0)])
-        root_netloc = urlparse(root_url).netloc
-        print("Crawling Started for", root_url)
-
-        loop = asyncio.get_running_loop()
-
-        async with async_playwright() as playwright:
-            browser = None
-            wss_url = os.getenv("PLAYWRIGHT_WSS")
-
-            if wss_url:
-                retries = int(os.getenv("PLAYWRIGHT_WSS_RETRIES", "5"))
-                timeout_ms = int(os.getenv("PLAYWRIGHT_WSS_TIMEOUT_MS", "60000"))
-                for attempt in range(1, retries + 1):
-                    try:
-                        browser = await playwright.chromium.connect_over_cdp(
-                            wss_url, timeout=timeout_ms
-                        )
-                        print("[Playwright WSS] Connected successfully.")
-                        break
-                    except Exception as e:
-                        print(f"[Playwright WSS Connect Failed] attempt {attempt}/{retries}: {e}")
-                        if attempt < retries:
-                            backoff_seconds = min(5 * attempt, 20)
-                            await asyncio.sleep(backoff_seconds)
-
-            if browser is None and os.getenv("PLAYWRIGHT_LOCAL_FALLBACK", "false").lower() == "true":
-                try:
-                    browser = await playwright.chromium.launch(headless=True)
-                    print("[Playwright Local Fallback] Launched local Chromium.")
-                except Exception as e:
-                    print(f"[Playwright Local Launch Failed] {e}")
-                    return list(visited)
+    async def close(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright_cm is not None:
+            await self._playwright_cm.__aexit__(None, None, None)
+            self._playwright_cm = None
+            self._playwright = None
+
 
-            while queue and len(visited) < max_urls:
-                current_url, depth = queue.popleft()
-                if current_url in visited or depth > max_depth:
-                    continue
+class Crawler:
+    """Crawls a site (same host as the root URL) with a concurrent frontier. Returns the URLs of fetched pages."""
 
-                links = await loop.run_in_executor(None, self.try_spider, current_url)
-                if links is None and browser is not None:
-                    links = await self._try_playwright_async(current_url, browser)
-                if links is None:
-                    continue
+    def __init__(
+        self,
+        workers: int = CRAWL_WORKERS,
+        per_host_concurrency: int = CRAWL_PER_HOST_CONCURRENCY,
+        page_pool_size: int = CRAWL_PAGE_POOL_SIZE,
+    ):
+        self.workers = max(1, workers)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.page_pool_size = page_pool_size
 
-                visited.add(current_url)
+    def is_same_domain(self, url: str, root_host: str) -> bool:
+        """Check if URL belongs to the same host as root (compared in canonical form, "www." ignored)."""
+        return url_host(url) == root_host
 
-                if depth < max_depth:
-                    for link in links:
-                        normalized = urljoin(current_url, link)
+    async def fetch_html(self, session: aiohttp.ClientSession, url: str) -> Tuple[Optional[str], bool]:
+        """
+        GET url. Returns (HTML body on 200 text/html, else None; whether a browser render is worth trying):
+        render only for blocked responses (CRAWL_RENDER_FALLBACK_STATUSES) and empty HTML bodies (JS-only pages).
+        """
+        try:
+            async with session.get(url, allow_redirects=True) as r:
+                if r.status != 200:
+                    return None, r.status in CRAWL_RENDER_FALLBACK_STATUSES
+                if "html" not in (r.headers.get("Content-Type") or "").lower():
+                    return None, False
+                body = await r.content.read(CRAWL_MAX_HTML_BYTES)
+                html = body.decode(r.charset or "utf-8", errors="replace")
+                if not html.strip():
+                    return None, True
+                return html, False
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError, LookupError) as e:
+            logger.debug("Fetch failed url=%s: %s", url[:120], e)
+            return None, False
+
+    async def hybrid_crawl_async(self, root_url: str, max_depth: int, max_urls: int) -> List[str]:
+        """
+        Crawl using aiohttp + Playwright page-pool fallback. Returns the visited URLs as fetched (absolute, as
+        linked, fragment removed), one per canonical URL; canonicalize_url is only the seen / dedupe key.
+        """
+        root_canonical = canonicalize_url(root_url)
+        if not root_canonical:
+            return []
+        root = root_url.strip()
+        if "://" not in root:
+            root = "https://" + root
+        root = urldefrag(root)[0]
+        root_host = url_host(root_canonical)
+        frontier: asyncio.Queue[Tuple[str, int]] = asyncio.Queue()
+        seen: Set[str] = {root_canonical}
+        visited: List[str] = []
+        host_limits: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.per_host_concurrency))
+        frontier.put_nowait((root, 0))
+        logger.info("Crawl started root=%s max_depth=%d max_urls=%d workers=%d", root, max_depth, max_urls, self.workers)
+
+        pool = PlaywrightPagePool(self.page_pool_size)
+        has_browser = await pool.start()
+
+        async def worker(session: aiohttp.ClientSession) -> None:
+            while True:
+                url, depth = await frontier.get()
+                try:
+                    if len(visited) >= max_urls:
+                        continue
+                    async with host_limits[url_host(url)]:
+                        html, render = await self.fetch_html(session, url)
+                        if html is None and render and has_browser:
+                            html = await pool.render(url)
+                    if html is None or len(visited) >= max_urls:
+                        continue
+                    visited.append(url)
+                    if depth >= max_depth:
+                        continue
+                    for link in extract_links(html, url):
+                        canonical = canonicalize_url(link)
                         if (
-                            self.is_same_domain(normalized, root_netloc)
-                            and normalized not in visited
-                            and len(visited) + len(queue) < max_urls
+                            canonical
+                            and canonical not in seen
+                            and len(seen) < max_urls
+                            and is_crawlable(canonical)
+                            and self.is_same_domain(canonical, root_host)
                         ):
-                            queue.append((normalized, depth + 1))
+                            seen.add(canonical)
+                            frontier.put_nowait((link, depth + 1))
+                except Exception as e:
+                    logger.warning("Crawl worker error url=%s: %s", url[:120], e)
+                finally:
+                    frontier.task_done()
 
-            if browser:
-                await browser.close()
+        timeout = aiohttp.ClientTimeout(total=CRAWL_FETCH_TIMEOUT_SECONDS)
+        connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.per_host_concurrency)
+        try:
+            async with aiohttp.ClientSession(
+                timeout=timeout, connector=connector, headers={"User-Agent": CRAWL_USER_AGENT}
+            ) as session:
+                tasks = [asyncio.create_task(worker(session)) for _ in range(self.workers)]
+                try:
+                    await frontier.join()
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await pool.close()
 
-        return list(visited)
+        logger.info("Crawl finished root=%s visited=%d discovered=%d", root, len(visited), len(seen))
+        return visited
 
 
 async def hybrid_crawl_logic_async(root_url: str, max_depth: int, max_urls: int) -> List[str]:
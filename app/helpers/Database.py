@@ -1,20 +1,76 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 import os
+from urllib.parse import parse_qs, urlsplit
+
 import certifi
 
 from dotenv import load_dotenv
 
+from app.helpers import MongoMetrics
+
 load_dotenv()
 
+
+def _env_int(name: str):
+    value = (os.getenv(name) or "").strip()
+    return int(value) if value else None
+
+
+def client_options_from_env() -> dict:
+    """
+    Pool / wire options for the Motor client (unset env vars keep the driver defaults):
+    MONGO_MAX_POOL_SIZE (driver default 100), MONGO_MIN_POOL_SIZE, MONGO_MAX_IDLE_TIME_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS, MONGO_COMPRESSORS (e.g. "zstd,snappy,zlib"; zstd needs pymongo[zstd], snappy
+    needs pymongo[snappy], zlib is built in; unavailable ones are skipped with a warning) and
+    MONGO_READ_PREFERENCE (primary, primaryPreferred, secondary, secondaryPreferred, nearest).
+    """
+    options = {
+        "maxPoolSize": _env_int("MONGO_MAX_POOL_SIZE"),
+        "minPoolSize": _env_int("MONGO_MIN_POOL_SIZE"),
+        "maxIdleTimeMS": _env_int("MONGO_MAX_IDLE_TIME_MS"),
+        "waitQueueTimeoutMS": _env_int("MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+        "compressors": (os.getenv("MONGO_COMPRESSORS") or "").strip() or None,
+        "readPreference": (os.getenv("MONGO_READ_PREFERENCE") or "").strip() or None,
+    }
+    return {k: v for k, v in options.items() if v is not None}
+
+
+def uri_uses_tls(uri: str) -> bool:
+    """True for mongodb+srv URIs (TLS by default, e.g. Atlas) and URIs with tls=true / ssl=true."""
+    parts = urlsplit(uri or "")
+    if parts.scheme == "mongodb+srv":
+        return True
+    query = {k.lower(): v for k, v in parse_qs(parts.query).items()}
+    return any((query.get(name) or [""])[-1].lower() == "true" for name in ("tls", "ssl"))
+
+
+def create_client(uri: str, **overrides) -> AsyncIOMotorClient:
+    """
+    The one place Motor clients are built: env pool options (client_options_from_env), overrides, and the
+    command / pool listeners behind GET /api/v1/metrics/mongo (app.helpers.MongoMetrics).
+    TLS connections verify against certifi's CA bundle; a plain mongodb:// URI (local mongod) connects without TLS.
+    """
+    options = {**client_options_from_env(), **overrides}
+    if uri_uses_tls(uri):
+        options.setdefault("tlsCAFile", certifi.where())
+    return AsyncIOMotorClient(
+        uri,
+        event_listeners=MongoMetrics.listeners(),
+        **options,
+    )
+
+
 class MongoDB:
     """Async MongoDB client using Motor for better performance"""
     client: AsyncIOMotorClient = None
+    client_options: dict = {}
 
     @classmethod
-    def connect(cls, uri: str):
-        """Connect to MongoDB using Motor async client"""
-        cls.client = AsyncIOMotorClient(uri, tlsCAFile=certifi.where())
+    def connect(cls, uri: str, **overrides):
+        """Connect to MongoDB using Motor async client (see create_client for options)"""
+        cls.client_options = {**client_options_from_env(), **overrides}
+        cls.client = create_client(uri, **overrides)
 
     @classmethod
     def get_database(cls, db_name: str):
@@ -33,4 +89,4 @@ class MongoDB:
     @classmethod
     async def async_connection_status(cls):
         """Alias for connection_status for backward compatibility"""
-        return await cls.connection_status()
\ No newline at end of file
+        return await cls.connection_status()
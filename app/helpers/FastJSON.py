@@ -0,0 +1,50 @@
+"""
+JSON rendering for API responses without the extra walks of the default path.
+Utils.create_response copies the payload to stringify ObjectIds, the ServerResponse model re-validates it and
+FastAPI's jsonable_encoder walks it once more before json.dumps. Here ObjectId, datetime and date are encoded
+by the serializer itself (orjson when installed, else the json module with the same default hook), in one pass.
+
+FastJSONResponse is the app's default response class; list endpoints return Utils.create_fast_response, which
+hands the {data, success} body straight to it and so skips response_model validation as well.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from bson import ObjectId
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt; json keeps the API working without it
+    orjson = None
+    import json
+
+
+def _default(obj: Any) -> Any:
+    """Types the serializer does not know natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to UTF-8 JSON bytes (compact, non-ASCII kept as is)."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps(): ObjectId / datetime / date need no prior conversion."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,186 @@
+"""
+Keyset (cursor) pagination for Mongo list endpoints.
+A page is fetched with a range filter on the sort key + _id instead of skip(), so page N costs the same as page 1.
+The opaque cursor is the url-safe base64 of the last document's sort values (Extended JSON, so ObjectId and
+datetime survive the round trip). Totals come from estimated_document_count() for unfiltered lists and from a
+short-lived in-process count cache otherwise. keyset_page_merged pages over several collections holding disjoint
+documents (e.g. hot + archive) as if they were one.
+"""
+import base64
+import functools
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+
+PAGINATION_COUNT_CACHE_SECONDS = float(os.getenv("PAGINATION_COUNT_CACHE_SECONDS", "60"))
+
+_count_cache: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is not one this API issued (or was issued for a different sort)."""
+
+
+def with_id_tiebreak(sort_by: Optional[dict]) -> List[Tuple[str, int]]:
+    """Sort spec as a list ending with _id, so every document has a unique position."""
+    sort = [(field, direction) for field, direction in (sort_by or {}).items() if field != "_id"]
+    id_direction = (sort_by or {}).get("_id", sort[-1][1] if sort else -1)
+    return sort + [("_id", id_direction)]
+
+
+def encode_cursor(doc: dict, sort: List[Tuple[str, int]]) -> str:
+    values = [doc.get(field) for field, _ in sort]
+    raw = json_util.dumps({"s": [field for field, _ in sort], "v": values})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: List[Tuple[str, int]]) -> List[Any]:
+    """Sort values stored in cursor. Raises InvalidCursorError if malformed or issued for another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        fields, values = payload["s"], payload["v"]
+    except (ValueError, TypeError, KeyError, json.JSONDecodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if fields != [field for field, _ in sort] or len(values) != len(sort):
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    return values
+
+
+def _after(field: str, direction: int, value: Any) -> Optional[dict]:
+    """Condition for `field` strictly after value in sort order. Nulls/missing sort before every other value."""
+    if value is None:
+        return {field: {"$ne": None}} if direction == 1 else None
+    if direction == 1:
+        return {field: {"$gt": value}}
+    # Descending: smaller values of the same type, then null/missing documents
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def keyset_filter(sort: List[Tuple[str, int]], values: List[Any]) -> dict:
+    """Filter matching documents that come after `values` in `sort` order."""
+    branches = []
+    for i, (field, direction) in enumerate(sort):
+        after = _after(field, direction, values[i])
+        if after is None:
+            continue
+        branch = {}
+        for (prev_field, _), prev_value in zip(sort[:i], values[:i]):
+            branch[prev_field] = prev_value
+        branches.append({"$and": [branch, after]} if branch else after)
+    if not branches:
+        return {"_id": {"$in": []}}
+    return branches[0] if len(branches) == 1 else {"$or": branches}
+
+
+async def keyset_page(
+    collection,
+    query: dict,
+    sort_by: Optional[dict] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    projection: Optional[dict] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    One page of `query` in sort_by order (plus _id tiebreak) and the cursor for the next page (None on the last).
+    With a cursor, skip is ignored; skip is kept for offset-style callers and only costs on the first request.
+    Raises ValueError for limit < 1.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    sort = with_id_tiebreak(sort_by)
+    find_query = dict(query)
+    if cursor:
+        after = keyset_filter(sort, decode_cursor(cursor, sort))
+        find_query = {"$and": [query, after]} if query else after
+        skip = 0
+    if projection is not None:
+        projection = {**projection, **{field: 1 for field, _ in sort}}
+    docs_cursor = collection.find(find_query, projection).sort(sort)
+    if skip:
+        docs_cursor = docs_cursor.skip(skip)
+    docs = [doc async for doc in docs_cursor.limit(limit + 1)]
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1], sort)
+    return docs, next_cursor
+
+
+def _compare_values(a: Any, b: Any) -> int:
+    """Mongo-like order for one sort field: null/missing first, then by value."""
+    if a is None or b is None:
+        return (a is not None) - (b is not None)
+    if a == b:
+        return 0
+    try:
+        return -1 if a < b else 1
+    except TypeError:
+        # Mixed BSON types: order by type name so the merge is at least deterministic
+        return -1 if type(a).__name__ < type(b).__name__ else 1
+
+
+async def keyset_page_merged(
+    collections: List[Any],
+    query: dict,
+    sort_by: Optional[dict] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    projection: Optional[dict] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    keyset_page over the union of collections (same query and sort on each, _id unique across them): every
+    collection returns its first skip + limit + 1 documents and the merged order is cut to the page.
+    Cursors are interchangeable with keyset_page cursors for the same sort. Raises ValueError for limit < 1.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    sort = with_id_tiebreak(sort_by)
+    fetch = (0 if cursor else skip) + limit
+    docs: List[dict] = []
+    more = False
+    for collection in collections:
+        page, page_next = await keyset_page(collection, query, sort_by, fetch, cursor=cursor, projection=projection)
+        docs.extend(page)
+        more = more or page_next is not None
+
+    def compare(a: dict, b: dict) -> int:
+        for field, direction in sort:
+            result = _compare_values(a.get(field), b.get(field))
+            if result:
+                return result * direction
+        return 0
+
+    docs.sort(key=functools.cmp_to_key(compare))
+    if not cursor and skip:
+        docs = docs[skip:]
+    next_cursor = None
+    if len(docs) > limit or (more and docs):
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1], sort)
+    return docs, next_cursor
+
+
+async def approximate_count(collection, query: Optional[dict] = None) -> int:
+    """
+    Total for a list endpoint without a count scan per page: collection metadata for unfiltered lists,
+    otherwise count_documents cached for PAGINATION_COUNT_CACHE_SECONDS.
+    """
+    if not query:
+        return await collection.estimated_document_count()
+    key = (collection.database.name, collection.name, json_util.dumps(query, sort_keys=True))
+    now = time.monotonic()
+    hit = _count_cache.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+    total = await collection.count_documents(query)
+    _count_cache[key] = (now + PAGINATION_COUNT_CACHE_SECONDS, total)
+    if len(_count_cache) > 1024:
+        for stale in [k for k, (expires, _) in _count_cache.items() if expires <= now]:
+            _count_cache.pop(stale, None)
+    return total
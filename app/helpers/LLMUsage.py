@@ -0,0 +1,148 @@
+"""
+Token and latency accounting for OpenAI chat completions.
+Every call site goes through tracked_chat_completion(client, stage, **kwargs) instead of
+client.chat.completions.create(**kwargs). Each call records model, stage, prompt/completion tokens,
+cached prompt tokens (OpenAI prompt caching; cacheHit when > 0), latency and the current job ids.
+
+Job ids come from the llm_usage_job(...) context (urlCollectionId, googleQueryId, chatSessionId,
+speakerProfileId). Contexts nest, and asyncio.to_thread copies them into worker threads, so the
+extractor/enricher running in the thread pool is attributed to the UrlCollection/GoogleQuery job.
+Most calls run in worker threads, so records are buffered in memory and written to the llmUsage
+collection by flush_llm_usage() from the event loop (after each job and periodically from main).
+"""
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LLM_USAGE_FLUSH_INTERVAL_SECONDS = 30
+# Drop oldest records beyond this many if Mongo is unreachable, so memory stays bounded.
+LLM_USAGE_MAX_BUFFER = 10000
+
+_current_job: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("llm_usage_job", default=None)
+_buffer: List[Dict[str, Any]] = []
+_buffer_lock = threading.Lock()
+
+
+@contextmanager
+def llm_usage_job(**job_ids: Any):
+    """
+    Attribute LLM calls made inside this block (including in asyncio.to_thread workers) to the given job ids.
+    Yields the job dict; ids known only later (e.g. a chat session created at the end) can be set on it
+    before flush_llm_usage() runs, because records resolve the job dict when they are written.
+    """
+    parent = _current_job.get() or {}
+    job = {**parent, **{k: str(v) for k, v in job_ids.items() if v}}
+    token = _current_job.set(job)
+    try:
+        yield job
+    finally:
+        _current_job.reset(token)
+
+
+def _usage_numbers(response: Any) -> Dict[str, int]:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {"promptTokens": 0, "completionTokens": 0, "cachedTokens": 0}
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details is not None else None
+    return {
+        "promptTokens": int(getattr(usage, "prompt_tokens", 0) or 0),
+        "completionTokens": int(getattr(usage, "completion_tokens", 0) or 0),
+        "cachedTokens": int(cached or 0),
+    }
+
+
+def _record(stage: str, model: str, latency_ms: float, response: Any, error: Optional[str]) -> None:
+    numbers = _usage_numbers(response) if response is not None else {
+        "promptTokens": 0, "completionTokens": 0, "cachedTokens": 0,
+    }
+    now = datetime.utcnow()
+    record = {
+        "stage": stage,
+        "model": getattr(response, "model", None) or model,
+        **numbers,
+        "cacheHit": numbers["cachedTokens"] > 0,
+        "latencyMs": round(latency_ms, 1),
+        "error": error,
+        "day": now.strftime("%Y-%m-%d"),
+        "createdAt": now,
+        "_job": _current_job.get(),
+    }
+    with _buffer_lock:
+        _buffer.append(record)
+        overflow = len(_buffer) - LLM_USAGE_MAX_BUFFER
+        if overflow > 0:
+            del _buffer[:overflow]
+
+
+def tracked_chat_completion(client: Any, stage: str, **kwargs: Any) -> Any:
+    """client.chat.completions.create(**kwargs) plus a usage record for `stage`. Exceptions propagate unchanged."""
+    started = time.perf_counter()
+    try:
+        response = client.chat.completions.create(**kwargs)
+    except Exception as e:
+        _record(stage, kwargs.get("model") or "", (time.perf_counter() - started) * 1000, None, type(e).__name__)
+        raise
+    _record(stage, kwargs.get("model") or "", (time.perf_counter() - started) * 1000, response, None)
+    return response
+
+
+def record_llm_usage(stage: str, model: str, usage: Optional[Dict[str, Any]], latency_ms: float = 0.0) -> None:
+    """Record usage from a raw response body (e.g. an offline batch result line) where no client call was timed."""
+    usage = usage or {}
+    response = SimpleNamespace(
+        model=model,
+        usage=SimpleNamespace(
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            prompt_tokens_details=SimpleNamespace(
+                cached_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
+            ),
+        ),
+    )
+    _record(stage, model, latency_ms, response, None)
+
+
+def _drain() -> List[Dict[str, Any]]:
+    with _buffer_lock:
+        records = list(_buffer)
+        _buffer.clear()
+    docs = []
+    for rec in records:
+        job = rec.pop("_job", None) or {}
+        docs.append({**rec, **job})
+    return docs
+
+
+async def flush_llm_usage() -> int:
+    """Write buffered usage records to the llmUsage collection. Returns number written (0 on failure; records are dropped)."""
+    docs = _drain()
+    if not docs:
+        return 0
+    try:
+        from app.models.LlmUsage import LlmUsageModel
+
+        await LlmUsageModel().insert_many(docs)
+        return len(docs)
+    except Exception as e:
+        logger.warning("LLM usage flush failed (%d record(s) dropped): %s", len(docs), e)
+        return 0
+
+
+async def run_llm_usage_flush_loop(interval_seconds: float = LLM_USAGE_FLUSH_INTERVAL_SECONDS) -> None:
+    """Background task started from main: flush buffered records every interval_seconds until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await flush_llm_usage()
+    except asyncio.CancelledError:
+        await flush_llm_usage()
+        raise
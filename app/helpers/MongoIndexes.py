@@ -0,0 +1,142 @@
+"""
+Index bootstrap and verification for all Mongo collections.
+Each model declares INDEXES (pymongo IndexModel list) and HOT_QUERIES ({name, filter, sort?}) as class attributes.
+ensure_indexes() creates the declared indexes (idempotent: existing identical indexes are a no-op) and is run at
+startup (MONGO_ENSURE_INDEXES, default true) or via scripts/ensure_indexes.py.
+A model may define async after_ensure_indexes(ensured_names), awaited once its indexes were created without
+errors, for data an index depends on (e.g. OpportunityModel backfills dedupeKey for its unique index).
+verify_hot_queries() runs explain() on every hot query and reports winning plans that scan the whole collection
+(COLLSCAN) or sort in memory (SORT).
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Set
+
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+
+def registered_models() -> List[Any]:
+    """One instance per collection that declares INDEXES / HOT_QUERIES."""
+    from app.models.ChangeStreamToken import ChangeStreamTokenModel
+    from app.models.ChatSession import ChatSessionModel
+    from app.models.ChatSessionTurn import ChatSessionTurnModel
+    from app.models.DataMigration import DataMigrationModel
+    from app.models.GoogleQuery import GoogleQueryModel
+    from app.models.LlmUsage import LlmUsageModel
+    from app.models.MatchedOpportunities import MatchedOpportunitiesModel
+    from app.models.Opportunity import OpportunityModel
+    from app.models.OpportunityArchive import OpportunityArchiveModel
+    from app.models.Otp import OTPModel
+    from app.models.ProfileConversation import ProfileConversationModel
+    from app.models.RecentActivity import RecentActivityModel
+    from app.models.Scraper import ScraperModel
+    from app.models.SerpCache import SerpCacheModel
+    from app.models.SpeakerDeliveryModes import SpeakerDeliveryModesModel
+    from app.models.SpeakerProfile import SpeakerProfileModel
+    from app.models.SpeakerSpeakingFormats import SpeakerSpeakingFormatsModel
+    from app.models.SpeakerTargetAudience import SpeakerTargetAudienceModel
+    from app.models.SpeakerTopics import SpeakerTopicsModel
+    from app.models.Subscriptions import SubscriptionsModel
+    from app.models.UrlCollection import UrlCollectionModel
+    from app.models.UrlFreshness import UrlFreshnessModel
+    from app.models.User import UserModel
+
+    return [
+        OpportunityModel(),
+        OpportunityArchiveModel(),
+        SpeakerProfileModel(),
+        ProfileConversationModel(),
+        GoogleQueryModel(),
+        UrlCollectionModel(),
+        UrlFreshnessModel(),
+        SerpCacheModel(),
+        MatchedOpportunitiesModel(),
+        RecentActivityModel(),
+        ChatSessionModel(),
+        ChatSessionTurnModel(),
+        OTPModel(),
+        ScraperModel(),
+        UserModel(),
+        SubscriptionsModel(),
+        LlmUsageModel(),
+        ChangeStreamTokenModel(),
+        DataMigrationModel(),
+        SpeakerTopicsModel(),
+        SpeakerTargetAudienceModel(),
+        SpeakerDeliveryModesModel(),
+        SpeakerSpeakingFormatsModel(),
+    ]
+
+
+async def ensure_indexes(models: Iterable[Any] = None) -> Dict[str, dict]:
+    """
+    Create every declared index. Indexes are created one at a time so a conflict (same name or key pattern
+    with different options, or a unique index over duplicate data) is reported for that index only.
+    Returns {collection: {"ensured": [names], "errors": {name: message}}}.
+    """
+    summary: Dict[str, dict] = {}
+    for model in models if models is not None else registered_models():
+        collection = model.collection
+        result = summary.setdefault(collection.name, {"ensured": [], "errors": {}})
+        for index in getattr(model, "INDEXES", None) or []:
+            name = index.document["name"]
+            try:
+                await collection.create_indexes([index])
+                result["ensured"].append(name)
+            except OperationFailure as e:
+                logger.error("Index %s.%s not created: %s", collection.name, name, e)
+                result["errors"][name] = str(e)
+        hook = getattr(model, "after_ensure_indexes", None)
+        if hook is not None and not result["errors"]:
+            try:
+                await hook(list(result["ensured"]))
+            except Exception as e:
+                logger.exception("after_ensure_indexes failed for %s: %s", collection.name, e)
+                result["errors"]["after_ensure_indexes"] = str(e)
+    total = sum(len(r["ensured"]) for r in summary.values())
+    errors = sum(len(r["errors"]) for r in summary.values())
+    logger.info("Mongo indexes ensured: %d index(es) on %d collection(s), %d error(s)", total, len(summary), errors)
+    return summary
+
+
+def plan_stages(plan: Any) -> Set[str]:
+    """All stage names in an explain() plan tree (classic inputStage(s) and SBE queryPlan layouts)."""
+    stages: Set[str] = set()
+    if isinstance(plan, dict):
+        stage = plan.get("stage")
+        if isinstance(stage, str):
+            stages.add(stage)
+        for value in plan.values():
+            stages |= plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            stages |= plan_stages(item)
+    return stages
+
+
+async def verify_hot_queries(models: Iterable[Any] = None) -> List[dict]:
+    """
+    explain() every declared hot query. One row per query:
+    {collection, query, stages, collscan, inMemorySort}; collscan/inMemorySort mean an index is missing or unused.
+    """
+    report: List[dict] = []
+    for model in models if models is not None else registered_models():
+        collection = model.collection
+        for hot in getattr(model, "HOT_QUERIES", None) or []:
+            cursor = collection.find(hot["filter"])
+            if hot.get("sort"):
+                cursor = cursor.sort(hot["sort"])
+            explained = await cursor.limit(1).explain()
+            stages = plan_stages((explained.get("queryPlanner") or {}).get("winningPlan"))
+            row = {
+                "collection": collection.name,
+                "query": hot["name"],
+                "stages": sorted(stages),
+                "collscan": "COLLSCAN" in stages,
+                "inMemorySort": "SORT" in stages,
+            }
+            if row["collscan"] or row["inMemorySort"]:
+                logger.warning("Hot query %s.%s is not index-backed: %s", row["collection"], row["query"], row["stages"])
+            report.append(row)
+    return report
@@ -0,0 +1,215 @@
+"""
+Driver-level Mongo metrics, fed by pymongo monitoring listeners registered on the client (app.helpers.Database).
+- CommandMetrics (CommandListener): duration histogram per (collection, command), plus failure counts.
+- PoolMetrics (ConnectionPoolListener): connection checkout wait histogram, checkout failures by reason,
+  connections created / closed / currently checked out.
+Listeners run on driver threads, so state is guarded by a lock. snapshot() is served by GET /api/v1/metrics/mongo;
+reset() by the admin-only POST /api/v1/metrics/mongo/reset.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Handshake / heartbeat / auth commands: not application queries
+_IGNORED_COMMANDS = frozenset({"hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue", "endSessions"})
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram (LATENCY_BUCKETS_MS) with count, sum and max."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        i = 0
+        while i < len(LATENCY_BUCKETS_MS) and ms > LATENCY_BUCKETS_MS[i]:
+            i += 1
+        self.buckets[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th observation (max_ms for the +inf bucket)."""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def to_dict(self) -> dict:
+        labels = [f"le_{b:g}" for b in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "totalMs": round(self.total_ms, 3),
+            "avgMs": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "maxMs": round(self.max_ms, 3),
+            "p50Ms": self.percentile(50),
+            "p95Ms": self.percentile(95),
+            "p99Ms": self.percentile(99),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Duration per (collection, command) from started/succeeded/failed command events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[int, object], str] = {}
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._failures: Dict[Tuple[str, str], int] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in _IGNORED_COMMANDS:
+            return
+        # getMore's command value is the cursor id; the collection is in its "collection" field
+        target = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        collection = target if isinstance(target, str) else ""
+        with self._lock:
+            self._inflight[(event.request_id, event.connection_id)] = collection
+
+    def _finish(self, event, failed: bool) -> None:
+        if event.command_name in _IGNORED_COMMANDS:
+            return
+        with self._lock:
+            collection = self._inflight.pop((event.request_id, event.connection_id), "")
+            key = (collection, event.command_name)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(event.duration_micros / 1000)
+            if failed:
+                self._failures[key] = self._failures.get(key, 0) + 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            rows = [
+                {"collection": collection, "command": command, "failures": self._failures.get((collection, command), 0), **h.to_dict()}
+                for (collection, command), h in self._histograms.items()
+            ]
+        return sorted(rows, key=lambda r: r["totalMs"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._failures.clear()
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Checkout wait times and connection counts across all server pools of the client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkout_wait = LatencyHistogram()
+        self._checkout_failures: Dict[str, int] = {}
+        self._created = 0
+        self._closed = 0
+        self._checked_out = 0
+        self._pool_cleared = 0
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        duration = getattr(event, "duration", None)
+        with self._lock:
+            self._checked_out += 1
+            if duration is not None:
+                self._checkout_wait.observe(duration * 1000)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._checkout_failures[str(event.reason)] = self._checkout_failures.get(str(event.reason), 0) + 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._created += 1
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._closed += 1
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pool_cleared += 1
+
+    # Remaining pool events carry nothing we report
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkoutWaitMs": self._checkout_wait.to_dict(),
+                "checkoutFailures": dict(self._checkout_failures),
+                "connectionsCreated": self._created,
+                "connectionsClosed": self._closed,
+                "connectionsOpen": self._created - self._closed,
+                "checkedOut": self._checked_out,
+                "poolCleared": self._pool_cleared,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._checkout_wait = LatencyHistogram()
+            self._checkout_failures.clear()
+            self._pool_cleared = 0
+
+
+command_metrics = CommandMetrics()
+pool_metrics = PoolMetrics()
+_started_at = time.time()
+
+
+def listeners() -> list:
+    """Listeners to pass as event_listeners when creating a client."""
+    return [command_metrics, pool_metrics]
+
+
+def snapshot(client_options: Optional[dict] = None) -> dict:
+    return {
+        "since": _started_at,
+        "clientOptions": client_options or {},
+        "commands": command_metrics.snapshot(),
+        "pool": pool_metrics.snapshot(),
+    }
+
+
+def reset() -> None:
+    """Clear histograms and failure counters (connection counts are kept)."""
+    global _started_at
+    command_metrics.reset()
+    pool_metrics.reset()
+    _started_at = time.time()
@@ -3,23 +3,39 @@ Clause-based qualification for extracted opportunities (e.g. application submiss
 
 Extend DEFAULT_QUALIFICATION_CLAUSES with more callables as new rules are needed.
 Each clause returns None if the opportunity passes that check, or a human-readable failure reason if not.
+Clauses may be sync or async (coroutine functions). A clause that needs landing pages declares them with a
+`landing_links(opp) -> list[str]` attribute; qualify_opportunities_batch_async collects the distinct links
+of all opportunities, scrapes each once with bounded concurrency and shares the content through the context,
+so ten events on one CFP page cost one scrape. Clauses read pages with `await ctx.get_page_content(link)`;
+an undeclared link is scraped there, in a thread, so the event loop never blocks on RapidAPI.
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
+import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
 from urllib.parse import urlparse
 
 from app.helpers.RapidAPIScraper import RapidAPIScraper
 from app.helpers.SpeakingOpportunityExtractor import _parse_date_to_iso
+from app.helpers.UrlCanonical import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
-QualificationClause = Callable[[Dict[str, Any], "OpportunityQualificationContext"], Optional[str]]
-"""Returns None if this clause passes; otherwise a short reason for unqualification."""
+QualificationClause = Callable[
+    [Dict[str, Any], "OpportunityQualificationContext"],
+    Union[Optional[str], Awaitable[Optional[str]]],
+]
+"""Returns (or resolves to) None if this clause passes; otherwise a short reason for unqualification."""
+
+# Max landing pages scraped at once while qualifying one batch. A scraper with a delay_seconds pacing
+# (RAPIDAPI_DELAY_SECONDS) always fetches one page at a time, so its delay keeps spacing the requests.
+QUALIFICATION_FETCH_CONCURRENCY = int(os.getenv("QUALIFICATION_FETCH_CONCURRENCY", "1"))
 
 _EMAIL_RE = re.compile(
     r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
@@ -49,15 +65,13 @@ def _is_pdf_url(url: str) -> bool:
     return path.lower().endswith(".pdf")
 
 
-def _normalize_url_key(u: str) -> tuple[str, str]:
-    p = urlparse((u or "").strip())
-    netloc = (p.netloc or "").lower()
-    path = (p.path or "").rstrip("/").lower()
-    return netloc, path
+def _page_key(u: str) -> str:
+    """Cache key for a landing page: canonicalize_url keeps significant query params (event?id=1 vs ?id=2)."""
+    return canonicalize_url(u) or (u or "").strip()
 
 
 def _urls_same_page(a: str, b: str) -> bool:
-    return _normalize_url_key(a) == _normalize_url_key(b)
+    return _page_key(a) == _page_key(b)
 
 
 def landing_content_signals_application_path(text: str) -> bool:
@@ -99,13 +113,23 @@ def _application_deadline_iso(opp: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def clause_application_submission(
+def _application_landing_links(opp: Dict[str, Any]) -> List[str]:
+    """Landing page clause_application_submission will read: only when no closed flag / deadline is known."""
+    if _meta_bool_true(_get_meta(opp), "application_submission_closed") or _application_deadline_iso(opp):
+        return []
+    link = (opp.get("link") or opp.get("url") or "").strip()
+    if not link or _is_pdf_url(link):
+        return []
+    return [link]
+
+
+async def clause_application_submission(
     opp: Dict[str, Any],
     ctx: "OpportunityQualificationContext",
 ) -> Optional[str]:
     """
     Fail if applications are explicitly closed or deadline is in the past.
-    If deadline is unknown, scrape the opportunity link (or reuse source page content) and look for
+    If deadline is unknown, read the opportunity link (prefetched, or the source page content) and look for
     contact/application signals; fail if none found.
     """
     meta = _get_meta(opp)
@@ -133,21 +157,9 @@ def clause_application_submission(
     if _is_pdf_url(link):
         return "Event link points to a PDF; cannot verify speaker application information."
 
-    content: Optional[str] = None
-    if ctx.source_page_url and ctx.source_page_content and _urls_same_page(link, ctx.source_page_url):
-        content = ctx.source_page_content
-    else:
-        try:
-            result = ctx.scraper.scrape(link)
-        except Exception as e:
-            logger.warning("Qualification scrape failed for %s: %s", link[:80], e)
-            return "Could not load the event/speaker page to verify application information."
-
-        if not result.get("success"):
-            return "Could not load the event/speaker page to verify application information."
-
-        content = (result.get("data") or {}).get("content") or ""
-        content = str(content).strip() or None
+    loaded, content = await ctx.get_page_content(link)
+    if not loaded:
+        return "Could not load the event/speaker page to verify application information."
 
     if content and landing_content_signals_application_path(content):
         return None
@@ -158,6 +170,8 @@ def clause_application_submission(
     )
 
 
+clause_application_submission.landing_links = _application_landing_links
+
 DEFAULT_QUALIFICATION_CLAUSES: Sequence[QualificationClause] = (clause_application_submission,)
 
 
@@ -166,38 +180,117 @@ class OpportunityQualificationContext:
     scraper: RapidAPIScraper
     source_page_url: str = ""
     source_page_content: str = ""
+    # _page_key(link) -> (loaded, content); filled by prefetch_landing_pages and get_page_content
+    page_contents: Dict[str, tuple] = field(default_factory=dict)
+
+    def _scrape(self, link: str) -> tuple[bool, Optional[str]]:
+        try:
+            result = self.scraper.scrape(link)
+        except Exception as e:
+            logger.warning("Qualification scrape failed for %s: %s", link[:80], e)
+            return False, None
+        if not result.get("success"):
+            return False, None
+        content = (result.get("data") or {}).get("content") or ""
+        return True, str(content).strip() or None
+
+    def cached_page_content(self, link: str) -> Optional[tuple[bool, Optional[str]]]:
+        """(loaded, content) if link is the source page or was already fetched, else None."""
+        if self.source_page_url and self.source_page_content and _urls_same_page(link, self.source_page_url):
+            return True, self.source_page_content
+        return self.page_contents.get(_page_key(link))
+
+    async def get_page_content(self, link: str) -> tuple[bool, Optional[str]]:
+        """
+        (loaded, content) for a landing page. Served from the source page or the prefetched pages;
+        links a clause did not declare in landing_links are scraped here (in a thread) and cached.
+        """
+        cached = self.cached_page_content(link)
+        if cached is not None:
+            return cached
+        fetched = await asyncio.to_thread(self._scrape, link)
+        self.page_contents[_page_key(link)] = fetched
+        return fetched
+
+    async def prefetch_landing_pages(
+        self, links: Sequence[str], concurrency: int = QUALIFICATION_FETCH_CONCURRENCY
+    ) -> int:
+        """
+        Scrape each distinct, not yet cached link once (at most `concurrency` at a time, one at a time for a
+        paced scraper). Returns pages scraped.
+        """
+        unique: Dict[str, str] = {}
+        for link in links:
+            if self.cached_page_content(link) is None:
+                unique.setdefault(_page_key(link), link)
+        if not unique:
+            return 0
+        if getattr(self.scraper, "delay_seconds", 0):
+            concurrency = 1
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(key: str, link: str) -> None:
+            async with semaphore:
+                self.page_contents[key] = await asyncio.to_thread(self._scrape, link)
+
+        await asyncio.gather(*(fetch(key, link) for key, link in unique.items()))
+        return len(unique)
+
+
+def landing_links_needed(
+    opportunities: Sequence[Dict[str, Any]],
+    clauses: Sequence[QualificationClause] = DEFAULT_QUALIFICATION_CLAUSES,
+) -> List[str]:
+    """Links declared by the clauses' landing_links for all opportunities (may contain duplicates)."""
+    links: List[str] = []
+    for clause in clauses:
+        declare = getattr(clause, "landing_links", None)
+        if declare is None:
+            continue
+        for opp in opportunities:
+            links.extend(declare(opp))
+    return links
 
 
-def run_qualification(
+async def run_qualification_async(
     opportunity: Dict[str, Any],
     ctx: OpportunityQualificationContext,
     clauses: Sequence[QualificationClause] = DEFAULT_QUALIFICATION_CLAUSES,
 ) -> tuple[bool, str]:
     """
-    Run clauses in order. First non-None reason fails qualification.
+    Run clauses in order (async clauses are awaited). First non-None reason fails qualification.
     Returns (is_qualified, reason_for_unqualify). reason is empty when qualified.
     """
     for clause in clauses:
         reason = clause(opportunity, ctx)
+        if inspect.isawaitable(reason):
+            reason = await reason
         if reason:
             return False, reason.strip()
     return True, ""
 
 
-def qualify_opportunities_batch(
+async def qualify_opportunities_batch_async(
     opportunities: List[Dict[str, Any]],
     scraper: RapidAPIScraper,
     source_page_url: str,
     source_page_content: str,
     clauses: Sequence[QualificationClause] = DEFAULT_QUALIFICATION_CLAUSES,
+    concurrency: int = QUALIFICATION_FETCH_CONCURRENCY,
 ) -> None:
-    """Mutates each opportunity with isQualified (bool) and reasonForUnqualify (str or None)."""
+    """
+    Mutates each opportunity with isQualified (bool) and reasonForUnqualify (str or None).
+    Landing pages declared by the clauses are scraped once per distinct link before any clause runs.
+    """
     ctx = OpportunityQualificationContext(
         scraper=scraper,
         source_page_url=(source_page_url or "").strip(),
         source_page_content=(source_page_content or "").strip(),
     )
+    scraped = await ctx.prefetch_landing_pages(landing_links_needed(opportunities, clauses), concurrency)
+    if scraped:
+        logger.info("Qualification: %d opportunity(ies), %d landing page(s) scraped", len(opportunities), scraped)
     for opp in opportunities:
-        ok, reason = run_qualification(opp, ctx, clauses=clauses)
+        ok, reason = await run_qualification_async(opp, ctx, clauses=clauses)
         opp["isQualified"] = ok
         opp["reasonForUnqualify"] = None if ok else reason
@@ -1,6 +1,8 @@
 """
 Pinecone vector store for opportunities. Class-based, uses LangChain OpenAI embeddings (text-embedding-3-large).
 Expects PINECONE_API_KEY and PINECONE_INDEX in environment (.env or .enc).
+Optional PINECONE_INDEX_HOST connects to the index data plane directly (skips the describe-index lookup;
+also used to point at a local stand-in).
 Index must exist with dimension 3072 (OpenAI text-embedding-3-large).
 
 All opportunity vectors are stored in and queried from the "opportunities" namespace (not default).
@@ -25,6 +27,10 @@ OPENAI_EMBEDDING_MODEL = "text-embedding-3-large"
 EMBEDDING_DIMENSION = 3072
 # Pinecone namespace for opportunity vectors (all upserts and queries use this namespace)
 PINECONE_OPPORTUNITIES_NAMESPACE = "opportunities"
+# Opportunity fields that feed OpportunityTextBuilder.from_opportunity (a change to any of them needs a re-embed)
+EMBEDDED_OPPORTUNITY_FIELDS = ("topics", "speaking_format", "delivery_mode", "target_audiences", "metadata", "source")
+# Max vectors per Pinecone upsert / delete request
+PINECONE_BATCH_SIZE = 100
 
 
 class OpportunityTextBuilder:
@@ -158,7 +164,8 @@ class PineconeOpportunityStore:
             if not self._api_key or not self._index_name:
                 raise ValueError("PINECONE_API_KEY and PINECONE_INDEX must be set")
             pc = Pinecone(api_key=self._api_key)
-            self._index = pc.Index(self._index_name)
+            index_host = os.getenv("PINECONE_INDEX_HOST")
+            self._index = pc.Index(host=index_host) if index_host else pc.Index(self._index_name)
         return self._index
 
     def is_configured(self) -> bool:
@@ -211,6 +218,68 @@ class PineconeOpportunityStore:
             logger.warning("Pinecone upsert failed for %s: %s", opportunity_id, e)
             return False
 
+    def upsert_opportunities(self, items: List[Tuple[str, dict]], raise_on_error: bool = False) -> int:
+        """
+        Batch form of upsert_opportunity for (opportunity_id, opp) pairs: one embed_documents call and
+        upserts of up to PINECONE_BATCH_SIZE vectors. Returns the number of vectors upserted.
+        Embedding / Pinecone errors are logged and skipped, or re-raised with raise_on_error (callers that
+        must not lose the update, e.g. the change-stream consumer).
+        """
+        if not items or not self.is_configured():
+            return 0
+        texts, ids = [], []
+        for opportunity_id, opp in items:
+            text = OpportunityTextBuilder.from_opportunity(opp)
+            if text:
+                ids.append(str(opportunity_id))
+                texts.append(text[:8000])
+        if not texts:
+            return 0
+        try:
+            vectors = self._get_embeddings().embed_documents(texts)
+        except Exception as e:
+            logger.warning("OpenAI batch embedding failed for %d opportunities: %s", len(texts), e)
+            if raise_on_error:
+                raise
+            return 0
+        upserted = 0
+        index = self._get_index()
+        rows = [
+            {"id": oid, "values": vector, "metadata": {"opportunity_id": oid}}
+            for oid, vector in zip(ids, vectors)
+            if vector
+        ]
+        for i in range(0, len(rows), PINECONE_BATCH_SIZE):
+            chunk = rows[i:i + PINECONE_BATCH_SIZE]
+            try:
+                index.upsert(vectors=chunk, namespace=self._namespace)
+                upserted += len(chunk)
+            except Exception as e:
+                logger.warning("Pinecone batch upsert failed (%d vectors): %s", len(chunk), e)
+                if raise_on_error:
+                    raise
+        return upserted
+
+    def delete_opportunities(self, opportunity_ids: List[str], raise_on_error: bool = False) -> bool:
+        """
+        Delete vectors by opportunity id (missing ids are ignored by Pinecone). Returns False on any failure,
+        or re-raises the first failure with raise_on_error.
+        """
+        if not opportunity_ids or not self.is_configured():
+            return False
+        ids = [str(oid) for oid in opportunity_ids]
+        ok = True
+        index = self._get_index()
+        for i in range(0, len(ids), PINECONE_BATCH_SIZE):
+            try:
+                index.delete(ids=ids[i:i + PINECONE_BATCH_SIZE], namespace=self._namespace)
+            except Exception as e:
+                logger.warning("Pinecone delete failed for %d vector(s): %s", len(ids[i:i + PINECONE_BATCH_SIZE]), e)
+                if raise_on_error:
+                    raise
+                ok = False
+        return ok
+
     def query_similar_opportunity_ids(
         self,
         query_text: str,
@@ -7,13 +7,16 @@ import os
 import time
 import requests
 
+from app.helpers.RetryPolicy import is_retryable_status
+
 logger = logging.getLogger(__name__)
 
 
 class RapidAPIScraper:
     """Scrapes URLs via RapidAPI AI Content Scraper."""
 
-    SCRAPE_URL = "https://ai-content-scraper.p.rapidapi.com/scrape"
+    # Overridable for local stand-ins (benchmarks/ingestion)
+    SCRAPE_URL = os.getenv("RAPIDAPI_SCRAPE_URL", "https://ai-content-scraper.p.rapidapi.com/scrape")
 
     def __init__(self, delay_seconds: float = 0):
         """
@@ -31,13 +34,15 @@ class RapidAPIScraper:
             success: bool
             data: { content: str, name?: str, description?: str, urls?: list } on success
             error: str on failure
+            status_code: HTTP status on failure (None when no response was received)
+            retryable: bool on failure - whether a later attempt may succeed (429/5xx/timeouts)
         """
         logger.info("Starting RapidAPI scrape for url=%s", url[:80] + "..." if len(url) > 80 else url)
         if self.delay_seconds > 0:
             time.sleep(self.delay_seconds)
         if not self.api_key:
             logger.error("RAPIDAPI_KEY not configured")
-            return {"success": False, "error": "RAPIDAPI_KEY not configured"}
+            return {"success": False, "error": "RAPIDAPI_KEY not configured", "status_code": None, "retryable": False}
 
         try:
             response = requests.post(
@@ -56,7 +61,7 @@ class RapidAPIScraper:
             content = data.get("content", "")
             if not content or not isinstance(content, str):
                 logger.warning("No content returned from RapidAPI for url=%s", url[:80])
-                return {"success": False, "error": "No content returned from scraper"}
+                return {"success": False, "error": "No content returned from scraper", "status_code": response.status_code, "retryable": False}
 
             content_len = len(content) if content else 0
             logger.info("RapidAPI scrape success url=%s content_length=%d", url[:80], content_len)
@@ -72,7 +77,8 @@ class RapidAPIScraper:
             }
         except requests.exceptions.RequestException as e:
             logger.exception("RapidAPI request failed for url=%s: %s", url[:80], e)
-            return {"success": False, "error": str(e)}
+            status_code = e.response.status_code if e.response is not None else None
+            return {"success": False, "error": str(e), "status_code": status_code, "retryable": is_retryable_status(status_code)}
         except Exception as e:
             logger.exception("RapidAPI scrape error for url=%s: %s", url[:80], e)
-            return {"success": False, "error": str(e)}
+            return {"success": False, "error": str(e), "status_code": None, "retryable": False}
@@ -0,0 +1,71 @@
+"""
+Retry policy for scrape jobs: retryable vs permanent failure classification and exponential backoff with jitter.
+Retryable: HTTP 408/425/429/5xx, timeouts, connection errors, OpenAI rate-limit/timeout/connection/server errors.
+Permanent: other 4xx (bad URL, blocked, not found), PDFs, pages with no content, missing API keys.
+"""
+import asyncio
+import os
+import random
+from typing import Optional
+
+SCRAPE_RETRY_MAX_ATTEMPTS = int(os.getenv("SCRAPE_RETRY_MAX_ATTEMPTS", "5"))
+SCRAPE_RETRY_BASE_DELAY_SECONDS = float(os.getenv("SCRAPE_RETRY_BASE_DELAY_SECONDS", "60"))
+SCRAPE_RETRY_MAX_DELAY_SECONDS = float(os.getenv("SCRAPE_RETRY_MAX_DELAY_SECONDS", str(6 * 60 * 60)))
+# A "retrying" job whose claim is older than this (worker crashed or redeployed mid-run) is claimed again
+SCRAPE_RETRY_CLAIM_TIMEOUT_SECONDS = float(os.getenv("SCRAPE_RETRY_CLAIM_TIMEOUT_SECONDS", str(60 * 60)))
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# Exception class names (any module) that indicate a transient provider problem
+_RETRYABLE_EXCEPTION_NAMES = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "Timeout",
+    "ReadTimeout",
+    "ConnectTimeout",
+    "ConnectionError",
+    "ClientConnectionError",
+    "ServerDisconnectedError",
+}
+
+
+class ScrapeError(RuntimeError):
+    """Scrape step failed; retryable tells the retry scheduler whether another attempt can succeed."""
+
+    def __init__(self, message: str, retryable: bool, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.status_code = status_code
+
+
+def is_retryable_status(status_code: Optional[int]) -> bool:
+    """True for status codes worth retrying. None (no response: timeout / connection error) is retryable."""
+    return status_code is None or status_code in RETRYABLE_STATUS_CODES
+
+
+def is_retryable_exception(exc: BaseException) -> bool:
+    """Classify an exception raised anywhere in the scrape/extract pipeline."""
+    if isinstance(exc, ScrapeError):
+        return exc.retryable
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status_code = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES
+    return any(cls.__name__ in _RETRYABLE_EXCEPTION_NAMES for cls in type(exc).__mro__)
+
+
+def backoff_delay_seconds(
+    attempt: int,
+    base_seconds: float = SCRAPE_RETRY_BASE_DELAY_SECONDS,
+    max_seconds: float = SCRAPE_RETRY_MAX_DELAY_SECONDS,
+) -> float:
+    """
+    Delay before retry number `attempt` (1-based): exponential base * 2^(attempt-1), capped at max_seconds,
+    with equal jitter (half fixed, half random) so failed jobs do not all retry in the same instant.
+    """
+    ceiling = min(max_seconds, base_seconds * (2 ** max(0, attempt - 1)))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
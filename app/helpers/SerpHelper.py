@@ -1,66 +1,177 @@
-"""SERP Helper - Google search via BrightData API returning URLs only."""
+"""
+SERP Helper - Google search via BrightData API returning URLs only.
+
+Results are cached per normalized query (trimmed, whitespace-collapsed, casefolded) + locale for
+SERP_CACHE_TTL_SECONDS: an in-process LRU in front of the serpCache Mongo collection, so repeated
+cron queries and near-identical bulk GoogleQueries do not refetch the same result page.
+search() is the blocking variant (pooled requests.Session, memory cache only; use from threads);
+search_async() checks memory -> Mongo -> BrightData (pooled aiohttp session) and coalesces
+concurrent identical lookups into one request. The aiohttp session and the in-flight lookups belong to the
+event loop they run on (the API loop, or a cron's asyncio.run loop on a scheduler thread); code that runs
+search_async in a short-lived loop must await close_loop_serp_session() before that loop ends.
+"""
+import asyncio
 import json
+import logging
 import os
-from typing import List
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
+import aiohttp
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
-class SerpHelper:
-    """Helper for Google search queries - returns organic result URLs."""
+# Overridable for local stand-ins (benchmarks/ingestion)
+BRIGHTDATA_REQUEST_URL = os.getenv("BRIGHTDATA_REQUEST_URL", "https://api.brightdata.com/request")
+BRIGHTDATA_SERP_ZONE = "source_hr_serp"
+SERP_CACHE_TTL_SECONDS = int(os.getenv("SERP_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+SERP_MEMORY_CACHE_MAX_ENTRIES = 512
+SERP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("SERP_CONNECT_TIMEOUT_SECONDS", "10"))
+SERP_READ_TIMEOUT_SECONDS = float(os.getenv("SERP_READ_TIMEOUT_SECONDS", "60"))
+SERP_POOL_SIZE = 10
 
-    def __init__(self):
-        self.api_key = os.getenv("BRIGHTDATA_SERP_KEY")
+_WHITESPACE_RE = re.compile(r"\s+")
 
-    def search(self, query: str) -> List[str]:
-        """
-        Search Google via BrightData SERP API and return list of organic result URLs.
+_memory_cache: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+_memory_lock = threading.Lock()
+_sync_session: Optional[requests.Session] = None
+# Per event loop: aiohttp session and {cache key: in-flight lookup task}
+_async_sessions: "Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = {}
+_inflight: "Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = {}
+_loop_state_lock = threading.Lock()
 
-        Args:
-            query: Search query string
 
-        Returns:
-            List of URL strings from organic search results
+def normalize_query(query: str) -> str:
+    """Trim, collapse whitespace and casefold (Google search is case-insensitive)."""
+    return _WHITESPACE_RE.sub(" ", (query or "").strip()).casefold()
 
-        Raises:
-            ValueError: If BRIGHTDATA_SERP_KEY is not set
-            RuntimeError: If BrightData API request fails
-        """
-        if not self.api_key:
-            raise ValueError("Missing BRIGHTDATA_SERP_KEY in environment variables")
 
-        qs = urlencode({"q": query})
-        google_url = f"https://www.google.com/search?{qs}&brd_json=1"
+def serp_cache_key(query: str, locale: Optional[str] = None) -> str:
+    """Cache key: normalized query + locale (e.g. "en-us"; "default" when not set)."""
+    return f"{(locale or 'default').lower()}|{normalize_query(query)}"
+
+
+def _memory_get(key: str) -> Optional[List[str]]:
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, urls = entry
+        if expires_at <= time.time():
+            _memory_cache.pop(key, None)
+            return None
+        _memory_cache.move_to_end(key)
+        return list(urls)
+
+
+def _memory_put(key: str, urls: List[str], ttl_seconds: int) -> None:
+    with _memory_lock:
+        _memory_cache[key] = (time.time() + ttl_seconds, list(urls))
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > SERP_MEMORY_CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+def _get_sync_session() -> requests.Session:
+    global _sync_session
+    if _sync_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=SERP_POOL_SIZE, pool_maxsize=SERP_POOL_SIZE)
+        session.mount("https://", adapter)
+        _sync_session = session
+    return _sync_session
+
 
+def _prune_closed_loops() -> None:
+    # Caller holds _loop_state_lock. Loops that ended without close_loop_serp_session(): drop their state
+    for loop in [loop for loop in _async_sessions if loop.is_closed()]:
+        logger.warning("SERP aiohttp session of a closed event loop was not closed; dropping it")
+        _async_sessions.pop(loop, None)
+    for loop in [loop for loop in _inflight if loop.is_closed()]:
+        _inflight.pop(loop, None)
+
+
+def _get_async_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        session = _async_sessions.get(loop)
+        if session is None or session.closed:
+            _prune_closed_loops()
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(
+                    total=SERP_CONNECT_TIMEOUT_SECONDS + SERP_READ_TIMEOUT_SECONDS,
+                    connect=SERP_CONNECT_TIMEOUT_SECONDS,
+                ),
+                connector=aiohttp.TCPConnector(limit=SERP_POOL_SIZE),
+            )
+            _async_sessions[loop] = session
+    return session
+
+
+def _get_inflight() -> Dict[str, asyncio.Future]:
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        return _inflight.setdefault(loop, {})
+
+
+async def close_loop_serp_session() -> None:
+    """Close the running event loop's pooled aiohttp session (end of a cron's asyncio.run, app shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        session = _async_sessions.pop(loop, None)
+        _inflight.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def close_serp_sessions() -> None:
+    """Close pooled HTTP sessions (app shutdown): this loop's aiohttp session and the shared requests session."""
+    global _sync_session
+    await close_loop_serp_session()
+    if _sync_session is not None:
+        _sync_session.close()
+    _sync_session = None
+
+
+class SerpHelper:
+    """Helper for Google search queries - returns organic result URLs."""
+
+    def __init__(self, ttl_seconds: int = SERP_CACHE_TTL_SECONDS):
+        self.api_key = os.getenv("BRIGHTDATA_SERP_KEY")
+        self.ttl_seconds = ttl_seconds
+
+    def _request_args(self, query: str, locale: Optional[str]) -> Tuple[str, dict, dict]:
+        if not self.api_key:
+            raise ValueError("Missing BRIGHTDATA_SERP_KEY in environment variables")
+        params = {"q": query}
+        if locale:
+            lang, _, country = locale.partition("-")
+            params["hl"] = lang
+            if country:
+                params["gl"] = country
+        google_url = f"https://www.google.com/search?{urlencode(params)}&brd_json=1"
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
-
         payload = {
-            "zone": "source_hr_serp",
+            "zone": BRIGHTDATA_SERP_ZONE,
             "url": google_url,
             "format": "json",
         }
+        return google_url, headers, payload
 
-        r = requests.post(
-            "https://api.brightdata.com/request",
-            headers=headers,
-            json=payload,
-        )
-
-        if r.status_code != 200:
-            raise RuntimeError(
-                f"BrightData SERP API failed: {r.status_code}, {r.text}\n"
-                f"Payload url={google_url}"
-            )
-
-        data = r.json()
-
+    @staticmethod
+    def _parse_organic_urls(data: dict) -> List[str]:
         if "body" in data:
             try:
                 result = json.loads(data["body"])
@@ -78,3 +189,94 @@ class SerpHelper:
                 urls.append(link)
 
         return urls
+
+    def search(self, query: str, locale: Optional[str] = None) -> List[str]:
+        """
+        Search Google via BrightData SERP API and return list of organic result URLs.
+        Blocking; uses the in-memory cache and a pooled session with explicit timeouts.
+
+        Args:
+            query: Search query string (the normalized form is sent and cached)
+            locale: Optional "lang" or "lang-country" (e.g. "en-us") mapped to hl/gl
+
+        Returns:
+            List of URL strings from organic search results
+
+        Raises:
+            ValueError: If BRIGHTDATA_SERP_KEY is not set
+            RuntimeError: If BrightData API request fails
+        """
+        key = serp_cache_key(query, locale)
+        cached = _memory_get(key)
+        if cached is not None:
+            return cached
+
+        google_url, headers, payload = self._request_args(normalize_query(query), locale)
+        r = _get_sync_session().post(
+            BRIGHTDATA_REQUEST_URL,
+            headers=headers,
+            json=payload,
+            timeout=(SERP_CONNECT_TIMEOUT_SECONDS, SERP_READ_TIMEOUT_SECONDS),
+        )
+
+        if r.status_code != 200:
+            raise RuntimeError(
+                f"BrightData SERP API failed: {r.status_code}, {r.text}\n"
+                f"Payload url={google_url}"
+            )
+
+        urls = self._parse_organic_urls(r.json())
+        _memory_put(key, urls, self.ttl_seconds)
+        return urls
+
+    async def _fetch_async(self, query: str, locale: Optional[str]) -> List[str]:
+        google_url, headers, payload = self._request_args(normalize_query(query), locale)
+        async with _get_async_session().post(BRIGHTDATA_REQUEST_URL, headers=headers, json=payload) as r:
+            text = await r.text()
+            if r.status != 200:
+                raise RuntimeError(
+                    f"BrightData SERP API failed: {r.status}, {text}\n"
+                    f"Payload url={google_url}"
+                )
+        return self._parse_organic_urls(json.loads(text))
+
+    async def _lookup_or_fetch(self, key: str, query: str, locale: Optional[str]) -> List[str]:
+        from app.models.SerpCache import SerpCacheModel
+
+        cache_model = None
+        try:
+            cache_model = SerpCacheModel()
+            urls = await cache_model.get_fresh(key)
+        except Exception as e:
+            logger.warning("SERP Mongo cache read failed key=%s: %s", key, e)
+            urls = None
+        if urls is not None:
+            _memory_put(key, urls, self.ttl_seconds)
+            return urls
+
+        urls = await self._fetch_async(query, locale)
+        _memory_put(key, urls, self.ttl_seconds)
+        if cache_model is not None:
+            try:
+                await cache_model.put(key, normalize_query(query), locale, urls, self.ttl_seconds)
+            except Exception as e:
+                logger.warning("SERP Mongo cache write failed key=%s: %s", key, e)
+        return urls
+
+    async def search_async(self, query: str, locale: Optional[str] = None) -> List[str]:
+        """
+        Async variant of search(): memory cache -> serpCache collection -> BrightData.
+        Concurrent calls for the same key on the same event loop share one in-flight request.
+        """
+        key = serp_cache_key(query, locale)
+        cached = _memory_get(key)
+        if cached is not None:
+            return cached
+
+        inflight = _get_inflight()
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup_or_fetch(key, query, locale))
+            inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: inflight.pop(k, None))
+        return list(await asyncio.shield(task))
@@ -0,0 +1,279 @@
+"""
+Sitemap- and feed-driven URL discovery for event sites.
+For a domain: robots.txt (Sitemap: lines + Disallow rules for "*"), sitemap.xml / sitemap indexes
+(plain or .gz), and RSS/Atom feeds (well-known paths + <link rel="alternate"> on the home page).
+XML is stream-parsed with lxml's XMLPullParser while the body is downloaded chunk by chunk
+(gzip inflated incrementally), and each parsed element is cleared, so large sitemaps are never held in memory.
+Only URLs whose path looks like an event / call-for-speakers page and whose lastmod is recent are returned.
+Files are fetched from the domain's own scheme and host, and URLs are returned as the site lists them;
+canonicalize_url (which drops "www." and query params) is only the dedupe key (DiscoveredUrl.canonical_url).
+"""
+import asyncio
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from urllib import robotparser
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import aiohttp
+import lxml.etree
+import lxml.html
+
+from app.helpers.UrlCanonical import canonicalize_url, url_host
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_FETCH_TIMEOUT_SECONDS = 30
+DISCOVERY_CHUNK_BYTES = 64 * 1024
+# Hard cap on downloaded (decompressed) bytes per sitemap/feed file
+DISCOVERY_MAX_FILE_BYTES = 50 * 1024 * 1024
+DISCOVERY_MAX_SITEMAP_DEPTH = 3
+DISCOVERY_MAX_SITEMAP_FILES = 50
+DISCOVERY_DEFAULT_SINCE_DAYS = 365
+DISCOVERY_USER_AGENT = "Mozilla/5.0 (compatible; HDAICrawler/1.0)"
+
+DEFAULT_SITEMAP_PATHS = ("/sitemap.xml", "/sitemap_index.xml")
+DEFAULT_FEED_PATHS = ("/feed", "/rss.xml", "/atom.xml", "/feed.xml", "/events/feed")
+
+# Path segments that mark event / CFP pages
+EVENT_PATH_RE = re.compile(
+    r"(event|conference|summit|cfp|call-for-(speakers|papers|proposals|presenters)|speak|agenda|"
+    r"webinar|meetup|festival|expo|workshop|symposium|forum|keynote|session|tedx)",
+    re.IGNORECASE,
+)
+
+_FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/feed+json")
+
+
+@dataclass
+class DiscoveredUrl:
+    url: str  # as listed by the site (absolute, fragment removed); the URL to fetch
+    canonical_url: str  # dedupe key (UrlCollection.canonicalUrl / urlFreshness _id)
+    lastmod: Optional[datetime]
+    source: str  # "sitemap" | "feed"
+
+
+def _local(tag) -> str:
+    """Tag name without namespace."""
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """W3C datetime (sitemaps/Atom) or RFC 822 date (RSS) -> naive UTC datetime; None if unparsable."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def is_event_url(url: str) -> bool:
+    """True when the URL path matches EVENT_PATH_RE."""
+    path = url.split("://", 1)[-1].partition("/")[2]
+    return bool(EVENT_PATH_RE.search(path))
+
+
+class SiteDiscovery:
+    """Discovers event-page URLs for one domain from robots.txt, sitemaps and feeds."""
+
+    def __init__(self, max_urls: int = 500, since_days: int = DISCOVERY_DEFAULT_SINCE_DAYS):
+        self.max_urls = max_urls
+        self.since = datetime.utcnow() - timedelta(days=since_days) if since_days else None
+
+    async def _stream_body(self, session: aiohttp.ClientSession, url: str) -> AsyncIterator[bytes]:
+        """Yield decompressed body chunks of url (gzip files inflated on the fly). Yields nothing on non-200."""
+        async with session.get(url, allow_redirects=True) as r:
+            if r.status != 200:
+                logger.info("Discovery fetch %s -> %s", url[:120], r.status)
+                return
+            # Content-Encoding: gzip is already undone by aiohttp; .gz files served as data are inflated here
+            gz = (
+                url.lower().endswith(".gz") or "gzip" in (r.headers.get("Content-Type") or "").lower()
+            ) and "gzip" not in (r.headers.get("Content-Encoding") or "").lower()
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if gz else None
+            total = 0
+            async for chunk in r.content.iter_chunked(DISCOVERY_CHUNK_BYTES):
+                if inflater is not None:
+                    chunk = inflater.decompress(chunk)
+                total += len(chunk)
+                if total > DISCOVERY_MAX_FILE_BYTES:
+                    logger.warning("Discovery file too large, truncated: %s", url[:120])
+                    return
+                if chunk:
+                    yield chunk
+            if inflater is not None:
+                tail = inflater.flush()
+                if tail:
+                    yield tail
+
+    async def _parse_xml(self, session: aiohttp.ClientSession, url: str) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """
+        Stream-parse a sitemap, sitemap index, RSS or Atom file.
+        Yields (kind, loc, lastmod) with kind "sitemap" (child sitemap of an index) or "page".
+        """
+        parser = lxml.etree.XMLPullParser(events=("end",), recover=True, resolve_entities=False, no_network=True)
+        async for chunk in self._stream_body(session, url):
+            parser.feed(chunk)
+            for item in self._drain(parser):
+                yield item
+        try:
+            parser.close()
+        except lxml.etree.XMLSyntaxError:
+            pass
+        for item in self._drain(parser):
+            yield item
+
+    @staticmethod
+    def _drain(parser) -> List[Tuple[str, str, Optional[str]]]:
+        items = []
+        for _event, el in parser.read_events():
+            name = _local(el.tag)
+            if name not in ("url", "sitemap", "item", "entry"):
+                continue
+            loc = None
+            lastmod = None
+            for child in el:
+                child_name = _local(child.tag)
+                if child_name in ("loc", "link") and loc is None:
+                    # Atom: <link href="..." rel="alternate"/>; RSS/sitemap: text
+                    href = child.get("href")
+                    if href and child.get("rel", "alternate") != "alternate":
+                        continue
+                    loc = (href or child.text or "").strip() or None
+                elif child_name in ("lastmod", "updated", "pubdate", "published"):
+                    lastmod = lastmod or (child.text or "").strip() or None
+            if loc:
+                items.append(("sitemap" if name == "sitemap" else "page", loc, lastmod))
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+        return items
+
+    async def _read_robots(self, session: aiohttp.ClientSession, base: str) -> Tuple[robotparser.RobotFileParser, List[str]]:
+        robots = robotparser.RobotFileParser()
+        text = ""
+        try:
+            chunks = [chunk async for chunk in self._stream_body(session, urljoin(base, "/robots.txt"))]
+            text = b"".join(chunks).decode("utf-8", errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.info("robots.txt fetch failed base=%s: %s", base, e)
+        robots.parse(text.splitlines())
+        sitemaps = [
+            line.split(":", 1)[1].strip()
+            for line in text.splitlines()
+            if line.lower().startswith("sitemap:") and line.split(":", 1)[1].strip()
+        ]
+        return robots, sitemaps
+
+    async def _home_feeds(self, session: aiohttp.ClientSession, base: str) -> List[str]:
+        """Feed URLs advertised on the home page via <link rel="alternate" type="application/rss+xml|atom+xml">."""
+        try:
+            async with session.get(base, allow_redirects=True) as r:
+                if r.status != 200:
+                    return []
+                html = await r.content.read(2 * 1024 * 1024)
+            doc = lxml.html.document_fromstring(html)
+        except (aiohttp.ClientError, asyncio.TimeoutError, lxml.etree.ParserError, ValueError):
+            return []
+        return [
+            urljoin(base, link.get("href"))
+            for link in doc.xpath("//link[@rel='alternate'][@href]")
+            if (link.get("type") or "").lower() in _FEED_TYPES
+        ]
+
+    def _accept(self, url: str, lastmod: Optional[datetime], host: str, robots: robotparser.RobotFileParser) -> bool:
+        if url_host(url) != host:
+            return False
+        if not is_event_url(url):
+            return False
+        if self.since is not None and lastmod is not None and lastmod < self.since:
+            return False
+        return robots.can_fetch(DISCOVERY_USER_AGENT, url)
+
+    async def discover(self, domain: str) -> List[DiscoveredUrl]:
+        """Event-page URLs (deduped by canonical URL, at most max_urls) for domain, with lastmod when known."""
+        host = url_host(domain)
+        if not host:
+            return []
+        raw = domain.strip()
+        parts = urlsplit(raw if "://" in raw else "https://" + raw)
+        # Keep the domain's own scheme and host (e.g. www.) for fetching: not every site serves the bare host
+        base = f"{parts.scheme.lower()}://{parts.netloc.lower()}/"
+        found: Dict[str, DiscoveredUrl] = {}
+
+        timeout = aiohttp.ClientTimeout(total=DISCOVERY_FETCH_TIMEOUT_SECONDS * 4, sock_read=DISCOVERY_FETCH_TIMEOUT_SECONDS)
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            headers={"User-Agent": DISCOVERY_USER_AGENT},
+            auto_decompress=True,
+        ) as session:
+            robots, robots_sitemaps = await self._read_robots(session, base)
+            sitemap_queue: List[Tuple[str, int]] = [
+                (u, 0) for u in (robots_sitemaps or [urljoin(base, p) for p in DEFAULT_SITEMAP_PATHS])
+            ]
+            seen_files: Set[str] = set()
+
+            while sitemap_queue and len(seen_files) < DISCOVERY_MAX_SITEMAP_FILES and len(found) < self.max_urls:
+                sitemap_url, depth = sitemap_queue.pop(0)
+                if sitemap_url in seen_files:
+                    continue
+                seen_files.add(sitemap_url)
+                try:
+                    async for kind, loc, lastmod_raw in self._parse_xml(session, sitemap_url):
+                        if kind == "sitemap":
+                            if depth + 1 <= DISCOVERY_MAX_SITEMAP_DEPTH:
+                                sitemap_queue.append((urljoin(sitemap_url, loc), depth + 1))
+                            continue
+                        self._add(found, loc, lastmod_raw, "sitemap", host, robots)
+                        if len(found) >= self.max_urls:
+                            break
+                except (aiohttp.ClientError, asyncio.TimeoutError, zlib.error) as e:
+                    logger.info("Sitemap read failed %s: %s", sitemap_url[:120], e)
+
+            feed_urls = list(dict.fromkeys(await self._home_feeds(session, base) + [urljoin(base, p) for p in DEFAULT_FEED_PATHS]))
+            for feed_url in feed_urls:
+                if len(found) >= self.max_urls:
+                    break
+                try:
+                    async for kind, loc, lastmod_raw in self._parse_xml(session, feed_url):
+                        if kind == "page":
+                            self._add(found, urljoin(feed_url, loc), lastmod_raw, "feed", host, robots)
+                            if len(found) >= self.max_urls:
+                                break
+                except (aiohttp.ClientError, asyncio.TimeoutError, zlib.error) as e:
+                    logger.info("Feed read failed %s: %s", feed_url[:120], e)
+
+        logger.info("Discovery for %s: %d event URL(s) from %d sitemap file(s)", host, len(found), len(seen_files))
+        return list(found.values())
+
+    def _add(
+        self,
+        found: Dict[str, DiscoveredUrl],
+        loc: str,
+        lastmod_raw: Optional[str],
+        source: str,
+        host: str,
+        robots: robotparser.RobotFileParser,
+    ) -> None:
+        url = urldefrag(loc.strip())[0]
+        canonical = canonicalize_url(url)
+        if not canonical or canonical in found:
+            return
+        lastmod = parse_lastmod(lastmod_raw)
+        if self._accept(url, lastmod, host, robots):
+            found[canonical] = DiscoveredUrl(url=url, canonical_url=canonical, lastmod=lastmod, source=source)
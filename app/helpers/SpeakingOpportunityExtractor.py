@@ -18,6 +18,8 @@ from app.config.speaker_profile_chatbot import (
     DELIVERY_MODE,
     TARGET_AUDIENCES,
 )
+from app.helpers.LLMUsage import tracked_chat_completion
+from app.helpers.RetryPolicy import ScrapeError
 
 logger = logging.getLogger(__name__)
 
@@ -164,6 +166,8 @@ def _is_future_or_today(iso_date: Optional[str]) -> bool:
 class SpeakingOpportunityExtractor:
     """Extracts speaking opportunities from markdown content via LLM. Topics are constrained to speaker_profile_chatbot.TOPICS."""
 
+    TEMPERATURE = 0.2
+
     SYSTEM_PROMPT = """You are an expert at identifying SPEAKING opportunities for professionals who want to speak at industry events, conferences, podcasts, or expert panels.
                     Only extract opportunities where an external expert has a realistic chance to speak.
 
@@ -385,64 +389,88 @@ class SpeakingOpportunityExtractor:
         chunk_idx: int,
         total_chunks: int,
         model: str,
+        source_url: str = "",
     ) -> List[Dict[str, Any]]:
         """Extract opportunities from a single chunk."""
         if not chunk.strip():
             return []
         logger.debug("LLM extracting from chunk %d/%d (len=%d)", chunk_idx + 1, total_chunks, len(chunk))
-        response = client.chat.completions.create(
+        response = tracked_chat_completion(
+            client,
+            "extractor",
             model=model,
-            messages=[
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": self.USER_PROMPT_TEMPLATE.format(
-                        content=chunk, chunk_idx=chunk_idx + 1, total_chunks=total_chunks
-                    ),
-                },
-            ],
-            temperature=0.2,
+            messages=self.build_chunk_messages(chunk, chunk_idx, total_chunks, source_url),
+            temperature=self.TEMPERATURE,
         )
         text = response.choices[0].message.content
         opps = self._parse_llm_json_response(text) if text else []
         logger.debug("Chunk %d/%d yielded %d opportunities", chunk_idx + 1, total_chunks, len(opps))
         return opps
 
-    def extract(self, markdown_content: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    def build_chunk_messages(
+        self, chunk: str, chunk_idx: int, total_chunks: int, source_url: str = ""
+    ) -> List[Dict[str, str]]:
+        """Chat messages for one chunk. Also used to build offline batch requests (see app/helpers/BatchExtraction.py)."""
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": self.USER_PROMPT_TEMPLATE.format(
+                    content=chunk, url=source_url or "(not provided)", chunk_idx=chunk_idx + 1, total_chunks=total_chunks
+                ),
+            },
+        ]
+
+    def chunk_content(self, markdown_content: str) -> List[str]:
+        """Non-empty overlapping chunks for content, as extract() would send them."""
+        content = (markdown_content or "").strip()
+        if not content:
+            return []
+        return [c for c in self._chunk_with_overlap(content, self.chunk_size, self.chunk_overlap) if c.strip()]
+
+    def merge_chunk_responses(self, texts: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Parse raw LLM chunk responses (e.g. from a batch output file) and merge/deduplicate like extract()."""
+        all_opportunities: List[Dict[str, Any]] = []
+        for text in texts:
+            if text:
+                all_opportunities.extend(self._parse_llm_json_response(text))
+        return self._deduplicate_opportunities(all_opportunities)
+
+    def extract_or_raise(self, markdown_content: str, source_url: str = "") -> List[Dict[str, Any]]:
         """
-        Process content in overlapping chunks, extract opportunities from each,
-        then merge and deduplicate.
-        Returns (opportunities, error). error is set if OPENAI_API_KEY missing or LLM fails.
+        Process content in overlapping chunks (chunk_content), extract opportunities from each,
+        then merge and deduplicate. LLM errors propagate (RetryPolicy classifies rate limits / timeouts as
+        retryable); a missing OPENAI_API_KEY raises a permanent ScrapeError.
         """
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             logger.error("OPENAI_API_KEY not configured; opportunities could not be extracted")
-            return [], "OPENAI_API_KEY not configured; opportunities could not be extracted"
+            raise ScrapeError("OPENAI_API_KEY not configured; opportunities could not be extracted", retryable=False)
+
+        chunks = self.chunk_content(markdown_content)
+        if not chunks:
+            logger.warning("Empty content passed to extract")
+            return []
+
+        client = OpenAI(api_key=api_key)
+        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        logger.info("Starting LLM speaking opportunity extraction chunks=%d model=%s", len(chunks), model)
+        all_opportunities: List[Dict[str, Any]] = []
+        for i, chunk in enumerate(chunks):
+            opps = self._extract_from_chunk(client, chunk, i, len(chunks), model, source_url)
+            all_opportunities.extend(opps)
+
+        merged = self._deduplicate_opportunities(all_opportunities)
+        logger.info("LLM extraction complete: raw=%d after_dedup=%d", len(all_opportunities), len(merged))
+        return merged
 
+    def extract(self, markdown_content: str, source_url: str = "") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        extract_or_raise for callers that store the error instead of retrying.
+        Returns (opportunities, error). error is set if OPENAI_API_KEY missing or LLM fails.
+        """
         try:
-            client = OpenAI(api_key=api_key)
-            content = (markdown_content or "").strip()
-            if not content:
-                logger.warning("Empty content passed to extract")
-                return [], None
-
-            model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            logger.info("Starting LLM speaking opportunity extraction content_len=%d model=%s", len(content), model)
-
-            chunks = self._chunk_with_overlap(content, self.chunk_size, self.chunk_overlap)
-            if not chunks:
-                logger.warning("No chunks produced from content")
-                return [], None
-
-            logger.info("Processing %d chunks for opportunity extraction", len(chunks))
-            all_opportunities: List[Dict[str, Any]] = []
-            for i, chunk in enumerate(chunks):
-                opps = self._extract_from_chunk(client, chunk, i, len(chunks), model)
-                all_opportunities.extend(opps)
-
-            merged = self._deduplicate_opportunities(all_opportunities)
-            logger.info("LLM extraction complete: raw=%d after_dedup=%d", len(all_opportunities), len(merged))
-            return merged, None
+            return self.extract_or_raise(markdown_content, source_url), None
         except Exception as e:
             logger.exception("Speaking opportunity extraction failed: %s", e)
             return [], str(e)
@@ -0,0 +1,54 @@
+"""
+URL canonicalization shared by scrape-job dedupe and crawling.
+Two URLs that serve the same page should map to the same canonical form: scheme/host lowercased,
+default ports and "www." dropped, fragment removed, tracking query params (utm_*, gclid, fbclid, ...)
+removed, remaining params sorted, trailing slash trimmed from non-root paths.
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_TRACKING_PARAMS = {
+    "gclid", "dclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "igshid", "yclid",
+    "_ga", "_gl", "ref", "ref_src", "spm",
+}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered.startswith("utm_") or lowered in _TRACKING_PARAMS
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of url (see module docstring). Returns "" for empty/non-http input."""
+    if not url or not isinstance(url, str):
+        return ""
+    raw = url.strip()
+    if "://" not in raw:
+        raw = "https://" + raw
+    parts = urlsplit(raw)
+    scheme = (parts.scheme or "https").lower()
+    if scheme not in _DEFAULT_PORTS:
+        return ""
+    host = (parts.hostname or "").lower().rstrip(".")
+    if not host:
+        return ""
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port
+    netloc = host if port in (None, _DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    path = parts.path or "/"
+    while "//" in path:
+        path = path.replace("//", "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)]
+    query = urlencode(sorted(params))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_host(url: str) -> str:
+    """Host of the canonical url ("" if not canonicalizable)."""
+    canonical = canonicalize_url(url)
+    return urlsplit(canonical).netloc if canonical else ""
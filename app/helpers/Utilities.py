@@ -1,5 +1,6 @@
 import secrets
 from app.schemas.ServerResponse import ServerResponse
+from app.helpers.FastJSON import FastJSONResponse
 from bson import ObjectId
 from typing import Any, Dict
 from datetime import datetime, timedelta
@@ -107,6 +108,22 @@ class Utils:
             success=success,
     
         )
+
+    @classmethod
+    def create_fast_response(cls, data: Any, success: bool, error: str = '') -> FastJSONResponse:
+        """
+        Same body as create_response, rendered directly by FastJSONResponse: no ObjectId pre-pass and no
+        response_model re-validation. For large list payloads (ObjectId / datetime values may be left in data).
+
+        :param data: Data to include in the response.
+        :param success: Indicates whether the operation was successful.
+        :return: A FastJSONResponse with {data, success}.
+        """
+        if not success:
+            raise ValueError(error or "An error occurred")
+
+        return FastJSONResponse({"data": data, "success": success})
+
     @staticmethod
     def hash_password(password: str) -> str:
         """
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from dotenv import load_dotenv
@@ -7,11 +8,15 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.helpers.Database import MongoDB
+from app.helpers.FastJSON import FastJSONResponse
+from app.helpers.LLMUsage import flush_llm_usage, run_llm_usage_flush_loop
+from app.helpers.MongoIndexes import ensure_indexes
+from app.helpers.SerpHelper import close_serp_sessions
 from app.middleware.Cors import add_cors_middleware
 from app.middleware.GlobalErrorHandling import GlobalErrorHandlingMiddleware
 from app.controllers import Auth, Profile, Common
 from app.middleware.JWTVerification import jwt_validator
-from app.controllers import SpeakerProfileOnboarding, SpeakerOptions, Scraper, UrlScraperRapidAPI, GoogleQueryScraper, Opportunity, Dashboard, Users
+from app.controllers import SpeakerProfileOnboarding, SpeakerOptions, Scraper, UrlScraperRapidAPI, GoogleQueryScraper, Opportunity, Dashboard, Users, LlmUsage, Metrics
 from app.controllers import Subscriptions
 from app.services.Subscriptions import init_stripe_from_env
 from app.dependencies import get_url_scraper_rapidapi_service
@@ -19,6 +24,10 @@ from fastapi.middleware.gzip import GZipMiddleware
 
 load_dotenv()
 
+_llm_usage_flush_task = None
+_scrape_retry_task = None
+_opportunity_archiver_task = None
+
 _tedx_scheduler = BackgroundScheduler(
     job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 300},
 )
@@ -36,7 +45,9 @@ app = FastAPI(
     description="HD AI Backend API's",
     version='1.0.0',
     docs_url="/api-docs",
-    redoc_url="/api-redoc"
+    redoc_url="/api-redoc",
+    # orjson rendering with native ObjectId / datetime encoding (app/helpers/FastJSON.py)
+    default_response_class=FastJSONResponse,
 )
 
 # Middleware
@@ -56,6 +67,8 @@ app.include_router(GoogleQueryScraper.router, dependencies=[Depends(jwt_validato
 app.include_router(Opportunity.router, dependencies=[Depends(jwt_validator)])
 app.include_router(Dashboard.router, dependencies=[Depends(jwt_validator)])
 app.include_router(Users.router, dependencies=[Depends(jwt_validator)])
+app.include_router(LlmUsage.router, dependencies=[Depends(jwt_validator)])
+app.include_router(Metrics.router, dependencies=[Depends(jwt_validator)])
 app.include_router(Subscriptions.public_router)
 app.include_router(Subscriptions.auth_router, dependencies=[Depends(jwt_validator)])
 
@@ -66,7 +79,26 @@ async def startup_event():
     # Connect async MongoDB (Motor)
     MongoDB.connect(connection_string)
     print("MongoDB connected (async with Motor)")
+    # Create declared model indexes (no-op when present); explain() checks: scripts/ensure_indexes.py --verify
+    if os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true":
+        try:
+            await ensure_indexes()
+        except Exception as e:
+            logging.getLogger(__name__).exception("Mongo index bootstrap failed: %s", e)
     init_stripe_from_env()
+    # Periodically write buffered LLM token/latency records (see app/helpers/LLMUsage.py)
+    global _llm_usage_flush_task
+    _llm_usage_flush_task = asyncio.create_task(run_llm_usage_flush_loop())
+    # Re-run scrape jobs whose retry backoff has elapsed (see UrlScraperRapidAPIService.record_job_failure)
+    global _scrape_retry_task
+    if os.getenv("SCRAPE_RETRY_WORKER_ENABLED", "true").lower() == "true":
+        _scrape_retry_task = asyncio.create_task(get_url_scraper_rapidapi_service().run_retry_worker_loop())
+    # Move opportunities whose end_date has passed to OpportunitiesArchive (see app/services/OpportunityArchiver.py)
+    global _opportunity_archiver_task
+    if os.getenv("OPPORTUNITY_ARCHIVER_ENABLED", "true").lower() == "true":
+        from app.services.OpportunityArchiver import OpportunityArchiverService
+
+        _opportunity_archiver_task = asyncio.create_task(OpportunityArchiverService().run_archiver_loop())
 
     # # TedX cron: every 1 min for testing (max_instances=1 skips if already running)
     # service = get_url_scraper_rapidapi_service()
@@ -86,6 +118,14 @@ async def shutdown_event():
     from app.dependencies import cleanup_resources
 
     cleanup_resources()
+    if _llm_usage_flush_task:
+        _llm_usage_flush_task.cancel()
+    if _scrape_retry_task:
+        _scrape_retry_task.cancel()
+    if _opportunity_archiver_task:
+        _opportunity_archiver_task.cancel()
+    await flush_llm_usage()
+    await close_serp_sessions()
     if MongoDB.client:
         MongoDB.client.close()
     print("App shutdown complete - resources cleaned up")
@@ -0,0 +1,33 @@
+"""
+MongoDB model for change-stream resume tokens.
+Collection: changeStreamTokens. One document per consumer: { _id: <consumer name>, token, updatedAt }.
+"""
+import os
+from datetime import datetime
+from typing import Optional
+
+from app.helpers.Database import MongoDB
+
+
+class ChangeStreamTokenModel:
+    """Persisted resume token per change-stream consumer (primary-key reads / writes only)."""
+
+    INDEXES = []
+    HOT_QUERIES = []
+
+    def __init__(self, db_name: Optional[str] = None, collection_name: str = "changeStreamTokens"):
+        self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[collection_name]
+
+    async def get_token(self, consumer: str) -> Optional[dict]:
+        doc = await self.collection.find_one({"_id": consumer})
+        return (doc or {}).get("token")
+
+    async def save_token(self, consumer: str, token: dict) -> None:
+        await self.collection.update_one(
+            {"_id": consumer},
+            {"$set": {"token": token, "updatedAt": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    async def clear_token(self, consumer: str) -> None:
+        await self.collection.delete_one({"_id": consumer})
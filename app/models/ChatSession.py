@@ -1,18 +1,35 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
 from app.helpers.Database import MongoDB
+from app.models.ChatSessionTurn import ChatSessionTurnModel
 from bson import ObjectId
 from datetime import datetime
 import os
 from typing import List, Optional, Dict, Any
 
 
+# Legacy embedded messages folded into a session's first rolling summary (the most recent ones)
+LEGACY_SUMMARY_MESSAGES = 100
+
+
 class ChatSessionModel:
     """
     Chat session for speaker profile chatbot.
-    Stores conversation history per speaker_profile_id.
+    Session document: { speaker_profile_id, turnCount, summary, summarizedThroughSeq, createdAt, updatedAt }.
+    Messages are stored one document per turn in chatSessionTurns (ChatSessionTurnModel); `summary` is a rolling
+    summary of turns 1..summarizedThroughSeq. Sessions created before turns existed keep an embedded `conversation`.
     """
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("speaker_profile_id", ASCENDING), ("createdAt", DESCENDING)], name="speaker_profile_id_1_createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "list_by_speaker_profile", "filter": {"speaker_profile_id": "000000000000000000000000"}, "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(self, db_name: Optional[str] = None, collection_name: str = "chatSessions"):
         self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[collection_name]
+        self.turns = ChatSessionTurnModel(db_name)
 
     async def create_session(
         self,
@@ -20,55 +37,65 @@ class ChatSessionModel:
         messages: List[Dict[str, Any]],
     ) -> dict:
         """
-        Create a new chat session for a speaker profile.
+        Create a new chat session for a speaker profile; messages (if any) become turn 1.
         messages: list of {"role": "user"|"assistant", "content": str}
         """
+        now = datetime.utcnow()
         doc = {
             "speaker_profile_id": speaker_profile_id,
-            "conversation": messages or [],
-            "createdAt": datetime.utcnow(),
-            "updatedAt": datetime.utcnow(),
+            "turnCount": 1 if messages else 0,
+            "summary": "",
+            "summarizedThroughSeq": 0,
+            "createdAt": now,
+            "updatedAt": now,
         }
         result = await self.collection.insert_one(doc)
         doc["_id"] = str(result.inserted_id)
+        if messages:
+            await self.turns.insert_turn(doc["_id"], 1, messages)
+        doc["conversation"] = list(messages or [])
         return doc
 
     async def append_messages(
         self,
         chat_session_id: str,
         messages: List[Dict[str, Any]],
-    ) -> Optional[dict]:
+    ) -> Optional[int]:
         """
-        Append messages to an existing chat session's conversation.
+        Append messages to an existing chat session as its next turn. Returns the turn's seq, or None if the
+        session does not exist. Does not re-read the session.
         """
         if not messages:
-            return await self.get_by_id(chat_session_id)
+            return None
         try:
             oid = ObjectId(chat_session_id)
         except Exception:
             return None
-        await self.collection.update_one(
+        session = await self.collection.find_one_and_update(
             {"_id": oid},
-            {
-                "$push": {"conversation": {"$each": messages}},
-                "$set": {"updatedAt": datetime.utcnow()},
-            },
+            {"$inc": {"turnCount": 1}, "$set": {"updatedAt": datetime.utcnow()}},
+            projection={"turnCount": 1},
+            return_document=ReturnDocument.AFTER,
         )
-        return await self.get_by_id(chat_session_id)
+        if not session:
+            return None
+        seq = session["turnCount"]
+        await self.turns.insert_turn(chat_session_id, seq, messages)
+        return seq
 
     async def update_speaker_profile_id(
         self,
         chat_session_id: str,
         speaker_profile_id: str,
-    ) -> Optional[dict]:
+    ) -> bool:
         """Update speaker_profile_id on an existing chat session (e.g. when profile is created in a follow-up call)."""
         if not speaker_profile_id or not str(speaker_profile_id).strip():
-            return await self.get_by_id(chat_session_id)
+            return False
         try:
             oid = ObjectId(chat_session_id)
         except Exception:
-            return None
-        await self.collection.update_one(
+            return False
+        result = await self.collection.update_one(
             {"_id": oid},
             {
                 "$set": {
@@ -77,10 +104,10 @@ class ChatSessionModel:
                 },
             },
         )
-        return await self.get_by_id(chat_session_id)
+        return result.matched_count > 0
 
     async def get_by_id(self, chat_session_id: str) -> Optional[dict]:
-        """Get chat session by id."""
+        """Get chat session by id, with its full `conversation` (legacy embedded messages, then turns)."""
         try:
             oid = ObjectId(chat_session_id)
         except Exception:
@@ -89,10 +116,72 @@ class ChatSessionModel:
         if not doc:
             return None
         doc["_id"] = str(doc["_id"])
+        turns = await self.turns.get_by_session_ids([doc["_id"]])
+        doc["conversation"] = (doc.get("conversation") or []) + turns[doc["_id"]]
+        return doc
+
+    async def get_for_prompt(self, chat_session_id: str, last_turns: int) -> Optional[dict]:
+        """
+        Chat session without its full conversation: `summary` is the rolling summary of turns
+        1..summarizedThroughSeq and `history` the messages of every later turn (at least the last `last_turns`),
+        so turns that left the window before the next summary refresh are still sent. Before the first summary,
+        history is topped up from a legacy embedded conversation.
+        """
+        try:
+            oid = ObjectId(chat_session_id)
+        except Exception:
+            return None
+        doc = await self.collection.find_one({"_id": oid}, {"conversation": {"$slice": -2 * last_turns}})
+        if not doc:
+            return None
+        doc["_id"] = str(doc["_id"])
+        latest = doc.get("turnCount") or 0
+        summarized = doc.get("summarizedThroughSeq") or 0
+        history = await self.turns.get_range(doc["_id"], max(0, min(summarized, latest - last_turns)), latest)
+        legacy = doc.pop("conversation", None) or []
+        missing = 2 * last_turns - len(history)
+        if legacy and not summarized and missing > 0:
+            history = legacy[-missing:] + history
+        doc["history"] = history
+        doc["summary"] = doc.get("summary") or ""
         return doc
 
+    async def get_turns_for_summary(
+        self, chat_session_id: str, after_seq: int, through_seq: int, legacy_tail: int = LEGACY_SUMMARY_MESSAGES
+    ) -> List[Dict[str, Any]]:
+        """
+        Messages of turns after_seq < seq <= through_seq, oldest first (input for the rolling summary). For the
+        first summary (after_seq 0) the last legacy_tail messages of a legacy embedded conversation come first:
+        they precede turn 1 and would otherwise leave the history window without being summarized.
+        """
+        messages = await self.turns.get_range(chat_session_id, after_seq, through_seq)
+        if after_seq > 0 or legacy_tail <= 0:
+            return messages
+        try:
+            oid = ObjectId(chat_session_id)
+        except Exception:
+            return messages
+        doc = await self.collection.find_one({"_id": oid, "conversation.0": {"$exists": True}}, {"conversation": {"$slice": -legacy_tail}})
+        return ((doc or {}).get("conversation") or []) + messages
+
+    async def update_summary(self, chat_session_id: str, summary: str, through_seq: int) -> bool:
+        """Store a new rolling summary covering turns 1..through_seq (never moves summarizedThroughSeq backwards)."""
+        try:
+            oid = ObjectId(chat_session_id)
+        except Exception:
+            return False
+        result = await self.collection.update_one(
+            {
+                "_id": oid,
+                # Legacy sessions have no summarizedThroughSeq until their first summary
+                "$or": [{"summarizedThroughSeq": {"$lt": through_seq}}, {"summarizedThroughSeq": {"$exists": False}}],
+            },
+            {"$set": {"summary": summary, "summarizedThroughSeq": through_seq}},
+        )
+        return result.modified_count > 0
+
     async def get_by_profile_id(self, speaker_profile_id: str) -> List[dict]:
-        """Get all chat sessions for a speaker profile (newest first)."""
+        """Get all chat sessions for a speaker profile (newest first), each with its full `conversation`."""
         cursor = (
             self.collection.find({"speaker_profile_id": speaker_profile_id})
             .sort("createdAt", -1)
@@ -101,14 +190,18 @@ class ChatSessionModel:
         for s in sessions:
             if "_id" in s:
                 s["_id"] = str(s["_id"])
+        turns = await self.turns.get_by_session_ids([s["_id"] for s in sessions])
+        for s in sessions:
+            s["conversation"] = (s.get("conversation") or []) + turns.get(s["_id"], [])
         return sessions
 
     async def delete_by_speaker_profile_id(self, speaker_profile_id: str) -> int:
         """Remove all chat sessions linked to a speaker profile. Returns deleted count."""
         if not speaker_profile_id or not str(speaker_profile_id).strip():
             return 0
-        result = await self.collection.delete_many(
-            {"speaker_profile_id": str(speaker_profile_id).strip()}
-        )
+        query = {"speaker_profile_id": str(speaker_profile_id).strip()}
+        session_ids = [str(d["_id"]) async for d in self.collection.find(query, {"_id": 1})]
+        await self.turns.delete_by_session_ids(session_ids)
+        result = await self.collection.delete_many(query)
         return int(result.deleted_count)
 
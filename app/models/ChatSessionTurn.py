@@ -0,0 +1,65 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from app.helpers.Database import MongoDB
+from datetime import datetime
+import os
+from typing import List, Optional, Dict, Any
+
+
+class ChatSessionTurnModel:
+    """
+    One document per chatbot turn: { chat_session_id, seq, messages: [{role, content}], createdAt }.
+    seq is 1, 2, 3, ... per session (allocated by ChatSessionModel from the session's turnCount).
+    """
+
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("chat_session_id", ASCENDING), ("seq", DESCENDING)], name="chat_session_id_1_seq_-1", unique=True),
+    ]
+    HOT_QUERIES = [
+        {
+            "name": "turns_after_seq",
+            "filter": {"chat_session_id": "000000000000000000000000", "seq": {"$gt": 5, "$lte": 20}},
+            "sort": [("seq", 1)],
+        },
+    ]
+
+    def __init__(self, db_name: Optional[str] = None, collection_name: str = "chatSessionTurns"):
+        self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[collection_name]
+
+    async def insert_turn(self, chat_session_id: str, seq: int, messages: List[Dict[str, Any]]) -> None:
+        await self.collection.insert_one({
+            "chat_session_id": str(chat_session_id),
+            "seq": seq,
+            "messages": messages,
+            "createdAt": datetime.utcnow(),
+        })
+
+    async def get_range(self, chat_session_id: str, after_seq: int, through_seq: int) -> List[Dict[str, Any]]:
+        """Messages of turns after_seq < seq <= through_seq, oldest first."""
+        cursor = self.collection.find(
+            {"chat_session_id": str(chat_session_id), "seq": {"$gt": after_seq, "$lte": through_seq}},
+            {"messages": 1},
+        ).sort("seq", 1)
+        messages: List[Dict[str, Any]] = []
+        async for doc in cursor:
+            messages.extend(doc.get("messages") or [])
+        return messages
+
+    async def get_by_session_ids(self, chat_session_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """{chat_session_id: all messages oldest first} for the given sessions, in one query."""
+        result: Dict[str, List[Dict[str, Any]]] = {sid: [] for sid in chat_session_ids}
+        if not chat_session_ids:
+            return result
+        cursor = self.collection.find(
+            {"chat_session_id": {"$in": list(chat_session_ids)}},
+            {"chat_session_id": 1, "messages": 1},
+        ).sort([("chat_session_id", 1), ("seq", 1)])
+        async for doc in cursor:
+            result.setdefault(doc["chat_session_id"], []).extend(doc.get("messages") or [])
+        return result
+
+    async def delete_by_session_ids(self, chat_session_ids: List[str]) -> int:
+        if not chat_session_ids:
+            return 0
+        result = await self.collection.delete_many({"chat_session_id": {"$in": list(chat_session_ids)}})
+        return int(result.deleted_count)
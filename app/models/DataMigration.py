@@ -0,0 +1,29 @@
+"""
+MongoDB model for one-time data migrations run at index bootstrap (after_ensure_indexes hooks).
+Collection: dataMigrations. One document per finished migration: { _id: <migration name>, summary, completedAt }.
+"""
+import os
+from datetime import datetime
+from typing import Optional
+
+from app.helpers.Database import MongoDB
+
+
+class DataMigrationModel:
+    """Completion markers, so a finished backfill is not re-scanned on every start (primary-key reads / writes only)."""
+
+    INDEXES = []
+    HOT_QUERIES = []
+
+    def __init__(self, db_name: Optional[str] = None, collection_name: str = "dataMigrations"):
+        self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[collection_name]
+
+    async def is_done(self, name: str) -> bool:
+        return await self.collection.find_one({"_id": name}, {"_id": 1}) is not None
+
+    async def mark_done(self, name: str, summary: Optional[dict] = None) -> None:
+        await self.collection.update_one(
+            {"_id": name},
+            {"$set": {"summary": summary or {}, "completedAt": datetime.utcnow()}},
+            upsert=True,
+        )
@@ -2,14 +2,25 @@ import os
 from datetime import datetime
 
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
 
 from app.helpers.Database import MongoDB
+from app.helpers.KeysetPagination import approximate_count, keyset_page
 
 
 class GoogleQueryModel:
     """Model for GoogleQueries - stores query, status, urls, and processing metadata."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("status", ASCENDING), ("createdAt", ASCENDING)], name="status_1_createdAt_1"),
+        IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING)], name="userId_1_createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "claim_pending_jobs", "filter": {"status": "pending"}, "sort": [("createdAt", 1)]},
+        {"name": "list_by_user", "filter": {"userId": "000000000000000000000000"}, "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="GoogleQueries"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
 
@@ -30,22 +41,21 @@ class GoogleQueryModel:
         )
         return result.modified_count > 0
 
-    async def get_list(
-        self, user_id: str | None = None, skip: int = 0, limit: int = 100, sort_by: dict | None = None
-    ) -> list[dict]:
-        """Get GoogleQueries with pagination. Optionally filter by user_id."""
-        if sort_by is None:
-            sort_by = {"createdAt": -1}
+    async def get_page(
+        self, user_id: str | None = None, limit: int = 100, cursor: str | None = None, skip: int = 0, sort_by: dict | None = None
+    ) -> tuple[list[dict], str | None]:
+        """Keyset page of GoogleQueries (newest first by default) and the next-page cursor."""
         query = {}
         if user_id is not None:
             query["userId"] = user_id
-        cursor = (
-            self.collection.find(query)
-            .sort(list(sort_by.items()))
-            .skip(skip)
-            .limit(limit)
-        )
-        return [doc async for doc in cursor]
+        return await keyset_page(self.collection, query, sort_by or {"createdAt": -1}, limit, cursor=cursor, skip=skip)
+
+    async def approximate_count(self, user_id: str | None = None) -> int:
+        """Like count(), from collection metadata when unfiltered, otherwise briefly cached."""
+        query = {}
+        if user_id is not None:
+            query["userId"] = user_id
+        return await approximate_count(self.collection, query)
 
     async def count(self, user_id: str | None = None) -> int:
         """Total count. Optionally filter by user_id."""
@@ -0,0 +1,92 @@
+"""
+MongoDB model for LLM call accounting.
+Collection: llmUsage. One document per chat completion:
+{ stage, model, promptTokens, completionTokens, cachedTokens, cacheHit, latencyMs, error, day, createdAt,
+  urlCollectionId?, googleQueryId?, chatSessionId?, speakerProfileId? }.
+Written in batches by app.helpers.LLMUsage.flush_llm_usage.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from app.helpers.Database import MongoDB
+
+# Job id fields that usage can be queried by (see app.helpers.LLMUsage.llm_usage_job).
+LLM_USAGE_JOB_FIELDS = ("urlCollectionId", "googleQueryId", "chatSessionId", "speakerProfileId")
+
+_TOTALS_GROUP = {
+    "calls": {"$sum": 1},
+    "errors": {"$sum": {"$cond": [{"$ifNull": ["$error", False]}, 1, 0]}},
+    "cacheHits": {"$sum": {"$cond": ["$cacheHit", 1, 0]}},
+    "promptTokens": {"$sum": "$promptTokens"},
+    "completionTokens": {"$sum": "$completionTokens"},
+    "cachedTokens": {"$sum": "$cachedTokens"},
+    "latencyMs": {"$sum": "$latencyMs"},
+    "maxLatencyMs": {"$max": "$latencyMs"},
+}
+
+
+def _shape_totals(row: dict) -> dict:
+    calls = row.get("calls") or 0
+    row["avgLatencyMs"] = round(row["latencyMs"] / calls, 1) if calls else 0.0
+    row["latencyMs"] = round(row["latencyMs"], 1)
+    return row
+
+
+class LlmUsageModel:
+    """Model for llmUsage collection: per-call token/latency records, aggregated per job and per day."""
+
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("createdAt", DESCENDING)], name="createdAt_-1"),
+    ] + [IndexModel([(field, ASCENDING)], name=f"{field}_1", sparse=True) for field in LLM_USAGE_JOB_FIELDS]
+    HOT_QUERIES = [
+        {"name": "aggregate_daily", "filter": {"createdAt": {"$gte": datetime(2000, 1, 1)}}},
+        {"name": "summarize_job", "filter": {"urlCollectionId": "000000000000000000000000"}},
+    ]
+
+    def __init__(self, db_name: str = None, collection_name: str = "llmUsage"):
+        db_name = db_name or os.getenv("DB_NAME")
+        self.collection = MongoDB.get_database(db_name)[collection_name]
+
+    async def insert_many(self, docs: List[dict]) -> int:
+        if not docs:
+            return 0
+        result = await self.collection.insert_many(docs, ordered=False)
+        return len(result.inserted_ids)
+
+    async def summarize_job(self, job_field: str, job_id: str) -> dict:
+        """Totals per stage/model for one job (job_field in LLM_USAGE_JOB_FIELDS), plus an overall total."""
+        if job_field not in LLM_USAGE_JOB_FIELDS:
+            raise ValueError(f"job_field must be one of {LLM_USAGE_JOB_FIELDS}")
+        pipeline = [
+            {"$match": {job_field: str(job_id)}},
+            {"$group": {"_id": {"stage": "$stage", "model": "$model"}, **_TOTALS_GROUP}},
+            {"$sort": {"promptTokens": -1}},
+        ]
+        stages = []
+        async for row in self.collection.aggregate(pipeline):
+            key = row.pop("_id")
+            stages.append(_shape_totals({"stage": key.get("stage"), "model": key.get("model"), **row}))
+        total = {k: 0 for k in ("calls", "errors", "cacheHits", "promptTokens", "completionTokens", "cachedTokens", "latencyMs")}
+        for s in stages:
+            for k in total:
+                total[k] += s[k]
+        total["latencyMs"] = round(total["latencyMs"], 1)
+        return {"jobField": job_field, "jobId": str(job_id), "total": total, "stages": stages}
+
+    async def aggregate_daily(self, days: int = 7) -> List[dict]:
+        """Per day, per stage/model totals for the last `days` days (UTC), newest day first."""
+        since = datetime.utcnow() - timedelta(days=max(1, int(days)))
+        pipeline = [
+            {"$match": {"createdAt": {"$gte": since}}},
+            {"$group": {"_id": {"day": "$day", "stage": "$stage", "model": "$model"}, **_TOTALS_GROUP}},
+            {"$sort": {"_id.day": -1, "promptTokens": -1}},
+        ]
+        out = []
+        async for row in self.collection.aggregate(pipeline):
+            key = row.pop("_id")
+            out.append(_shape_totals({"day": key.get("day"), "stage": key.get("stage"), "model": key.get("model"), **row}))
+        return out
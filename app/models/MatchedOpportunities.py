@@ -8,12 +8,22 @@ from datetime import datetime
 from typing import List
 
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 from app.helpers.Database import MongoDB
 
 
 class MatchedOpportunitiesModel:
     """Model for matchedOpportunities collection: speaker_id -> list of opportunity ids and status."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("speaker_id", ASCENDING)], name="speaker_id_1"),
+        IndexModel([("opportunities", ASCENDING)], name="opportunities_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_by_speaker_id", "filter": {"speaker_id": "000000000000000000000000"}},
+    ]
+
     def __init__(
         self,
         db_name: str = None,
@@ -90,3 +100,14 @@ class MatchedOpportunitiesModel:
         if doc and "_id" in doc:
             doc["_id"] = str(doc["_id"])
         return doc
+
+    async def remove_opportunity_ids(self, opportunity_ids: List[str]) -> int:
+        """Pull deleted opportunity ids from every speaker's matches. Returns the number of documents changed."""
+        ids = [str(oid) for oid in (opportunity_ids or [])]
+        if not ids:
+            return 0
+        result = await self.collection.update_many(
+            {"opportunities": {"$in": ids}},
+            {"$pull": {"opportunities": {"$in": ids}}, "$set": {"updatedAt": datetime.utcnow()}},
+        )
+        return result.modified_count
@@ -1,9 +1,16 @@
+import logging
 import os
 from typing import List
 
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from app.helpers.Database import MongoDB
+from app.helpers.KeysetPagination import approximate_count, keyset_page
+from app.models.DataMigration import DataMigrationModel
+
+logger = logging.getLogger(__name__)
 
 
 def opportunity_dedupe_key(opp: dict) -> tuple[str, str] | None:
@@ -18,11 +25,92 @@ def opportunity_dedupe_key(opp: dict) -> tuple[str, str] | None:
     return (link, event_name)
 
 
+def opportunity_dedupe_key_string(opp: dict) -> str | None:
+    """opportunity_dedupe_key as the persisted dedupeKey field value ("<link>\\n<event name>")."""
+    k = opportunity_dedupe_key(opp)
+    return "\n".join(k) if k else None
+
+
+# Past opportunities moved out of Opportunities by OpportunityArchiverService (app.models.OpportunityArchive)
+ARCHIVE_COLLECTION_NAME = "OpportunitiesArchive"
+
+# Documents written before dedupeKey existed (not yet visited by backfill_dedupe_keys)
+LEGACY_DEDUPE_FILTER = {"dedupeKey": {"$exists": False}}
+DEDUPE_KEY_MIGRATION = "Opportunities.dedupeKey"
+
+# Collections whose legacy documents were all keyed by backfill_dedupe_keys (in this process, or marked done in
+# dataMigrations by an earlier one)
+_dedupe_backfilled: set[str] = set()
+
+
 class OpportunityModel:
     """Model for Opportunities - each opportunity stored at root level."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("link", ASCENDING)], name="link_1"),
+        IndexModel([("createdAt", DESCENDING)], name="createdAt_-1"),
+        # Race-free dedupe for insert_deduped; partial so documents written before dedupeKey existed are not indexed
+        IndexModel(
+            [("dedupeKey", ASCENDING)],
+            name="dedupeKey_1",
+            unique=True,
+            partialFilterExpression={"dedupeKey": {"$type": "string"}},
+        ),
+        # Search (OpportunityService.search_opportunities): equality filters, then start_date / _id for the keyset sort
+        IndexModel([("start_date", ASCENDING), ("_id", ASCENDING)], name="start_date_1__id_1"),
+        IndexModel(
+            [("isQualified", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)],
+            name="isQualified_1_start_date_1__id_1",
+        ),
+        IndexModel(
+            [("topics", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)],
+            name="topics_1_start_date_1__id_1",
+        ),
+        IndexModel(
+            [("target_audiences", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)],
+            name="target_audiences_1_start_date_1__id_1",
+        ),
+        IndexModel(
+            [("delivery_mode", ASCENDING), ("speaking_format", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)],
+            name="delivery_mode_1_speaking_format_1_start_date_1__id_1",
+        ),
+        IndexModel(
+            [("event_name", TEXT), ("metadata.description", TEXT)],
+            name="event_name_text_description_text",
+            weights={"event_name": 5, "metadata.description": 1},
+        ),
+        # Archiver (OpportunityArchiverService): past end_date, oldest first
+        IndexModel([("end_date", ASCENDING)], name="end_date_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_by_link", "filter": {"link": "https://example.org/a"}},
+        {"name": "get_by_dedupe_key", "filter": {"dedupeKey": "https://example.org/a\nexample event"}},
+        {
+            "name": "legacy_dedupe_keys",
+            "filter": {"link": {"$in": ["https://example.org/a", "https://example.org/b"]}, "dedupeKey": {"$exists": False}},
+        },
+        {
+            "name": "search_upcoming_qualified",
+            "filter": {"isQualified": True, "start_date": {"$gte": "2025-01-01", "$lte": "2025-04-01"}},
+            "sort": [("start_date", 1), ("_id", 1)],
+        },
+        {
+            "name": "search_by_topic",
+            "filter": {"topics": {"$in": ["AI"]}, "start_date": {"$gte": "2025-01-01"}},
+            "sort": [("start_date", 1), ("_id", 1)],
+        },
+        {
+            "name": "search_by_delivery_and_format",
+            "filter": {"delivery_mode": {"$in": ["Virtual"]}, "speaking_format": {"$in": ["Keynote"]}},
+            "sort": [("start_date", 1), ("_id", 1)],
+        },
+        {"name": "expired_batch", "filter": {"end_date": {"$gt": "", "$lt": "2025-01-01"}}, "sort": [("end_date", 1)]},
+    ]
+
     def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="Opportunities"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
+        self.migrations = DataMigrationModel(db_name)
 
     async def insert_many(self, opportunities: list[dict]) -> list[str]:
         """Insert multiple opportunities as root-level documents."""
@@ -31,42 +119,152 @@ class OpportunityModel:
         result = await self.collection.insert_many(opportunities)
         return [str(oid) for oid in result.inserted_ids]
 
-    async def find_existing_dedupe_keys(self, opportunities: list[dict]) -> set[tuple[str, str]]:
-        """Keys (link, event_name_norm) already present in the collection for the given links."""
-        unique_links: set[str] = set()
-        for o in opportunities:
-            link = (o.get("link") or o.get("url") or "").strip()
-            if link:
-                unique_links.add(link)
-        if not unique_links:
+    async def insert_deduped(self, opportunities: list[dict]) -> tuple[list[tuple[dict, str]], int]:
+        """
+        Insert opportunities that are not already stored, in one round trip. Each document gets its dedupeKey
+        (opportunity_dedupe_key_string) and the unique dedupeKey_1 index rejects repeats, whether already in the
+        collection, repeated within the batch or inserted concurrently by another job.
+        Documents without a key (no link or event name) are not inserted, nor are keys already in the archive (a past
+        event scraped again). Until backfill_dedupe_keys has run in this process, legacy documents (no dedupeKey, so
+        not in the index) are also matched by link first.
+        Returns ([(opportunity, inserted id)] in input order, number skipped as duplicates).
+        """
+        docs = []
+        for opp in opportunities:
+            key = opportunity_dedupe_key_string(opp)
+            if key:
+                opp["dedupeKey"] = key
+                docs.append(opp)
+        known: set[str] = set()
+        if docs and self.collection.full_name not in _dedupe_backfilled:
+            known |= await self._legacy_dedupe_keys([doc["link"] for doc in docs if doc.get("link")])
+        if docs:
+            known |= await self._archived_dedupe_keys([doc["dedupeKey"] for doc in docs])
+        kept = [doc for doc in docs if doc["dedupeKey"] not in known]
+        pre_skipped = len(docs) - len(kept)
+        docs = kept
+        if not docs:
+            return [], pre_skipped
+        failed: set[int] = set()
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors") or []
+            if any(err.get("code") != 11000 for err in errors) or e.details.get("writeConcernErrors"):
+                raise
+            failed = {err["index"] for err in errors}
+        # insert_many assigns _id on each document client-side, so ids are known for the ones that were written
+        inserted = [(doc, str(doc["_id"])) for i, doc in enumerate(docs) if i not in failed]
+        return inserted, len(failed) + pre_skipped
+
+    async def _legacy_dedupe_keys(self, links: list[str]) -> set[str]:
+        """dedupeKey strings of legacy documents (no dedupeKey field yet) with one of these links."""
+        if not links:
             return set()
-        existing: set[tuple[str, str]] = set()
         cursor = self.collection.find(
-            {"link": {"$in": list(unique_links)}},
+            {"link": {"$in": list(set(links))}, **LEGACY_DEDUPE_FILTER},
             projection={"link": 1, "event_name": 1, "title": 1},
         )
+        return {key async for doc in cursor if (key := opportunity_dedupe_key_string(doc))}
+
+    async def _archived_dedupe_keys(self, keys: list[str]) -> set[str]:
+        """The given dedupeKeys that an archived opportunity already holds (unique dedupeKey_1 on the archive)."""
+        if not keys or self.collection.name == ARCHIVE_COLLECTION_NAME:
+            return set()
+        archive = self.collection.database[ARCHIVE_COLLECTION_NAME]
+        cursor = archive.find({"dedupeKey": {"$in": list(set(keys))}}, projection={"dedupeKey": 1, "_id": 0})
+        return {doc["dedupeKey"] async for doc in cursor}
+
+    async def backfill_dedupe_keys(self, dry_run: bool = False) -> dict:
+        """
+        Give legacy documents their dedupeKey, after dedupeKey_1 exists. A key already held by another document is
+        an existing duplicate: it gets dedupeKey null (outside the partial unique index, nothing is deleted), as do
+        documents without link / event name, so every legacy document is visited once.
+        Records the migration as done in dataMigrations. Returns {pending, keyed, duplicates, noKey}; with dry_run
+        only pending is counted.
+        """
+        summary = {"pending": await self.collection.count_documents(LEGACY_DEDUPE_FILTER), "keyed": 0, "duplicates": 0, "noKey": 0}
+        if dry_run:
+            return summary
+        cursor = self.collection.find(LEGACY_DEDUPE_FILTER, {"link": 1, "url": 1, "event_name": 1, "title": 1})
         async for doc in cursor:
-            k = opportunity_dedupe_key(doc)
-            if k:
-                existing.add(k)
-        return existing
-
-    async def get_list(self, skip: int = 0, limit: int = 10, sort_by: dict = None) -> list[dict]:
-        """Get opportunities with pagination. Returns list of documents."""
-        if sort_by is None:
-            sort_by = {"_id": -1}
-        cursor = (
-            self.collection.find({})
-            .sort(list(sort_by.items()))
-            .skip(skip)
-            .limit(limit)
-        )
-        return [doc async for doc in cursor]
+            key = opportunity_dedupe_key_string(doc)
+            if not key:
+                await self.collection.update_one({"_id": doc["_id"]}, {"$set": {"dedupeKey": None}})
+                summary["noKey"] += 1
+                continue
+            try:
+                await self.collection.update_one({"_id": doc["_id"]}, {"$set": {"dedupeKey": key}})
+                summary["keyed"] += 1
+            except DuplicateKeyError:
+                await self.collection.update_one({"_id": doc["_id"]}, {"$set": {"dedupeKey": None}})
+                summary["duplicates"] += 1
+        await self.migrations.mark_done(DEDUPE_KEY_MIGRATION, summary)
+        _dedupe_backfilled.add(self.collection.full_name)
+        return summary
+
+    async def after_ensure_indexes(self, ensured: list[str]) -> None:
+        """
+        Index bootstrap hook (app.helpers.MongoIndexes.ensure_indexes): key legacy documents once dedupeKey_1 exists.
+        After the first complete backfill the dataMigrations marker skips the unindexed legacy scan on later starts.
+        """
+        if "dedupeKey_1" not in ensured:
+            return
+        if await self.migrations.is_done(DEDUPE_KEY_MIGRATION):
+            _dedupe_backfilled.add(self.collection.full_name)
+            return
+        summary = await self.backfill_dedupe_keys()
+        if summary["pending"]:
+            logger.info("Backfilled Opportunities.dedupeKey: %s", summary)
+
+    async def get_page(
+        self, limit: int = 10, cursor: str = None, skip: int = 0, sort_by: dict = None
+    ) -> tuple[list[dict], str | None]:
+        """Keyset page of opportunities and the cursor for the next page (None on the last page)."""
+        return await keyset_page(self.collection, {}, sort_by or {"_id": -1}, limit, cursor=cursor, skip=skip)
 
     async def count(self) -> int:
         """Get total count of opportunities."""
         return await self.collection.count_documents({})
 
+    async def search_page(
+        self,
+        query: dict,
+        limit: int = 10,
+        cursor: str = None,
+        skip: int = 0,
+        sort_by: dict = None,
+        projection: dict = None,
+    ) -> tuple[list[dict], str | None]:
+        """Keyset page of opportunities matching query (default order start_date asc, then _id)."""
+        return await keyset_page(
+            self.collection, query, sort_by or {"start_date": 1}, limit, cursor=cursor, skip=skip, projection=projection
+        )
+
+    async def approximate_count(self, query: dict = None) -> int:
+        """
+        Total from collection metadata (no scan) when unfiltered, else a briefly cached count_documents;
+        may lag slightly behind concurrent writes.
+        """
+        return await approximate_count(self.collection, query)
+
+    async def get_expired_batch(self, before: str, limit: int) -> list[dict]:
+        """Up to limit opportunities whose ISO end_date is before `before` (YYYY-MM-DD), oldest end_date first."""
+        cursor = self.collection.find({"end_date": {"$gt": "", "$lt": before}}).sort("end_date", 1).limit(limit)
+        return [doc async for doc in cursor]
+
+    async def count_expired(self, before: str) -> int:
+        return await self.collection.count_documents({"end_date": {"$gt": "", "$lt": before}})
+
+    async def delete_expired_by_ids(self, ids: list, before: str) -> list:
+        """
+        Delete the given ids if their end_date is still before `before` (an edit since they were read keeps them).
+        Returns the ids that were not deleted.
+        """
+        await self.collection.delete_many({"_id": {"$in": ids}, "end_date": {"$gt": "", "$lt": before}})
+        kept = self.collection.find({"_id": {"$in": ids}}, {"_id": 1})
+        return [doc["_id"] async for doc in kept]
+
     async def delete_by_id(self, opportunity_id: str) -> bool:
         """Delete an opportunity by ID. Returns True if deleted."""
         result = await self.collection.delete_one({"_id": ObjectId(opportunity_id)})
@@ -0,0 +1,75 @@
+"""
+MongoDB model for archived (past) opportunities.
+Collection: OpportunitiesArchive. Same documents as Opportunities (same _id) plus archivedAt; written by
+OpportunityArchiverService once end_date has passed, so Opportunities only holds upcoming events.
+"""
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from app.models.Opportunity import ARCHIVE_COLLECTION_NAME, OpportunityModel
+
+logger = logging.getLogger(__name__)
+
+
+class OpportunityArchiveModel(OpportunityModel):
+    """Read methods of OpportunityModel over OpportunitiesArchive (include_archived reads), plus archive writes."""
+
+    # Cold collection: only what list / search / lookup by id need; other search filters scan the archive
+    INDEXES = [
+        IndexModel([("link", ASCENDING)], name="link_1"),
+        IndexModel([("createdAt", DESCENDING)], name="createdAt_-1"),
+        # Unique like Opportunities.dedupeKey_1: OpportunityModel.insert_deduped skips keys found here, so a past
+        # event scraped again is not inserted (and archived) a second time
+        IndexModel(
+            [("dedupeKey", ASCENDING)],
+            name="dedupeKey_1",
+            unique=True,
+            partialFilterExpression={"dedupeKey": {"$type": "string"}},
+        ),
+        IndexModel([("start_date", ASCENDING), ("_id", ASCENDING)], name="start_date_1__id_1"),
+        IndexModel(
+            [("event_name", TEXT), ("metadata.description", TEXT)],
+            name="event_name_text_description_text",
+            weights={"event_name": 5, "metadata.description": 1},
+        ),
+    ]
+    HOT_QUERIES = [
+        {"name": "list_by_start_date", "filter": {}, "sort": [("start_date", 1), ("_id", 1)]},
+        {"name": "get_by_dedupe_key", "filter": {"dedupeKey": {"$in": ["https://example.org/a\nexample event"]}}},
+    ]
+
+    def __init__(self, db_name: Optional[str] = None, collection_name: str = ARCHIVE_COLLECTION_NAME):
+        super().__init__(db_name or os.getenv("DB_NAME"), collection_name)
+
+    async def after_ensure_indexes(self, ensured: list[str]) -> None:
+        """No dedupeKey backfill here: archived documents keep the key they had in Opportunities."""
+
+    async def upsert_many(self, docs: list[dict]) -> None:
+        """
+        Write docs under their own _id (replace if already archived), so a repeated batch is a no-op.
+        A doc whose dedupeKey another archived document already holds is a duplicate of it and is not written.
+        """
+        if not docs:
+            return
+        now = datetime.utcnow()
+        try:
+            await self.collection.bulk_write(
+                [ReplaceOne({"_id": doc["_id"]}, {**doc, "archivedAt": now}, upsert=True) for doc in docs],
+                ordered=False,
+            )
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors") or []
+            if any(err.get("code") != 11000 for err in errors) or e.details.get("writeConcernErrors"):
+                raise
+            logger.info("Archive: %d opportunity(ies) already archived under their dedupeKey", len(errors))
+
+    async def delete_by_ids(self, ids: list) -> int:
+        if not ids:
+            return 0
+        result = await self.collection.delete_many({"_id": {"$in": ids}})
+        return result.deleted_count
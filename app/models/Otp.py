@@ -1,8 +1,17 @@
 import os
 from datetime import datetime
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from app.helpers.Database import MongoDB
 
 class OTPModel:
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("email", ASCENDING), ("createdAt", DESCENDING)], name="email_1_createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_otp", "filter": {"email": "user@example.org"}, "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(self, db_name=os.getenv('DB_NAME'), collection_name="otpData"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
 
@@ -18,7 +27,7 @@ class OTPModel:
 
     async def get_otp(self, email: str):
         """Retrieve OTP for a given email"""
-        return await self.collection.find_one({"email": email}, sort=[("created_at", -1)])
+        return await self.collection.find_one({"email": email}, sort=[("createdAt", -1)])
 
     async def delete_otp(self, email: str):
         """Delete OTP record after successful verification"""
@@ -0,0 +1,148 @@
+"""
+MongoDB model for the speaker-profile onboarding transcript (verify-step agent/user turns).
+Collection: profileConversations. Bucket pattern: one document per PROFILE_CONVERSATION_BUCKET_SIZE messages,
+{ speaker_profile_id, seq, count, messages: [{role, content}], createdAt, updatedAt }, seq 0, 1, 2, ... per profile.
+Appends touch only the newest bucket, so speaker_profiles documents no longer grow with the transcript.
+"""
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import DuplicateKeyError
+
+from app.helpers.Database import MongoDB
+
+PROFILE_CONVERSATION_BUCKET_SIZE = int(os.getenv("PROFILE_CONVERSATION_BUCKET_SIZE", "50"))
+
+
+class ProfileConversationModel:
+    """Model for profileConversations: fixed-size message buckets per speaker profile."""
+
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("speaker_profile_id", ASCENDING), ("seq", DESCENDING)], name="speaker_profile_id_1_seq_-1", unique=True),
+    ]
+    HOT_QUERIES = [
+        {"name": "latest_bucket", "filter": {"speaker_profile_id": "000000000000000000000000"}, "sort": [("seq", -1)]},
+    ]
+
+    def __init__(self, db_name: Optional[str] = None, collection_name: str = "profileConversations"):
+        self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[collection_name]
+
+    async def append(self, speaker_profile_id: str, messages: List[Dict[str, Any]]) -> None:
+        """
+        Append messages to the profile's transcript. Fills the newest bucket while it has room, otherwise opens
+        bucket seq + 1 (the unique speaker_profile_id+seq index resolves concurrent openers; the loser retries).
+        """
+        if not messages:
+            return
+        pid = str(speaker_profile_id)
+        n = len(messages)
+        while True:
+            now = datetime.utcnow()
+            latest = await self.collection.find_one(
+                {"speaker_profile_id": pid}, {"seq": 1, "count": 1}, sort=[("seq", -1)]
+            )
+            if latest is not None and n <= PROFILE_CONVERSATION_BUCKET_SIZE:
+                result = await self.collection.update_one(
+                    {"_id": latest["_id"], "count": {"$lte": PROFILE_CONVERSATION_BUCKET_SIZE - n}},
+                    {"$push": {"messages": {"$each": messages}}, "$inc": {"count": n}, "$set": {"updatedAt": now}},
+                )
+                if result.matched_count:
+                    return
+            try:
+                await self.collection.insert_one({
+                    "speaker_profile_id": pid,
+                    "seq": latest["seq"] + 1 if latest is not None else 0,
+                    "count": n,
+                    "messages": list(messages),
+                    "createdAt": now,
+                    "updatedAt": now,
+                })
+                return
+            except DuplicateKeyError:
+                continue
+
+    async def append_turn(self, speaker_profile_id: str, agent_content: Any, user_content: Any) -> None:
+        """Append one agent message (question) and one user message (answer)."""
+        await self.append(
+            speaker_profile_id,
+            [{"role": "agent", "content": agent_content}, {"role": "user", "content": user_content}],
+        )
+
+    async def get_page(
+        self, speaker_profile_id: str, after_seq: Optional[int] = None, buckets: int = 4
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Messages (oldest first) from up to `buckets` buckets after bucket after_seq (None = from the first bucket),
+        and the after_seq for the next page (None when there are no more buckets).
+        """
+        query: Dict[str, Any] = {"speaker_profile_id": str(speaker_profile_id)}
+        if after_seq is not None:
+            query["seq"] = {"$gt": after_seq}
+        cursor = (
+            self.collection.find(query, {"seq": 1, "messages": 1})
+            .sort("seq", 1)
+            .limit(buckets + 1)
+        )
+        docs = await cursor.to_list(length=buckets + 1)
+        next_seq = docs[buckets - 1]["seq"] if len(docs) > buckets else None
+        messages: List[Dict[str, Any]] = []
+        for doc in docs[:buckets]:
+            messages.extend(doc.get("messages") or [])
+        return messages, next_seq
+
+    async def get_all(self, speaker_profile_id: str) -> List[Dict[str, Any]]:
+        """Whole transcript, oldest first."""
+        cursor = self.collection.find({"speaker_profile_id": str(speaker_profile_id)}, {"messages": 1}).sort("seq", 1)
+        messages: List[Dict[str, Any]] = []
+        async for doc in cursor:
+            messages.extend(doc.get("messages") or [])
+        return messages
+
+    async def get_first_seq(self, speaker_profile_id: str) -> Optional[int]:
+        """seq of the oldest bucket, or None if the profile has no buckets."""
+        doc = await self.collection.find_one(
+            {"speaker_profile_id": str(speaker_profile_id)}, {"seq": 1}, sort=[("seq", 1)]
+        )
+        return doc["seq"] if doc else None
+
+    async def has_legacy_buckets(self, speaker_profile_id: str) -> bool:
+        """True if the embedded conversation array was already copied into buckets (see insert_legacy)."""
+        doc = await self.collection.find_one({"speaker_profile_id": str(speaker_profile_id), "legacy": True}, {"_id": 1})
+        return doc is not None
+
+    async def insert_legacy(self, speaker_profile_id: str, messages: List[Dict[str, Any]]) -> int:
+        """
+        Migration: write a legacy embedded transcript as buckets ordered before any existing bucket (turns appended
+        after the deploy keep their place at the end; seqs may go negative). Buckets are flagged legacy: true.
+        Returns the number of buckets written.
+        """
+        pid = str(speaker_profile_id)
+        chunks = [
+            messages[i:i + PROFILE_CONVERSATION_BUCKET_SIZE]
+            for i in range(0, len(messages), PROFILE_CONVERSATION_BUCKET_SIZE)
+        ]
+        if not chunks:
+            return 0
+        first_seq = await self.get_first_seq(pid)
+        start = 0 if first_seq is None else first_seq - len(chunks)
+        now = datetime.utcnow()
+        await self.collection.insert_many([
+            {
+                "speaker_profile_id": pid,
+                "seq": start + i,
+                "count": len(chunk),
+                "messages": chunk,
+                "legacy": True,
+                "createdAt": now,
+                "updatedAt": now,
+            }
+            for i, chunk in enumerate(chunks)
+        ])
+        return len(chunks)
+
+    async def delete_for_profile(self, speaker_profile_id: str) -> int:
+        result = await self.collection.delete_many({"speaker_profile_id": str(speaker_profile_id)})
+        return result.deleted_count
@@ -3,6 +3,8 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List
 
+from pymongo import DESCENDING, IndexModel
+
 from app.helpers.Database import MongoDB
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,14 @@ def _serialize_activity_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
 class RecentActivityModel:
     """Append-only feed for dashboard / audit: scraper runs, opportunity batches, Google query jobs."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("createdAt", DESCENDING)], name="createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_recent", "filter": {}, "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(self, db_name=os.getenv("DB_NAME"), collection_name: str = "recentActivities"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
 
@@ -40,16 +50,6 @@ class RecentActivityModel:
         except Exception as e:
             logger.warning("Recent activity insert failed type=%s: %s", activity_type, e)
 
-    async def list_created_between(self, start_inclusive: datetime, end_exclusive: datetime) -> List[dict]:
-        """Activities with createdAt in [start_inclusive, end_exclusive), newest first."""
-        cursor = (
-            self.collection.find(
-                {"createdAt": {"$gte": start_inclusive, "$lt": end_exclusive}}
-            ).sort("createdAt", -1)
-        )
-        docs = await cursor.to_list(length=None)
-        return [_serialize_activity_doc(d) for d in docs]
-
     async def list_recent(self, limit: int) -> List[dict]:
         """Newest activities first, capped at limit."""
         cursor = self.collection.find({}).sort("createdAt", -1).limit(limit)
@@ -1,10 +1,20 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from app.helpers.Database import MongoDB
+from app.helpers.KeysetPagination import approximate_count, keyset_page
 from bson import ObjectId
 from app.schemas.Scraper import ScraperSchema
 import os
 
 
 class ScraperModel:
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING)], name="userId_1_createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "list_by_user", "filter": {"userId": "000000000000000000000000"}, "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="Scrapers"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
 
@@ -21,20 +31,20 @@ class ScraperModel:
             return ScraperSchema(**doc)
         return None
 
-    async def get_list(self, user_id: str, skip: int = 0, limit: int = 100, sort_by: dict = None) -> list[ScraperSchema]:
-        if sort_by is None:
-            sort_by = {"createdAt": -1}
-        cursor = (
-            self.collection.find({"userId": user_id})
-            .sort(list(sort_by.items()))
-            .skip(skip)
-            .limit(limit)
+    async def get_page(
+        self, user_id: str, limit: int = 100, cursor: str = None, skip: int = 0, sort_by: dict = None
+    ) -> tuple[list[ScraperSchema], str | None]:
+        docs, next_cursor = await keyset_page(
+            self.collection, {"userId": user_id}, sort_by or {"createdAt": -1}, limit, cursor=cursor, skip=skip
         )
-        return [ScraperSchema(**doc) async for doc in cursor]
+        return [ScraperSchema(**doc) for doc in docs], next_cursor
 
     async def count(self, user_id: str) -> int:
         return await self.collection.count_documents({"userId": user_id})
 
+    async def approximate_count(self, user_id: str) -> int:
+        return await approximate_count(self.collection, {"userId": user_id})
+
     async def update(self, scraper_id: str, user_id: str, update_data: dict) -> bool:
         result = await self.collection.update_one(
             {"_id": ObjectId(scraper_id), "userId": user_id},
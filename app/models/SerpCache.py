@@ -0,0 +1,52 @@
+"""
+MongoDB model for cached SERP results.
+Collection: serpCache. One document per normalized query + locale:
+{ _id: cache key, query, locale, urls, fetchedAt, expiresAt }.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from pymongo import ASCENDING, IndexModel
+
+from app.helpers.Database import MongoDB
+
+
+class SerpCacheModel:
+    """Model for serpCache collection: cache key -> organic result URLs until expiresAt."""
+
+    # Declarative indexes, applied by app.helpers.MongoIndexes. Documents are removed by the TTL monitor once expired.
+    INDEXES = [
+        IndexModel([("expiresAt", ASCENDING)], name="expiresAt_ttl", expireAfterSeconds=0),
+    ]
+    HOT_QUERIES = []
+
+    def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="serpCache"):
+        self.collection = MongoDB.get_database(db_name)[collection_name]
+
+    async def get_fresh(self, key: str) -> Optional[List[str]]:
+        """Cached URLs for key if not expired, else None."""
+        doc = await self.collection.find_one(
+            {"_id": key, "expiresAt": {"$gt": datetime.utcnow()}},
+            {"urls": 1},
+        )
+        if not doc:
+            return None
+        return list(doc.get("urls") or [])
+
+    async def put(self, key: str, query: str, locale: Optional[str], urls: List[str], ttl_seconds: int) -> None:
+        """Insert or replace the cached result for key."""
+        now = datetime.utcnow()
+        await self.collection.update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    "query": query,
+                    "locale": locale,
+                    "urls": list(urls),
+                    "fetchedAt": now,
+                    "expiresAt": now + timedelta(seconds=ttl_seconds),
+                }
+            },
+            upsert=True,
+        )
@@ -1,15 +1,26 @@
 """
 Shared MongoDB access for speaker option collections: name, slug, type.
 Collections: speakerTopics, speakerTargetAudeince, deliveryModes, speakingFormats.
+
+Reads are served from a process-wide snapshot per collection (rows plus name / slug / lowercase-name indexes),
+loaded with one find(). Writes through create_one / delete_one_non_system $inc the collection's counter in
+catalogVersions; other workers see the change the next time they compare versions (a primary-key find_one, at
+most every CATALOG_VERSION_CHECK_SECONDS).
 """
+import asyncio
 import os
 import re
-from typing import List, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 
 from app.helpers.Database import MongoDB
 
+CATALOG_VERSIONS_COLLECTION = "catalogVersions"
+CATALOG_VERSION_CHECK_SECONDS = float(os.getenv("CATALOG_VERSION_CHECK_SECONDS", "5"))
+
 
 def name_to_slug(name: str) -> str:
     """Lowercase slug: spaces, '&' -> hyphens (matches seed script)."""
@@ -20,13 +31,49 @@ def name_to_slug(name: str) -> str:
     return s
 
 
+class _CatalogSnapshot:
+    """All public rows of one catalog collection, sorted by name, with lookup indexes."""
+
+    def __init__(self, rows: List[dict], version: int):
+        self.rows = rows
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.by_name: Dict[str, dict] = {}
+        self.by_slug: Dict[str, dict] = {}
+        self.by_lower_name: Dict[str, dict] = {}
+        for row in rows:
+            self.by_name.setdefault(row["name"], row)
+            self.by_slug.setdefault(row["slug"], row)
+            self.by_lower_name.setdefault(row["name"].casefold(), row)
+
+
+# (db name, collection name) -> snapshot; shared by every model instance in the process
+_snapshots: Dict[Tuple[str, str], _CatalogSnapshot] = {}
+_snapshot_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+
+def invalidate_catalog_cache() -> None:
+    """Drop all cached catalog snapshots in this process (next read reloads)."""
+    _snapshots.clear()
+
+
 class SpeakerOptionCatalogModel:
     """CRUD helpers for catalog documents {_id, name, slug, type}."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes (per catalog collection)
+    INDEXES = [
+        IndexModel([("slug", ASCENDING)], name="slug_1"),
+        IndexModel([("name", ASCENDING)], name="name_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_by_slug", "filter": {"slug": "example"}},
+    ]
+
     def __init__(self, collection_name: str, db_name: Optional[str] = None):
-        self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[
-            collection_name
-        ]
+        database = MongoDB.get_database(db_name or os.getenv("DB_NAME"))
+        self.collection = database[collection_name]
+        self.versions = database[CATALOG_VERSIONS_COLLECTION]
+        self._cache_key = (database.name, collection_name)
 
     def _to_public(self, doc: dict) -> dict:
         return {
@@ -36,65 +83,75 @@ class SpeakerOptionCatalogModel:
             "type": doc.get("type") or "system",
         }
 
-    def _filter_query_for_type(self, doc_type: Optional[str]) -> dict:
-        """Mongo filter for catalog rows. None/empty = no filter (all rows)."""
-        if doc_type is None or not str(doc_type).strip():
-            return {}
-        dt = str(doc_type).strip()
-        if dt == "system":
-            # Include legacy docs with no type (API treats them as system in _to_public).
-            return {
-                "$or": [
-                    {"type": "system"},
-                    {"type": {"$exists": False}},
-                    {"type": None},
-                    {"type": ""},
-                ]
-            }
-        return {"type": dt}
+    async def _current_version(self) -> int:
+        doc = await self.versions.find_one({"_id": self.collection.name})
+        return int((doc or {}).get("version") or 0)
+
+    async def _bump_version(self) -> None:
+        """Invalidate every process's snapshot of this collection."""
+        await self.versions.update_one({"_id": self.collection.name}, {"$inc": {"version": 1}}, upsert=True)
+        _snapshots.pop(self._cache_key, None)
+
+    async def _snapshot(self) -> _CatalogSnapshot:
+        """Cached snapshot; re-checks the version at most every CATALOG_VERSION_CHECK_SECONDS."""
+        snapshot = _snapshots.get(self._cache_key)
+        if snapshot and time.monotonic() - snapshot.checked_at < CATALOG_VERSION_CHECK_SECONDS:
+            return snapshot
+        lock = _snapshot_locks.setdefault(self._cache_key, asyncio.Lock())
+        async with lock:
+            snapshot = _snapshots.get(self._cache_key)
+            if snapshot and time.monotonic() - snapshot.checked_at < CATALOG_VERSION_CHECK_SECONDS:
+                return snapshot
+            version = await self._current_version()
+            if snapshot and snapshot.version == version:
+                snapshot.checked_at = time.monotonic()
+                return snapshot
+            docs = await self.collection.find({}).to_list(length=None)
+            rows = [self._to_public(doc) for doc in docs if doc]
+            rows.sort(key=lambda d: (d.get("name") or "").casefold())
+            snapshot = _CatalogSnapshot(rows, version)
+            _snapshots[self._cache_key] = snapshot
+            return snapshot
 
     async def get_all(self, doc_type: Optional[str] = None) -> List[dict]:
-        query = self._filter_query_for_type(doc_type)
-        cursor = self.collection.find(query)
-        docs = await cursor.to_list(length=None)
-        out = []
-        for doc in docs:
-            if doc:
-                out.append(self._to_public(doc))
-        out.sort(key=lambda d: (d.get("name") or "").casefold())
-        return out
+        """Rows sorted by name; doc_type filters by public type (legacy rows without a type count as system)."""
+        rows = (await self._snapshot()).rows
+        if doc_type is not None and str(doc_type).strip():
+            dt = str(doc_type).strip()
+            rows = [r for r in rows if r["type"] == dt]
+        return [dict(r) for r in rows]
 
     async def get_by_slug(self, slug: str) -> Optional[dict]:
         if not slug or not isinstance(slug, str):
             return None
-        doc = await self.collection.find_one({"slug": slug.strip().lower()})
-        if not doc:
-            return None
-        return self._to_public(doc)
+        doc = (await self._snapshot()).by_slug.get(slug.strip().lower())
+        return dict(doc) if doc else None
 
     async def get_by_name(self, name: str) -> Optional[dict]:
         if not name or not isinstance(name, str):
             return None
-        doc = await self.collection.find_one({"name": name.strip()})
-        if not doc:
-            return None
-        return self._to_public(doc)
+        doc = (await self._snapshot()).by_name.get(name.strip())
+        return dict(doc) if doc else None
 
     async def get_many_by_names(self, names: List[str]) -> List[dict]:
+        """Resolve names (exact name, then slug form, then case-insensitive name) from one snapshot; input order, no repeats."""
         if not names:
             return []
+        snapshot = await self._snapshot()
         seen = set()
         out = []
         for n in names:
             n = (n or "").strip()
-            if not n or n in seen:
+            if not n:
                 continue
-            doc = await self.get_by_name(n)
-            if not doc:
-                doc = await self.get_by_slug(n.lower().replace(" ", "-").replace("&", "and"))
-            if doc:
-                seen.add(n)
-                out.append(doc)
+            doc = (
+                snapshot.by_name.get(n)
+                or snapshot.by_slug.get(n.lower().replace(" ", "-").replace("&", "and"))
+                or snapshot.by_lower_name.get(n.casefold())
+            )
+            if doc and doc["_id"] not in seen:
+                seen.add(doc["_id"])
+                out.append(dict(doc))
         return out
 
     async def create_one(
@@ -119,10 +176,9 @@ class SpeakerOptionCatalogModel:
             return None, "duplicate_name"
         doc = {"name": name, "slug": slug_final, "type": (doc_type or "custom").strip() or "custom"}
         result = await self.collection.insert_one(doc)
-        created = await self.collection.find_one({"_id": result.inserted_id})
-        if not created:
-            return None, "invalid_name"
-        return self._to_public(created), None
+        await self._bump_version()
+        doc["_id"] = result.inserted_id
+        return self._to_public(doc), None
 
     @staticmethod
     def _raw_is_non_system(doc: dict) -> bool:
@@ -146,4 +202,5 @@ class SpeakerOptionCatalogModel:
         if not self._raw_is_non_system(doc):
             return "system_topic"
         await self.collection.delete_one({"_id": oid})
+        await self._bump_version()
         return None
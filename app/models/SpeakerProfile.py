@@ -1,14 +1,20 @@
 """
 MongoDB model for Speaker Profile (progressive onboarding + final save).
 """
+import logging
 import os
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
 
 from app.helpers.Database import MongoDB
 from app.config.speaker_profile_steps import get_next_step
+from app.models.DataMigration import DataMigrationModel
+from app.models.ProfileConversation import ProfileConversationModel
+
+logger = logging.getLogger(__name__)
 
 
 def _user_id_query_filter(user_id: Optional[str]) -> dict:
@@ -26,6 +32,28 @@ def _user_id_query_filter(user_id: Optional[str]) -> dict:
         return {"user_id": uid}
 
 
+def normalize_email(email: Any) -> Optional[str]:
+    """Lookup form of an email (stripped, lowercased) stored as email_lower; None if empty or not a string."""
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return email.strip().lower()
+
+
+# Profiles written before email_lower existed (not yet visited by backfill_email_lower)
+LEGACY_EMAIL_FILTER = {"email": {"$type": "string"}, "email_lower": {"$exists": False}}
+EMAIL_LOWER_MIGRATION = "speaker_profiles.email_lower"
+
+# Collections whose legacy profiles all have email_lower (backfilled, or marked done in dataMigrations)
+_email_lower_backfilled: set[str] = set()
+
+
+def _with_email_lower(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Add email_lower next to email so exact-match lookups stay in sync with every write of email."""
+    if "email" in fields:
+        fields["email_lower"] = normalize_email(fields["email"])
+    return fields
+
+
 # Profile field names (for updates)
 PROFILE_FIELDS = [
     "full_name", "professional_title", "company", "email", "topics", "speaking_formats", "delivery_mode", "linkedin_url",
@@ -39,7 +67,57 @@ PROFILE_FIELDS = [
 ]
 
 
+# Profile fields that feed speaker/opportunity matching (query text and match-agent summary)
+MATCHING_PROFILE_FIELDS = (
+    "topics",
+    "speaking_formats",
+    "delivery_mode",
+    "target_audiences",
+    "talk_description",
+    "key_takeaways",
+    "testimonial",
+)
+
+
+# Named read projections (projection= on the get_* methods). Hot paths use a subset so large list fields
+# (topics, past_speaking_examples, ...) and legacy onboarding state are not transferred or decoded.
+# None = whole document.
+PROFILE_PROJECTIONS: Dict[str, Optional[Dict[str, int]]] = {
+    "full": None,
+    # Admin user list / profile cards
+    "summary": {
+        f: 1 for f in ("full_name", "email", "current_step", "isCompleted", "user_id", "createdAt", "updatedAt")
+    },
+    # Vector matching and the match agent: every field OpportunityTextBuilder.from_speaker_profile and
+    # OpportunitySpeakerMatchAgent._summary_profile read (MATCHING_PROFILE_FIELDS)
+    "matching": {f: 1 for f in MATCHING_PROFILE_FIELDS},
+    # Chatbot (returned to clients as profile_snapshot): the whole profile, onboarding state included,
+    # without the legacy embedded onboarding transcript (now in profileConversations)
+    "chat_snapshot": {"conversation": 0},
+    # Onboarding progress returned by apply_step_result
+    "step_state": {f: 1 for f in ("current_step", "completed_steps", "last_assistant_message", "updatedAt")},
+}
+
+
+def _projection(name: str) -> Optional[Dict[str, int]]:
+    if name not in PROFILE_PROJECTIONS:
+        raise ValueError(f"Unknown speaker profile projection {name!r}; expected one of {sorted(PROFILE_PROJECTIONS)}")
+    return PROFILE_PROJECTIONS[name]
+
+
 class SpeakerProfileModel:
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("user_id", ASCENDING), ("createdAt", DESCENDING)], name="user_id_1_createdAt_-1"),
+        IndexModel([("createdAt", DESCENDING)], name="createdAt_-1"),
+        IndexModel([("email_lower", ASCENDING)], name="email_lower_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_profile_by_email", "filter": {"email_lower": "speaker@example.org"}},
+        {"name": "get_by_user_id", "filter": {"user_id": "000000000000000000000000"}},
+        {"name": "list_by_user_id", "filter": _user_id_query_filter("000000000000000000000000"), "sort": [("createdAt", -1)]},
+    ]
+
     def __init__(
         self,
         db_name: Optional[str] = None,
@@ -48,6 +126,48 @@ class SpeakerProfileModel:
         self.collection = MongoDB.get_database(db_name or os.getenv("DB_NAME"))[
             collection_name
         ]
+        # Onboarding transcript lives in profileConversations (bucketed), not in the profile document
+        self.conversations = ProfileConversationModel(db_name)
+        self.migrations = DataMigrationModel(db_name)
+
+    def _email_filter(self, email_lower: str) -> dict:
+        """
+        Match on the indexed email_lower. Until backfill_email_lower has run in this process, profiles without
+        email_lower are also matched by an anchored case-insensitive regex on email, so they are not missed.
+        """
+        if self.collection.full_name in _email_lower_backfilled:
+            return {"email_lower": email_lower}
+        legacy = {**LEGACY_EMAIL_FILTER, "email": {"$regex": rf"^\s*{re.escape(email_lower)}\s*$", "$options": "i"}}
+        return {"$or": [{"email_lower": email_lower}, legacy]}
+
+    async def backfill_email_lower(self, dry_run: bool = False) -> dict:
+        """
+        Set email_lower on legacy profiles (one server-side pipeline update) and record the migration as done.
+        Returns {pending, updated}; with dry_run only pending is counted.
+        """
+        summary = {"pending": await self.collection.count_documents(LEGACY_EMAIL_FILTER), "updated": 0}
+        if dry_run:
+            return summary
+        if summary["pending"]:
+            trimmed = {"$toLower": {"$trim": {"input": "$email"}}}
+            result = await self.collection.update_many(
+                LEGACY_EMAIL_FILTER,
+                [{"$set": {"email_lower": {"$cond": [{"$eq": [trimmed, ""]}, None, trimmed]}}}],
+            )
+            summary["updated"] = result.modified_count
+        await self.migrations.mark_done(EMAIL_LOWER_MIGRATION, summary)
+        _email_lower_backfilled.add(self.collection.full_name)
+        return summary
+
+    async def after_ensure_indexes(self, ensured: list[str]) -> None:
+        """Index bootstrap hook (app.helpers.MongoIndexes.ensure_indexes): backfill email_lower once, then skip."""
+        if "email_lower_1" not in ensured:
+            return
+        if await self.migrations.is_done(EMAIL_LOWER_MIGRATION):
+            _email_lower_backfilled.add(self.collection.full_name)
+            return
+        summary = await self.backfill_email_lower()
+        logger.info("Backfilled speaker_profiles.email_lower: %s", summary)
 
     async def count(self) -> int:
         """Total documents in the speaker_profiles collection."""
@@ -64,10 +184,12 @@ class SpeakerProfileModel:
         self,
         full_name: str,
         user_id: Optional[str] = None,
+        last_assistant_message: Optional[str] = None,
     ) -> dict:
         """
         Create a new profile document after first valid step (full_name).
-        Sets current_step to the next step and completed_steps to ["full_name"].
+        Sets current_step to the next step and completed_steps to ["full_name"]; optionally stores
+        last_assistant_message in the same insert.
         """
         next_step = get_next_step("full_name")
         next_step_name = next_step.step_name if next_step else "topics"
@@ -75,10 +197,11 @@ class SpeakerProfileModel:
             "full_name": full_name.strip(),
             "current_step": next_step_name,
             "completed_steps": ["full_name"],
-            "conversation": [],
             "user_id": user_id,
             "createdAt": datetime.utcnow(),
         }
+        if last_assistant_message is not None:
+            doc["last_assistant_message"] = last_assistant_message
         result = await self.collection.insert_one(doc)
         doc["_id"] = result.inserted_id
         return doc
@@ -88,76 +211,61 @@ class SpeakerProfileModel:
         profile_id: str,
         agent_content: Any,
         user_content: Any,
-    ) -> Optional[dict]:
+    ) -> None:
         """
-        Append one agent message (question) and one user message (answer) to the profile's conversation array.
-        content can be str or list (e.g. for topics/target_audiences).
+        Append one agent message (question) and one user message (answer) to the profile's onboarding transcript
+        (profileConversations buckets). content can be str or list (e.g. for topics/target_audiences).
+        Returns nothing: callers that need the profile already hold it.
         """
-        try:
-            oid = ObjectId(profile_id)
-        except Exception:
-            return None
-        result = await self.collection.update_one(
-            {"_id": oid},
-            {
-                "$push": {
-                    "conversation": {
-                        "$each": [
-                            {"role": "agent", "content": agent_content},
-                            {"role": "user", "content": user_content},
-                        ]
-                    }
-                }
-            },
-        )
-        if result.matched_count == 0:
-            return None
-        return await self.get_profile(profile_id)
+        await self.conversations.append_turn(profile_id, agent_content, user_content)
 
-    async def update_last_assistant_message(self, profile_id: str, message: str) -> Optional[dict]:
-        """Store the last AI-generated assistant message so it can be used as the agent content for the next step's conversation entry."""
-        try:
-            oid = ObjectId(profile_id)
-        except Exception:
-            return None
-        result = await self.collection.update_one(
-            {"_id": oid},
-            {"$set": {"last_assistant_message": message, "updatedAt": datetime.utcnow()}},
-        )
-        if result.matched_count == 0:
-            return None
-        return await self.get_profile(profile_id)
+    async def get_conversation(self, profile_id: str, profile: Optional[dict] = None) -> List[dict]:
+        """
+        Whole onboarding transcript, oldest first. The legacy embedded `conversation` array of `profile` (documents
+        not yet moved by scripts/migrate_profile_conversations.py) is prepended.
+        """
+        legacy = (profile or {}).get("conversation") or []
+        return legacy + await self.conversations.get_all(profile_id)
 
-    async def update_step(
+    async def apply_step_result(
         self,
         profile_id: str,
+        step_name: str,
         updates: Dict[str, Any],
         next_step_name: Optional[str],
-        completed_steps: List[str],
         last_assistant_message: Optional[str] = None,
+        agent_content: Any = None,
+        user_content: Any = None,
+        projection: str = "step_state",
     ) -> Optional[dict]:
         """
-        Update profile with new field values and progress.
-        Only allowed profile fields are written; current_step and completed_steps are set.
-        Optionally set last_assistant_message (AI-generated transition shown before the next step).
+        Persist one verified onboarding step in a single find_one_and_update: $set the step's field values
+        (PROFILE_FIELDS only), current_step, last_assistant_message and updatedAt, and $addToSet step_name to
+        completed_steps. The conversation turn (agent_content / user_content) is then appended to profileConversations,
+        only when the update matched the profile, so no transcript is written for a missing profile or failed update.
+        Returns the updated document (fields per PROFILE_PROJECTIONS[projection]), or None if not found.
         """
         try:
             oid = ObjectId(profile_id)
         except Exception:
             return None
-        allowed_updates = {k: v for k, v in updates.items() if k in PROFILE_FIELDS}
-        allowed_updates["current_step"] = next_step_name
-        allowed_updates["completed_steps"] = completed_steps
-        allowed_updates["updatedAt"] = datetime.utcnow()
+        fields = {k: v for k, v in updates.items() if k in PROFILE_FIELDS}
+        fields["current_step"] = next_step_name
+        fields["updatedAt"] = datetime.utcnow()
         if last_assistant_message is not None:
-            allowed_updates["last_assistant_message"] = last_assistant_message
-        result = await self.collection.update_one(
+            fields["last_assistant_message"] = last_assistant_message
+        doc = await self.collection.find_one_and_update(
             {"_id": oid},
-            {"$set": allowed_updates},
+            {"$set": _with_email_lower(fields), "$addToSet": {"completed_steps": step_name}},
+            projection=_projection(projection),
+            return_document=ReturnDocument.AFTER,
         )
-        if result.matched_count == 0:
+        if not doc:
             return None
-        return await self.get_profile(profile_id)
+        await self.conversations.append_turn(profile_id, agent_content, user_content)
+        if "_id" in doc:
+            doc["_id"] = str(doc["_id"])
+        return doc
 
     async def update_profile(self, profile_id: str, updates: Dict[str, Any]) -> Optional[dict]:
         """
@@ -174,19 +282,19 @@ class SpeakerProfileModel:
         allowed["updatedAt"] = datetime.utcnow()
         result = await self.collection.update_one(
             {"_id": oid},
-            {"$set": allowed},
+            {"$set": _with_email_lower(allowed)},
         )
         if result.matched_count == 0:
             return None
         return await self.get_profile(profile_id)
 
-    async def get_profile(self, profile_id: str) -> Optional[dict]:
-        """Return profile document by id, or None if not found."""
+    async def get_profile(self, profile_id: str, projection: str = "full") -> Optional[dict]:
+        """Return profile document by id (fields per PROFILE_PROJECTIONS[projection]), or None if not found."""
         try:
             oid = ObjectId(profile_id)
         except Exception:
             return None
-        doc = await self.collection.find_one({"_id": oid})
+        doc = await self.collection.find_one({"_id": oid}, _projection(projection))
         if doc and "_id" in doc:
             doc["_id"] = str(doc["_id"])
         return doc
@@ -198,6 +306,8 @@ class SpeakerProfileModel:
         except Exception:
             return False
         result = await self.collection.delete_one({"_id": oid})
+        if result.deleted_count:
+            await self.conversations.delete_for_profile(profile_id)
         return result.deleted_count > 0
 
     async def delete_profile_for_user(self, profile_id: str, user_id: str) -> bool:
@@ -221,6 +331,8 @@ class SpeakerProfileModel:
         if str(owner) != uid:
             return False
         result = await self.collection.delete_one({"_id": oid})
+        if result.deleted_count:
+            await self.conversations.delete_for_profile(profile_id)
         return result.deleted_count > 0
 
     async def get_profile_by_id_and_user(self, profile_id: str, user_id: str) -> Optional[dict]:
@@ -235,17 +347,18 @@ class SpeakerProfileModel:
         return doc
 
     async def get_profile_by_email(self, email: str) -> Optional[dict]:
-        """Return profile document by email (case-insensitive)."""
-        if not email or not isinstance(email, str):
+        """Return profile document by email (case-insensitive, exact match on the indexed email_lower)."""
+        email_lower = normalize_email(email)
+        if not email_lower:
             return None
-        doc = await self.collection.find_one({"email": {"$regex": f"^{email.strip().lower()}$", "$options": "i"}})
+        doc = await self.collection.find_one(self._email_filter(email_lower))
         if doc and "_id" in doc:
             doc["_id"] = str(doc["_id"])
         return doc
 
-    async def get_all_profiles(self) -> List[dict]:
+    async def get_all_profiles(self, projection: str = "full") -> List[dict]:
         """Return all speaker profiles, newest first. For admin use."""
-        cursor = self.collection.find({}).sort("createdAt", -1)
+        cursor = self.collection.find({}, _projection(projection)).sort("createdAt", -1)
         docs = await cursor.to_list(length=None)
         for doc in docs:
             if doc and "_id" in doc:
@@ -282,12 +395,12 @@ class SpeakerProfileModel:
             "modified": result.modified_count,
         }
 
-    async def get_profiles_by_user_id(self, user_id: str) -> List[dict]:
+    async def get_profiles_by_user_id(self, user_id: str, projection: str = "full") -> List[dict]:
         """Return all speaker profiles for the given user_id, newest first (no limit)."""
         uid = (user_id or "").strip()
         if not uid:
             return []
-        cursor = self.collection.find(_user_id_query_filter(uid)).sort("createdAt", -1)
+        cursor = self.collection.find(_user_id_query_filter(uid), _projection(projection)).sort("createdAt", -1)
         docs = await cursor.to_list(length=None)
         for doc in docs:
             if doc and "_id" in doc:
@@ -295,7 +408,7 @@ class SpeakerProfileModel:
         return docs
 
     async def get_profiles_by_user_ids(
-        self, user_ids: List[str]
+        self, user_ids: List[str], projection: str = "full"
     ) -> Dict[str, List[dict]]:
         """
         Return speaker profiles grouped by user_id (newest first within each group).
@@ -311,7 +424,11 @@ class SpeakerProfileModel:
                 in_values.append(ObjectId(u))
             except Exception:
                 pass
-        cursor = self.collection.find({"user_id": {"$in": in_values}})
+        fields = _projection(projection)
+        if fields is not None:
+            # grouping and ordering below need user_id and createdAt
+            fields = {**fields, "user_id": 1, "createdAt": 1}
+        cursor = self.collection.find({"user_id": {"$in": in_values}}, fields)
         docs = await cursor.to_list(length=None)
         grouped: Dict[str, List[dict]] = {}
         for doc in docs:
@@ -335,11 +452,11 @@ class SpeakerProfileModel:
         Insert a new speaker profile (full save). profile_data must include all profile fields.
         Adds user_id and createdAt.
         """
-        doc = {
+        doc = _with_email_lower({
             **profile_data,
             "user_id": user_id,
             "createdAt": datetime.utcnow(),
-        }
+        })
         result = await self.collection.insert_one(doc)
         doc["_id"] = result.inserted_id
         return doc
@@ -356,12 +473,12 @@ class SpeakerProfileModel:
         No conversation, completed_steps, last_assistant_message, current_step.
         """
         sanitized = self._sanitize_chatbot_profile_data(profile_data)
-        doc = {
+        doc = _with_email_lower({
             **sanitized,
             "user_id": user_id,
             "createdAt": datetime.utcnow(),
             "updatedAt": datetime.utcnow(),
-        }
+        })
         result = await self.collection.insert_one(doc)
         doc["_id"] = result.inserted_id
         if isinstance(doc["_id"], ObjectId):
@@ -372,15 +489,16 @@ class SpeakerProfileModel:
         """
         Update speaker profile by email. Only allowed profile fields; excludes conversation, etc.
         """
-        if not email or not isinstance(email, str):
+        email_lower = normalize_email(email)
+        if not email_lower:
             return None
         sanitized = self._sanitize_chatbot_profile_data(profile_data)
         if not sanitized:
             return await self.get_profile_by_email(email)
         sanitized["updatedAt"] = datetime.utcnow()
         result = await self.collection.find_one_and_update(
-            {"email": {"$regex": f"^{email.strip().lower()}$", "$options": "i"}},
-            {"$set": sanitized},
+            self._email_filter(email_lower),
+            {"$set": _with_email_lower(sanitized)},
             return_document=ReturnDocument.AFTER,
         )
         if not result:
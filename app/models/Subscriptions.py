@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
 
 from app.helpers.Database import MongoDB
 
@@ -13,6 +13,16 @@ load_dotenv()
 class SubscriptionsModel:
     """Mongo ``subscriptions`` collection (plan rows keyed by ``user_id`` / Stripe ids)."""
 
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("user_id", ASCENDING), ("createdOn", DESCENDING)], name="user_id_1_createdOn_-1"),
+        IndexModel([("stripe_customer_id", ASCENDING)], name="stripe_customer_id_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "find_all_by_user_id", "filter": {"user_id": "000000000000000000000000"}, "sort": [("createdOn", -1), ("_id", -1)]},
+        {"name": "find_by_stripe_customer_id", "filter": {"stripe_customer_id": "cus_0"}},
+    ]
+
     def __init__(self, db_name: str | None = None, collection_name: str = "subscriptions"):
         db = db_name or os.getenv("DB_NAME")
         self.collection = MongoDB.get_database(db)[collection_name]
@@ -1,10 +1,43 @@
 from app.helpers.Database import MongoDB
+from app.helpers.KeysetPagination import approximate_count, keyset_page
 from bson import ObjectId
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
 import os
 
 
 class UrlCollectionModel:
-    """Model for UrlCollection - stores url, createdAt, sourceName, description."""
+    """Model for UrlCollection - stores url, canonicalUrl, createdAt, sourceName, description, contentHash, opportunityIds."""
+
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("status", ASCENDING), ("createdAt", ASCENDING)], name="status_1_createdAt_1"),
+        IndexModel([("status", ASCENDING), ("nextAttemptAt", ASCENDING)], name="status_1_nextAttemptAt_1"),
+        IndexModel([("status", ASCENDING), ("claimedAt", ASCENDING)], name="status_1_claimedAt_1"),
+        IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING)], name="userId_1_createdAt_-1"),
+        IndexModel([("canonicalUrl", ASCENDING), ("status", ASCENDING)], name="canonicalUrl_1_status_1"),
+        IndexModel([("url", ASCENDING), ("contentHash", ASCENDING), ("createdAt", DESCENDING)], name="url_1_contentHash_1_createdAt_-1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_pending", "filter": {"status": "pending"}, "sort": [("createdAt", 1)]},
+        {
+            "name": "claim_due_retries",
+            "filter": {"status": "retry_scheduled", "nextAttemptAt": {"$lte": datetime(2000, 1, 1)}},
+            "sort": [("nextAttemptAt", 1)],
+        },
+        {"name": "expired_retry_claims", "filter": {"status": "retrying", "claimedAt": {"$lte": datetime(2000, 1, 1)}}},
+        {"name": "find_pending_canonical_urls", "filter": {"canonicalUrl": {"$in": ["https://example.org/"]}, "status": "pending"}},
+        {
+            "name": "find_reusable_by_content_hash",
+            "filter": {
+                "url": "https://example.org/",
+                "contentHash": "0",
+                "status": {"$in": ["completed", "unchanged"]},
+                "extractionOk": True,
+            },
+            "sort": [("createdAt", -1)],
+        },
+    ]
 
     def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="UrlCollections"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
@@ -28,6 +61,113 @@ class UrlCollectionModel:
         )
         return result.modified_count > 0
 
+    async def find_reusable_by_content_hash(
+        self, url: str, content_hash: str, exclude_id: str = None
+    ) -> dict | None:
+        """
+        Latest completed/unchanged scrape of the same url with the same normalized content hash whose extraction
+        succeeded (extractionOk). Used to skip LLM extraction when the page did not change since the last scrape.
+        """
+        if not url or not content_hash:
+            return None
+        query = {
+            "url": url,
+            "contentHash": content_hash,
+            "status": {"$in": ["completed", "unchanged"]},
+            "extractionOk": True,
+        }
+        if exclude_id:
+            query["_id"] = {"$ne": ObjectId(exclude_id)}
+        return await self.collection.find_one(query, sort=[("createdAt", -1)])
+
+    async def get_change_detection_stats(self) -> dict:
+        """
+        Aggregate content-hash change detection: job counts per status, LLM calls spent on
+        completed scrapes and LLM calls saved by `unchanged` skips.
+        """
+        pipeline = [
+            {
+                "$group": {
+                    "_id": "$status",
+                    "count": {"$sum": 1},
+                    "llmCalls": {"$sum": {"$ifNull": ["$llmCalls", 0]}},
+                    "llmCallsSaved": {"$sum": {"$ifNull": ["$llmCallsSaved", 0]}},
+                }
+            }
+        ]
+        by_status: dict = {}
+        llm_calls = 0
+        llm_calls_saved = 0
+        async for row in self.collection.aggregate(pipeline):
+            by_status[row["_id"] or "pending"] = row["count"]
+            llm_calls += row["llmCalls"]
+            llm_calls_saved += row["llmCallsSaved"]
+        return {
+            "byStatus": by_status,
+            "unchanged": by_status.get("unchanged", 0),
+            "llmCalls": llm_calls,
+            "llmCallsSaved": llm_calls_saved,
+        }
+
+    async def find_pending_canonical_urls(self, canonical_urls: list[str]) -> set[str]:
+        """Subset of canonical_urls that already have a pending UrlCollection job."""
+        if not canonical_urls:
+            return set()
+        cursor = self.collection.find(
+            {"canonicalUrl": {"$in": list(canonical_urls)}, "status": "pending"},
+            {"canonicalUrl": 1},
+        )
+        return {doc["canonicalUrl"] async for doc in cursor}
+
+    async def increment_attempts(self, url_collection_id: str) -> int:
+        """Atomically add one failed attempt. Returns the new attempt count."""
+        doc = await self.collection.find_one_and_update(
+            {"_id": ObjectId(url_collection_id)},
+            {"$inc": {"attempts": 1}},
+            projection={"attempts": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        return int((doc or {}).get("attempts") or 0)
+
+    async def claim_due_retries(self, limit: int = 5, claim_timeout_seconds: float = 3600) -> list[dict]:
+        """
+        Atomically claim up to `limit` jobs with status \"retry_scheduled\" whose nextAttemptAt has passed
+        (earliest first), setting status \"retrying\" and claimedAt so concurrent workers do not run the same job.
+        \"retrying\" jobs claimed more than claim_timeout_seconds ago (the worker died mid-run) are claimed again.
+        Returns the documents as they were before the claim: status \"retrying\" marks an expired claim.
+        """
+        claimed: list[dict] = []
+        for _ in range(limit):
+            now = datetime.utcnow()
+            doc = await self.collection.find_one_and_update(
+                {
+                    "$or": [
+                        {"status": "retry_scheduled", "nextAttemptAt": {"$lte": now}},
+                        {"status": "retrying", "claimedAt": {"$lte": now - timedelta(seconds=claim_timeout_seconds)}},
+                        # Claimed before claimedAt was recorded
+                        {"status": "retrying", "claimedAt": {"$exists": False}},
+                    ]
+                },
+                {"$set": {"status": "retrying", "claimedAt": now}},
+                sort=[("nextAttemptAt", 1)],
+                return_document=ReturnDocument.BEFORE,
+            )
+            if doc is None:
+                break
+            claimed.append(doc)
+        return claimed
+
+    async def requeue(self, url_collection_id: str) -> bool:
+        """Reset a failed/dead-lettered job to retry_scheduled, due now, with attempts reset. Returns True if moved."""
+        result = await self.collection.update_one(
+            {"_id": ObjectId(url_collection_id), "status": {"$in": ["failed", "dead_letter"]}},
+            {
+                "$set": {"status": "retry_scheduled", "nextAttemptAt": datetime.utcnow(), "attempts": 0},
+                "$unset": {"deadLetteredAt": ""},
+            },
+        )
+        return result.modified_count > 0
+
     async def get_pending(self, limit: int = 5, sort_by: dict = None) -> list[dict]:
         """Get UrlCollection entries with status \"pending\" (or no status for backward compatibility). Oldest first. For cron job."""
         if sort_by is None:
@@ -40,26 +180,33 @@ class UrlCollectionModel:
         )
         return [doc async for doc in cursor]
 
-    async def get_list(self, user_id: str = None, skip: int = 0, limit: int = 100, sort_by: dict = None) -> list[dict]:
-        """Get UrlCollection entries with pagination. Optionally filter by user_id."""
-        if sort_by is None:
-            sort_by = {"createdAt": -1}
+    async def get_page(
+        self, user_id: str = None, limit: int = 100, cursor: str = None, skip: int = 0, sort_by: dict = None, status: str = None
+    ) -> tuple[list[dict], str | None]:
+        """Keyset page of UrlCollection entries (newest first by default) and the next-page cursor."""
         query = {}
         if user_id is not None:
             query["userId"] = user_id
-        cursor = (
-            self.collection.find(query)
-            .sort(list(sort_by.items()))
-            .skip(skip)
-            .limit(limit)
-        )
-        return [doc async for doc in cursor]
+        if status is not None:
+            query["status"] = status
+        return await keyset_page(self.collection, query, sort_by or {"createdAt": -1}, limit, cursor=cursor, skip=skip)
+
+    async def approximate_count(self, user_id: str = None, status: str = None) -> int:
+        """Like count(), from collection metadata when unfiltered, otherwise briefly cached."""
+        query = {}
+        if user_id is not None:
+            query["userId"] = user_id
+        if status is not None:
+            query["status"] = status
+        return await approximate_count(self.collection, query)
 
-    async def count(self, user_id: str = None) -> int:
-        """Get total count. Optionally filter by user_id."""
+    async def count(self, user_id: str = None, status: str = None) -> int:
+        """Get total count. Optionally filter by user_id and status."""
         query = {}
         if user_id is not None:
             query["userId"] = user_id
+        if status is not None:
+            query["status"] = status
         return await self.collection.count_documents(query)
 
     async def delete_by_id(self, url_collection_id: str, user_id: str = None) -> bool:
@@ -0,0 +1,53 @@
+"""
+MongoDB model for the global URL freshness index.
+Collection: urlFreshness. One document per canonical URL (the _id, so it is unique):
+{ _id: canonicalUrl, url, lastScrapedAt, urlCollectionId }.
+urlCollectionId points at the UrlCollection job holding the latest result (opportunityIds, topics, contentHash).
+"""
+import os
+from datetime import datetime, timedelta
+
+from app.helpers.Database import MongoDB
+
+
+class UrlFreshnessModel:
+    """Model for urlFreshness: canonical URL -> last scrape time and result pointer."""
+
+    # Lookups are by _id; app.helpers.MongoIndexes has nothing extra to create here.
+    INDEXES = []
+    HOT_QUERIES = []
+
+    def __init__(self, db_name=os.getenv("DB_NAME"), collection_name="urlFreshness"):
+        self.collection = MongoDB.get_database(db_name)[collection_name]
+
+    async def get_fresh(self, canonical_url: str, max_age_seconds: int) -> dict | None:
+        """Entry for canonical_url if it was scraped within max_age_seconds, else None."""
+        if not canonical_url or max_age_seconds <= 0:
+            return None
+        return await self.collection.find_one({
+            "_id": canonical_url,
+            "lastScrapedAt": {"$gte": datetime.utcnow() - timedelta(seconds=max_age_seconds)},
+        })
+
+    async def get_last_scraped(self, canonical_urls: list[str]) -> dict:
+        """{canonicalUrl: lastScrapedAt} for the given canonical URLs that have been scraped."""
+        if not canonical_urls:
+            return {}
+        cursor = self.collection.find({"_id": {"$in": list(canonical_urls)}}, {"lastScrapedAt": 1})
+        return {doc["_id"]: doc.get("lastScrapedAt") async for doc in cursor}
+
+    async def touch(self, canonical_url: str, url: str, url_collection_id: str, scraped_at: datetime = None) -> None:
+        """Record that url_collection_id holds the latest result for canonical_url."""
+        if not canonical_url:
+            return
+        await self.collection.update_one(
+            {"_id": canonical_url},
+            {
+                "$set": {
+                    "url": url,
+                    "lastScrapedAt": scraped_at or datetime.utcnow(),
+                    "urlCollectionId": url_collection_id,
+                }
+            },
+            upsert=True,
+        )
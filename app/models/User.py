@@ -1,5 +1,7 @@
 from typing import List, Optional
+from pymongo import ASCENDING, IndexModel
 from app.helpers.Database import MongoDB
+from app.helpers.KeysetPagination import approximate_count, keyset_page
 from bson import ObjectId
 import os
 from app.schemas.User import UserSchema
@@ -10,6 +12,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class UserModel:
+    # Declarative indexes / hot queries, applied and checked by app.helpers.MongoIndexes
+    INDEXES = [
+        IndexModel([("email", ASCENDING)], name="email_1"),
+    ]
+    HOT_QUERIES = [
+        {"name": "get_user_by_email", "filter": {"email": "user@example.org"}},
+    ]
+
     def __init__(self, db_name=os.getenv('DB_NAME'), collection_name="users"):
         self.collection = MongoDB.get_database(db_name)[collection_name]
 
@@ -49,6 +59,21 @@ class UserModel:
             users.append(UserSchema(**doc))
         return users
     
+    async def get_users_page(
+        self, filters: dict = None, limit: int = 10, cursor: str = None, skip: int = 0
+    ) -> tuple[List[UserSchema], Optional[str]]:
+        """
+        Keyset page of users in _id (creation) order and the cursor for the next page (None on the last page).
+        """
+        docs, next_cursor = await keyset_page(self.collection, filters or {}, {"_id": 1}, limit, cursor=cursor, skip=skip)
+        return [UserSchema(**doc) for doc in docs], next_cursor
+
+    async def get_documents_count_approximate(self, filters: dict = None) -> int:
+        """
+        Count for paginated listings: collection metadata when unfiltered, otherwise briefly cached.
+        """
+        return await approximate_count(self.collection, filters or {})
+
     async def get_users_with_projection(self, filters: dict = {}, skip: int = 0, limit: int = 10, fields: List[str] = None) -> List[dict]:
         """
         Retrieve a list of users matching the given filters with pagination and projection.
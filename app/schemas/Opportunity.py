@@ -37,3 +37,21 @@ class UrlScrapeCreateSchema(BaseModel):
 
     url: str
     topics: Optional[List[str]] = None  # Optional; allowed values from speaker_profile_chatbot.TOPICS
+
+
+class UrlCrawlCreateSchema(BaseModel):
+    """Schema for crawling a site and queueing every discovered page as a URL scrape job."""
+
+    url: str  # Root URL; only pages on the same host are crawled
+    max_depth: int = Field(default=2, ge=0, le=5)
+    max_urls: int = Field(default=50, ge=1, le=500)
+    topics: Optional[List[str]] = None  # Stored on every created UrlCollection
+
+
+class UrlDiscoveryCreateSchema(BaseModel):
+    """Schema for sitemap/feed discovery of event pages on a domain."""
+
+    domain: str  # e.g. "example.com" or "https://example.com"
+    max_urls: int = Field(default=200, ge=1, le=2000)
+    since_days: int = Field(default=365, ge=0, le=3650)  # Ignore sitemap/feed entries with older lastmod; 0 = no limit
+    topics: Optional[List[str]] = None  # Stored on every created UrlCollection
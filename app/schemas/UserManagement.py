@@ -49,6 +49,7 @@ class UsersListPagination(BaseModel):
     totalPages: int
     currentPage: int
     limit: int
+    nextCursor: Optional[str] = None
 
 
 class UsersWithProfilesListData(BaseModel):
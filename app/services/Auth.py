@@ -292,16 +292,17 @@ class AuthService:
         except Exception as e:
             raise Exception(f"Error uploading profile picture: {str(e)}")
         
-    async def get_all_users(self, page: int = 1, limit: int = 10):
+    async def get_all_users(self, page: int = 1, limit: int = 10, cursor: str = None):
         try:
             import asyncio
             filters = {}
-            number_to_skip = (page - 1) * limit
+            # With a cursor (previous nextCursor) page is ignored and deep pages cost the same as the first
+            number_to_skip = 0 if cursor else (page - 1) * limit
             
             # Run queries in parallel for better performance
-            total, users = await asyncio.gather(
-                self.user_model.get_documents_count(filters),
-                self.user_model.get_users(filters, number_to_skip, limit)
+            total, (users, next_cursor) = await asyncio.gather(
+                self.user_model.get_documents_count_approximate(filters),
+                self.user_model.get_users_page(filters, limit, cursor, number_to_skip)
             )
             total_pages = (total + limit - 1) // limit
             
@@ -318,7 +319,8 @@ class AuthService:
                     "pagination": {
                         "totalPages": total_pages,
                         "currentPage": page,
-                        "limit": limit
+                        "limit": limit,
+                        "nextCursor": next_cursor
                 }
             }
             }
@@ -441,19 +443,20 @@ class AuthService:
         except Exception as e:
             return {"success": False, "data": None, "error": str(e)}
 
-    async def get_users_by_admin(self, admin_id: str, page: int = 1, limit: int = 10) -> dict:
+    async def get_users_by_admin(self, admin_id: str, page: int = 1, limit: int = 10, cursor: str = None) -> dict:
         """
         Get all users created by a specific admin with pagination.
+        With cursor (a previous nextCursor) page is ignored and deep pages cost the same as the first.
         """
         try:
             import asyncio
             filters = {"adminId": admin_id}
-            number_to_skip = (page - 1) * limit
+            number_to_skip = 0 if cursor else (page - 1) * limit
             
             # Run queries in parallel for better performance
-            total, users = await asyncio.gather(
-                self.user_model.get_documents_count(filters),
-                self.user_model.get_users(filters, number_to_skip, limit)
+            total, (users, next_cursor) = await asyncio.gather(
+                self.user_model.get_documents_count_approximate(filters),
+                self.user_model.get_users_page(filters, limit, cursor, number_to_skip)
             )
             total_pages = (total + limit - 1) // limit
             
@@ -472,7 +475,8 @@ class AuthService:
                         "total": total,
                         "totalPages": total_pages,
                         "currentPage": page,
-                        "limit": limit
+                        "limit": limit,
+                        "nextCursor": next_cursor
                     }
                 }
             }
@@ -0,0 +1,98 @@
+"""
+Dashboard summary: collection counters and the recent-activity feed.
+Counters come from estimated_document_count() (collection metadata, no scan) and are cached in-process for
+DASHBOARD_COUNTS_TTL_SECONDS; one refresh runs at a time and concurrent requests share its result.
+The activity feed is one indexed query (createdAt desc, capped at DASHBOARD_ACTIVITY_SCAN_LIMIT).
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.config.dashboard import DASHBOARD_TOTAL_AGENTS
+from app.models.Opportunity import OpportunityModel
+from app.models.RecentActivity import RecentActivityModel
+from app.models.SpeakerProfile import SpeakerProfileModel
+from app.models.User import UserModel
+
+DASHBOARD_COUNTS_TTL_SECONDS = float(os.getenv("DASHBOARD_COUNTS_TTL_SECONDS", "60"))
+# Newest activities read for the feed; the feed shows today's (else yesterday's) entries among them
+DASHBOARD_ACTIVITY_SCAN_LIMIT = int(os.getenv("DASHBOARD_ACTIVITY_SCAN_LIMIT", "50"))
+RECENT_ACTIVITY_FALLBACK_LIMIT = 5
+
+
+class DashboardService:
+    def __init__(
+        self,
+        user_model: UserModel = None,
+        speaker_profile_model: SpeakerProfileModel = None,
+        opportunity_model: OpportunityModel = None,
+        recent_activity_model: RecentActivityModel = None,
+        counts_ttl_seconds: float = DASHBOARD_COUNTS_TTL_SECONDS,
+    ):
+        self.user_model = user_model or UserModel()
+        self.speaker_profile_model = speaker_profile_model or SpeakerProfileModel()
+        self.opportunity_model = opportunity_model or OpportunityModel()
+        self.recent_activity_model = recent_activity_model or RecentActivityModel()
+        self.counts_ttl_seconds = counts_ttl_seconds
+        self._counts: Optional[Dict[str, int]] = None
+        self._counts_expires_at = 0.0
+        self._counts_lock = asyncio.Lock()
+
+    async def _fetch_counts(self) -> Dict[str, int]:
+        users, speaker_profiles, opportunities = await asyncio.gather(
+            self.user_model.collection.estimated_document_count(),
+            self.speaker_profile_model.collection.estimated_document_count(),
+            self.opportunity_model.collection.estimated_document_count(),
+        )
+        return {
+            "agents": DASHBOARD_TOTAL_AGENTS,
+            "users": users,
+            "speakerProfiles": speaker_profiles,
+            "opportunities": opportunities,
+        }
+
+    async def get_counts(self) -> Dict[str, int]:
+        """{agents, users, speakerProfiles, opportunities}; at most DASHBOARD_COUNTS_TTL_SECONDS old."""
+        if self._counts is not None and time.monotonic() < self._counts_expires_at:
+            return self._counts
+        async with self._counts_lock:
+            if self._counts is None or time.monotonic() >= self._counts_expires_at:
+                self._counts = await self._fetch_counts()
+                self._counts_expires_at = time.monotonic() + self.counts_ttl_seconds
+        return self._counts
+
+    def invalidate_counts(self) -> None:
+        """Force the next get_counts() to re-read (e.g. after a bulk import or delete)."""
+        self._counts_expires_at = 0.0
+
+    async def get_recent_activities(self) -> Tuple[str, List[dict]]:
+        """
+        Recent activity feed: entries for today (UTC), else yesterday (UTC), else up to 5 most recent.
+        Returns (source, activities) with source "today" | "yesterday" | "recent".
+        """
+        recent = await self.recent_activity_model.list_recent(DASHBOARD_ACTIVITY_SCAN_LIMIT)
+        now = datetime.utcnow()
+        today_start = datetime(now.year, now.month, now.day)
+        yesterday_start = today_start - timedelta(days=1)
+
+        def created_on_or_after(doc: dict, start: datetime) -> bool:
+            created = doc.get("createdAt")
+            return bool(created) and datetime.fromisoformat(created) >= start
+
+        today = [a for a in recent if created_on_or_after(a, today_start)]
+        if today:
+            return "today", today
+        yesterday = [a for a in recent if created_on_or_after(a, yesterday_start)]
+        if yesterday:
+            return "yesterday", yesterday
+        return "recent", recent[:RECENT_ACTIVITY_FALLBACK_LIMIT]
+
+    async def get_summary(self) -> dict:
+        """Counters and activity feed in one response, fetched concurrently."""
+        counts, (source, activities) = await asyncio.gather(self.get_counts(), self.get_recent_activities())
+        return {
+            "counts": counts,
+            "recentActivities": {"source": source, "activities": activities},
+        }
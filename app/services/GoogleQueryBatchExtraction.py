@@ -0,0 +1,308 @@
+"""
+Offline batch-extraction mode for bulk GoogleQuery backlogs.
+Flow for one claimed batch of pending GoogleQueries:
+SERP -> top URLs -> UrlCollection jobs + RapidAPI scrape (recently scraped URLs linked via urlFreshness,
+unchanged pages skipped by content hash)
+-> all extraction chunk prompts in one JSONL request file -> batch provider -> merge per page
+-> enrichment prompts for incomplete opportunities in a second request file -> batch provider
+-> qualification -> UrlScraperRapidAPIService.save_extraction_result (dedupe, Mongo, Pinecone).
+A page with any failed (or missing) extraction chunk result is not saved: its job goes through record_job_failure
+as retryable (the retry runs the interactive extraction), so no contentHash is stored for a partial extraction.
+A failed or timed-out LLM batch does the same for every page of the run; the queries still complete, like
+GoogleQueryScraperService when some of its URL jobs fail.
+LLM work is throughput-bound (one batch per stage) instead of one interactive call per chunk.
+"""
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.agents.EventDetailEnricherAgent import EventDetailEnricherAgent
+from app.config.recent_activity import (
+    MESSAGE_GOOGLE_QUERIES_ADDED,
+    RECENT_ACTIVITY_TYPE_GOOGLE_QUERIES,
+    RECENT_ACTIVITY_TYPE_OPPORTUNITIES,
+    message_opportunities_added,
+)
+from app.helpers.BatchExtraction import (
+    BATCH_POLL_INTERVAL_SECONDS,
+    BATCH_TIMEOUT_SECONDS,
+    BatchProvider,
+    fingerprinted_request,
+    run_batch,
+    write_batch_requests,
+)
+from app.helpers.LLMUsage import flush_llm_usage, llm_usage_job, record_llm_usage
+from app.helpers.OpportunityQualifier import qualify_opportunities_batch_async
+from app.helpers.RapidAPIScraper import RapidAPIScraper
+from app.helpers.RetryPolicy import ScrapeError
+from app.helpers.SerpHelper import SerpHelper
+from app.helpers.SpeakingOpportunityExtractor import SpeakingOpportunityExtractor
+from app.models.GoogleQuery import GoogleQueryModel
+from app.models.RecentActivity import RecentActivityModel
+from app.services.GoogleQueryScraper import GOOGLE_QUERY_TOP_N
+from app.services.UrlScraperRapidAPI import (
+    RAPIDAPI_DELAY_SECONDS,
+    UrlScraperRapidAPIService,
+    _sync_scrape_page,
+    is_pdf_url,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_EXTRACTION_WORK_DIR = os.getenv("BATCH_EXTRACTION_WORK_DIR", "batch_runs")
+
+
+class GoogleQueryBatchExtractionService:
+    """Runs claimed pending GoogleQueries through the extraction pipeline with batched LLM stages."""
+
+    def __init__(self, provider: BatchProvider, work_dir: str = None, delay_seconds: float = RAPIDAPI_DELAY_SECONDS):
+        self.provider = provider
+        self.work_dir = work_dir or BATCH_EXTRACTION_WORK_DIR
+        self.delay_seconds = delay_seconds
+        self.google_query_model = GoogleQueryModel()
+        self.url_scraper_service = UrlScraperRapidAPIService()
+        self.recent_activity_model = RecentActivityModel()
+        self.extractor = SpeakingOpportunityExtractor()
+        self.model_name = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+    async def _fail_query(self, google_query_id: str, error: str) -> None:
+        await self.google_query_model.update_by_id(
+            google_query_id,
+            {"status": "failed", "error": error, "updatedAt": datetime.utcnow()},
+        )
+
+    def _retry_args(self, query: str) -> dict:
+        return {"delaySeconds": self.delay_seconds, "fromGoogleQuery": True, "googleSearchQuery": query}
+
+    async def _collect_pages(self, doc: dict) -> List[Dict[str, Any]]:
+        """SERP + UrlCollection jobs + scrape for one GoogleQuery. Returns pages that still need extraction."""
+        google_query_id = str(doc["_id"])
+        query = (doc.get("query") or "").strip()
+        user_id = str(doc["userId"]) if doc.get("userId") is not None else None
+
+        urls = await SerpHelper().search_async(query)
+        top_urls = [u for u in (urls or []) if not is_pdf_url(u)][:GOOGLE_QUERY_TOP_N]
+        await self.google_query_model.update_by_id(
+            google_query_id,
+            {"urls": top_urls, "updatedAt": datetime.utcnow()},
+        )
+
+        pages: List[Dict[str, Any]] = []
+        url_collection_ids: List[str] = []
+        for url in top_urls:
+            try:
+                url_collection_id = await self.url_scraper_service.create_url_scrape_job(url, user_id=user_id)
+                url_collection_ids.append(url_collection_id)
+                if await self.url_scraper_service.link_fresh_result(url_collection_id, url, from_google_query=True):
+                    continue
+                try:
+                    page = await asyncio.to_thread(_sync_scrape_page, url, self.delay_seconds)
+                except Exception as e:
+                    await self.url_scraper_service.record_job_failure(url_collection_id, e, retry_args=self._retry_args(query))
+                    continue
+                previous = await self.url_scraper_service.url_collection_model.find_reusable_by_content_hash(
+                    url, page["content_hash"], exclude_id=url_collection_id
+                )
+                if previous is not None:
+                    await self.url_scraper_service.mark_unchanged(url_collection_id, previous, page, from_google_query=True)
+                    continue
+                pages.append({
+                    "google_query_id": google_query_id,
+                    "query": query,
+                    "url_collection_id": url_collection_id,
+                    "url": url,
+                    "page": page,
+                })
+            except Exception as e:
+                logger.exception("Batch mode: scrape failed google_query_id=%s url=%s err=%s", google_query_id, url[:120], e)
+        await self.google_query_model.update_by_id(
+            google_query_id,
+            {"urlCollectionIds": url_collection_ids, "updatedAt": datetime.utcnow()},
+        )
+        return pages
+
+    def _record_usage(self, stage: str, item: Dict[str, Any], result: Dict[str, Any]) -> None:
+        with llm_usage_job(googleQueryId=item["google_query_id"], urlCollectionId=item["url_collection_id"]):
+            record_llm_usage(stage, result.get("model") or self.model_name, result.get("usage"))
+
+    async def _run_extraction_stage(
+        self, run_dir: str, pages: List[Dict[str, Any]], poll_interval: float, timeout: float
+    ) -> None:
+        """
+        One batch with every chunk of every page; sets page["opportunities"] and page["llm_calls"], and
+        page["extraction_error"] when a chunk has no usable result (the page must then not be saved).
+        """
+        requests: List[dict] = []
+        for item in pages:
+            chunks = self.extractor.chunk_content(item["page"]["content"])
+            item["chunk_ids"] = []
+            item["llm_calls"] = len(chunks)
+            for c_idx, chunk in enumerate(chunks):
+                messages = self.extractor.build_chunk_messages(chunk, c_idx, len(chunks), item["url"])
+                request = fingerprinted_request(
+                    f"extract-{item['url_collection_id']}-{c_idx}", self.model_name, messages, self.extractor.TEMPERATURE
+                )
+                item["chunk_ids"].append(request["custom_id"])
+                requests.append(request)
+        if not requests:
+            for item in pages:
+                item["opportunities"] = []
+            return
+        path = write_batch_requests(os.path.join(run_dir, "extract.requests.jsonl"), requests)
+        results = await asyncio.to_thread(run_batch, self.provider, path, poll_interval, timeout)
+        for item in pages:
+            texts = []
+            errors = []
+            for custom_id in item["chunk_ids"]:
+                result = results.get(custom_id)
+                if result is None or result.get("error"):
+                    error = result["error"] if result else "no result in batch output"
+                    logger.warning("Batch extraction error url_collection_id=%s %s: %s", item["url_collection_id"], custom_id, error)
+                    errors.append(error)
+                    continue
+                self._record_usage("extractor.batch", item, result)
+                texts.append(result.get("content"))
+            if errors:
+                item["extraction_error"] = f"{len(errors)}/{len(item['chunk_ids'])} extraction chunk(s) failed: {errors[0]}"
+            item["opportunities"] = self.extractor.merge_chunk_responses(texts)
+
+    async def _run_enrichment_stage(
+        self, run_dir: str, pages: List[Dict[str, Any]], poll_interval: float, timeout: float
+    ) -> None:
+        """Scrape links of incomplete opportunities, enrich them in one batch, merge results in place."""
+        enricher = EventDetailEnricherAgent(rapidapi_scraper=RapidAPIScraper(delay_seconds=self.delay_seconds))
+        requests: List[dict] = []
+        pending: Dict[str, tuple] = {}
+        for item in pages:
+            if item.get("extraction_error"):
+                continue
+            for o_idx, opp in enumerate(item["opportunities"]):
+                prepared = await asyncio.to_thread(enricher.prepare_enrichment, opp)
+                if prepared is None:
+                    continue
+                request = fingerprinted_request(
+                    f"enrich-{item['url_collection_id']}-{o_idx}", self.model_name, prepared["messages"], enricher.TEMPERATURE
+                )
+                pending[request["custom_id"]] = (item, o_idx, prepared["og_url"])
+                requests.append(request)
+        if not requests:
+            return
+        path = write_batch_requests(os.path.join(run_dir, "enrich.requests.jsonl"), requests)
+        results = await asyncio.to_thread(run_batch, self.provider, path, poll_interval, timeout)
+        for custom_id, (item, o_idx, og_url) in pending.items():
+            item["llm_calls"] += 1
+            result = results.get(custom_id) or {}
+            if result.get("error"):
+                logger.warning("Batch enrichment error url_collection_id=%s %s: %s", item["url_collection_id"], custom_id, result["error"])
+                continue
+            self._record_usage("enricher.batch", item, result)
+            item["opportunities"][o_idx] = enricher.apply_enrichment(item["opportunities"][o_idx], result.get("content"), og_url)
+
+    async def process_pending_batch(
+        self,
+        limit: int = 10,
+        poll_interval_seconds: float = BATCH_POLL_INTERVAL_SECONDS,
+        timeout_seconds: float = BATCH_TIMEOUT_SECONDS,
+    ) -> dict:
+        """
+        Claim up to `limit` pending GoogleQueries and process them with batched extraction/enrichment.
+        Returns a summary like GoogleQueryScraperService.process_pending_batch plus page/request counts.
+        """
+        claimed = await self.google_query_model.claim_pending_jobs(limit=limit)
+        summary = {
+            "claimed": len(claimed),
+            "completed": 0,
+            "failed": 0,
+            "skipped_invalid": 0,
+            "pages": 0,
+            "pages_retry": 0,
+            "opportunities_inserted": 0,
+        }
+        if not claimed:
+            return summary
+
+        run_dir = os.path.join(self.work_dir, datetime.utcnow().strftime("%Y%m%dT%H%M%S"))
+        pages: List[Dict[str, Any]] = []
+        active: Dict[str, dict] = {}
+        for doc in claimed:
+            google_query_id = str(doc["_id"])
+            if not (doc.get("query") or "").strip():
+                await self._fail_query(google_query_id, "missing or empty query")
+                summary["skipped_invalid"] += 1
+                continue
+            try:
+                pages.extend(await self._collect_pages(doc))
+                active[google_query_id] = doc
+            except Exception as e:
+                logger.exception("Batch mode: SERP failed google_query_id=%s err=%s", google_query_id, e)
+                await self._fail_query(google_query_id, str(e))
+                summary["failed"] += 1
+        summary["pages"] = len(pages)
+
+        try:
+            await self._run_extraction_stage(run_dir, pages, poll_interval_seconds, timeout_seconds)
+            await self._run_enrichment_stage(run_dir, pages, poll_interval_seconds, timeout_seconds)
+        except Exception as e:
+            logger.exception("Batch mode: LLM batch failed run_dir=%s err=%s", run_dir, e)
+            for item in pages:
+                item.setdefault("extraction_error", f"LLM batch failed: {e}")
+
+        inserted_by_query: Dict[str, int] = defaultdict(int)
+        scraper = RapidAPIScraper(delay_seconds=self.delay_seconds)
+        for item in pages:
+            if item.get("extraction_error"):
+                await self.url_scraper_service.record_job_failure(
+                    item["url_collection_id"],
+                    ScrapeError(item["extraction_error"], retryable=True),
+                    retry_args=self._retry_args(item["query"]),
+                )
+                summary["pages_retry"] += 1
+                continue
+            try:
+                opportunities = item["opportunities"]
+                if opportunities:
+                    await qualify_opportunities_batch_async(
+                        opportunities,
+                        scraper,
+                        item["url"],
+                        item["page"]["content"],
+                    )
+                n = await self.url_scraper_service.save_extraction_result(
+                    item["url_collection_id"],
+                    item["url"],
+                    item["page"],
+                    opportunities,
+                    item.get("llm_calls", 0),
+                    from_google_query=True,
+                    google_search_query=item["query"],
+                )
+                inserted_by_query[item["google_query_id"]] += n
+            except Exception as e:
+                logger.exception("Batch mode: persist failed url_collection_id=%s err=%s", item["url_collection_id"], e)
+                await self.url_scraper_service.record_job_failure(
+                    item["url_collection_id"], e, retry_args=self._retry_args(item["query"])
+                )
+        await flush_llm_usage()
+
+        for google_query_id in active:
+            await self.google_query_model.update_by_id(
+                google_query_id,
+                {"status": "completed", "updatedAt": datetime.utcnow()},
+            )
+            await self.recent_activity_model.try_insert_activity(
+                RECENT_ACTIVITY_TYPE_GOOGLE_QUERIES,
+                MESSAGE_GOOGLE_QUERIES_ADDED,
+            )
+            inserted = inserted_by_query.get(google_query_id, 0)
+            if inserted > 0:
+                await self.recent_activity_model.try_insert_activity(
+                    RECENT_ACTIVITY_TYPE_OPPORTUNITIES,
+                    message_opportunities_added(inserted),
+                )
+            summary["completed"] += 1
+            summary["opportunities_inserted"] += inserted
+        logger.info("Batch mode finished run_dir=%s summary=%s", run_dir, summary)
+        return summary
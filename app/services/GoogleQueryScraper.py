@@ -9,6 +9,7 @@ from app.config.recent_activity import (
     RECENT_ACTIVITY_TYPE_OPPORTUNITIES,
     message_opportunities_added,
 )
+from app.helpers.LLMUsage import llm_usage_job
 from app.helpers.SerpHelper import SerpHelper
 from app.models.GoogleQuery import GoogleQueryModel
 from app.models.RecentActivity import RecentActivityModel
@@ -54,14 +55,19 @@ class GoogleQueryScraperService:
 
         return await self.google_query_model.delete_by_id(google_query_id, user_id=user_id)
 
-    async def get_list(self, user_id: Optional[str] = None, skip: int = 0, limit: int = 100) -> dict:
-        """List GoogleQueries with pagination. Filter by user_id when provided."""
-        items = await self.google_query_model.get_list(user_id=user_id, skip=skip, limit=limit)
-        total = await self.google_query_model.count(user_id=user_id)
+    async def get_list(
+        self, user_id: Optional[str] = None, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> dict:
+        """
+        List GoogleQueries with pagination. Filter by user_id when provided.
+        With cursor (a previous nextCursor) skip is ignored and the page costs the same at any depth.
+        """
+        items, next_cursor = await self.google_query_model.get_page(user_id=user_id, limit=limit, cursor=cursor, skip=skip)
+        total = await self.google_query_model.approximate_count(user_id=user_id)
         # Serialize _id for JSON
         for doc in items:
             doc["_id"] = str(doc["_id"])
-        return {"googleQueries": items, "total": total}
+        return {"googleQueries": items, "total": total, "nextCursor": next_cursor}
 
     async def run_query_serp_and_scrape(self, google_query_id: str, query: str, user_id: Optional[str] = None) -> None:
         logger.info("GoogleQuery background job started google_query_id=%s query=%s", google_query_id, query[:120])
@@ -70,7 +76,7 @@ class GoogleQueryScraperService:
             {"status": "running", "updatedAt": datetime.utcnow(), "error": None},
         )
         try:
-            urls = await asyncio.to_thread(SerpHelper().search, query)
+            urls = await SerpHelper().search_async(query)
             non_pdf = [u for u in (urls or []) if not is_pdf_url(u)]
             top_urls = non_pdf[:GOOGLE_QUERY_TOP_N]
             await self.google_query_model.update_by_id(
@@ -102,13 +108,14 @@ class GoogleQueryScraperService:
                         google_query_id,
                         {"urlCollectionIds": url_collection_ids, "updatedAt": datetime.utcnow()},
                     )
-                    n = await self.url_scraper_service.run_scrape_and_extract(
-                        url_collection_id,
-                        url,
-                        delay_seconds=RAPIDAPI_DELAY_SECONDS,
-                        from_google_query=True,
-                        google_search_query=query,
-                    )
+                    with llm_usage_job(googleQueryId=google_query_id):
+                        n = await self.url_scraper_service.run_scrape_and_extract(
+                            url_collection_id,
+                            url,
+                            delay_seconds=RAPIDAPI_DELAY_SECONDS,
+                            from_google_query=True,
+                            google_search_query=query,
+                        )
                     total_opportunities_inserted += n
                 except Exception as e:
                     logger.exception("GoogleQuery job url failed google_query_id=%s url=%s err=%s", google_query_id, url[:120], e)
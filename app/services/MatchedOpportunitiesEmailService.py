@@ -84,7 +84,7 @@ class MatchedOpportunitiesEmailService:
         POSTMARK-SERVER-API-TOKEN from env.
         Returns True if email was sent, False otherwise (missing profile/email, no opportunities, or Postmark failure).
         """
-        profile = await self.speaker_profile_model.get_profile(speaker_profile_id)
+        profile = await self.speaker_profile_model.get_profile(speaker_profile_id, projection="summary")
         if not profile:
             return False
         to_email = (profile.get("email") or "").strip()
@@ -1,20 +1,105 @@
-"""Service for Opportunities CRUD operations and speaker-based matching via Pinecone."""
+"""
+Service for Opportunities CRUD operations and speaker-based matching via Pinecone.
+List, search and get-by-id read the hot Opportunities collection; include_archived also reads
+OpportunitiesArchive (past events, see OpportunityArchiverService).
+"""
 
 import asyncio
 import os
+import re
 from datetime import date, datetime
 from typing import List
 
+from app.helpers.KeysetPagination import keyset_page_merged
 from app.models.Opportunity import OpportunityModel
+from app.models.OpportunityArchive import OpportunityArchiveModel
 from app.models.SpeakerProfile import SpeakerProfileModel
 from app.models.MatchedOpportunities import MatchedOpportunitiesModel
+from app.helpers.LLMUsage import flush_llm_usage, llm_usage_job
 from app.helpers.PineconeOpportunityStore import PineconeOpportunityStore, OpportunityTextBuilder
 from app.agents.OpportunitySpeakerMatchAgent import OpportunitySpeakerMatchAgent
+from app.services.OpportunityChangeStream import OPPORTUNITY_CHANGE_STREAM_ENABLED
 
 
 # Minimum similarity score (0–1) to consider a match; below 50% we do not consider it matching
 MIN_SIMILARITY_THRESHOLD = 0.4
 
+# Fields a search client may request with fields= (_id is always returned)
+SEARCH_FIELDS = (
+    "link",
+    "event_name",
+    "location",
+    "topics",
+    "start_date",
+    "end_date",
+    "speaking_format",
+    "delivery_mode",
+    "target_audiences",
+    "source",
+    "isQualified",
+    "reasonForUnqualify",
+    "metadata",
+    "createdAt",
+)
+
+
+def _csv(value: str | None) -> list[str]:
+    """Comma-separated query param -> stripped non-empty values."""
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def build_search_filter(
+    topics: str | None = None,
+    speaking_format: str | None = None,
+    delivery_mode: str | None = None,
+    target_audiences: str | None = None,
+    start_date_from: date | None = None,
+    start_date_to: date | None = None,
+    is_qualified: bool | None = None,
+    location: str | None = None,
+    q: str | None = None,
+) -> dict:
+    """
+    Mongo filter for opportunity search. List params are comma-separated and match any value.
+    Dates compare against the stored ISO start_date strings. location is a case-insensitive substring match;
+    q is a $text search over event_name and metadata.description.
+    """
+    query: dict = {}
+    for field, raw in (
+        ("topics", topics),
+        ("speaking_format", speaking_format),
+        ("delivery_mode", delivery_mode),
+        ("target_audiences", target_audiences),
+    ):
+        values = _csv(raw)
+        if values:
+            query[field] = {"$in": values}
+    date_range = {}
+    if start_date_from:
+        date_range["$gte"] = start_date_from.isoformat()
+    if start_date_to:
+        date_range["$lte"] = start_date_to.isoformat()
+    if date_range:
+        query["start_date"] = date_range
+    if is_qualified is not None:
+        query["isQualified"] = is_qualified
+    if location and location.strip():
+        query["location"] = {"$regex": re.escape(location.strip()), "$options": "i"}
+    if q and q.strip():
+        query["$text"] = {"$search": q.strip()}
+    return query
+
+
+def build_search_projection(fields: str | None) -> dict | None:
+    """fields= param -> projection (None = whole document). Raises ValueError on unknown fields."""
+    requested = _csv(fields)
+    if not requested:
+        return None
+    unknown = [f for f in requested if f not in SEARCH_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}; allowed: {', '.join(SEARCH_FIELDS)}")
+    return {f: 1 for f in requested}
+
 
 def _is_future_opportunity(opp: dict) -> bool:
     """True if opportunity has start_date on or after today; otherwise False."""
@@ -36,8 +121,10 @@ class OpportunityService:
         speaker_profile_model: SpeakerProfileModel = None,
         pinecone_store: PineconeOpportunityStore = None,
         matched_opportunities_model: MatchedOpportunitiesModel = None,
+        archive_model: OpportunityArchiveModel = None,
     ):
         self.model = opportunity_model or OpportunityModel()
+        self.archive_model = archive_model or OpportunityArchiveModel()
         self.speaker_profile_model = speaker_profile_model or SpeakerProfileModel()
         self.pinecone_store = pinecone_store or PineconeOpportunityStore()
         self.matched_opportunities_model = matched_opportunities_model or MatchedOpportunitiesModel()
@@ -48,20 +135,84 @@ class OpportunityService:
         limit: int = 10,
         sort_by_start_date: str | None = None,
         sort_by_end_date: str | None = None,
+        cursor: str | None = None,
+        include_archived: bool = False,
     ) -> dict:
-        """List opportunities with pagination. page is 1-based. Optional sort by start_date and/or end_date (asc/desc)."""
-        skip = (page - 1) * limit
+        """
+        List opportunities with pagination. page is 1-based. Optional sort by start_date and/or end_date (asc/desc).
+        Pass the returned nextCursor as cursor (same sort) to fetch the next page at constant cost; page is then ignored.
+        total is the collection's estimated document count. include_archived also lists archived (past) opportunities.
+        """
+        skip = 0 if cursor else (page - 1) * limit
         sort_by = self._build_sort(sort_by_start_date, sort_by_end_date)
-        opportunities = await self.model.get_list(skip=skip, limit=limit, sort_by=sort_by)
-        total = await self.model.count()
+        if include_archived:
+            opportunities, next_cursor = await keyset_page_merged(
+                [self.model.collection, self.archive_model.collection], {}, sort_by, limit, cursor=cursor, skip=skip
+            )
+        else:
+            opportunities, next_cursor = await self.model.get_page(limit=limit, cursor=cursor, skip=skip, sort_by=sort_by)
+        total = await self._approximate_count(None, include_archived)
+        return {
+            "opportunities": opportunities,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "totalPages": (total + limit - 1) // limit if limit > 0 else 0,
+            "nextCursor": next_cursor,
+        }
+
+    async def search_opportunities(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        cursor: str | None = None,
+        sort_by_start_date: str | None = None,
+        fields: str | None = None,
+        include_archived: bool = False,
+        **filters,
+    ) -> dict:
+        """
+        Filtered opportunity list (filters: see build_search_filter), ordered by start_date (asc by default)
+        with keyset pagination: pass the returned nextCursor as cursor with the same filters and sort.
+        fields= limits the returned fields. total is a briefly cached count for the same filters.
+        include_archived also searches archived (past) opportunities.
+        """
+        query = build_search_filter(**filters)
+        projection = build_search_projection(fields)
+        direction = -1 if (sort_by_start_date or "").lower() == "desc" else 1
+        skip = 0 if cursor else (page - 1) * limit
+        if include_archived:
+            opportunities, next_cursor = await keyset_page_merged(
+                [self.model.collection, self.archive_model.collection],
+                query,
+                {"start_date": direction},
+                limit,
+                cursor=cursor,
+                skip=skip,
+                projection=projection,
+            )
+        else:
+            opportunities, next_cursor = await self.model.search_page(
+                query, limit=limit, cursor=cursor, skip=skip, sort_by={"start_date": direction}, projection=projection
+            )
+        total = await self._approximate_count(query, include_archived)
         return {
             "opportunities": opportunities,
             "total": total,
             "page": page,
             "limit": limit,
             "totalPages": (total + limit - 1) // limit if limit > 0 else 0,
+            "nextCursor": next_cursor,
         }
 
+    async def _approximate_count(self, query: dict | None, include_archived: bool) -> int:
+        if not include_archived:
+            return await self.model.approximate_count(query)
+        hot, archived = await asyncio.gather(
+            self.model.approximate_count(query), self.archive_model.approximate_count(query)
+        )
+        return hot + archived
+
     def _build_sort(
         self,
         sort_by_start_date: str | None,
@@ -77,16 +228,25 @@ class OpportunityService:
             return {"_id": -1}
         return order
 
-    async def get_opportunity_by_id(self, opportunity_id: str) -> dict | None:
-        """Get a single opportunity by ID. Returns None if not found."""
+    async def get_opportunity_by_id(self, opportunity_id: str, include_archived: bool = False) -> dict | None:
+        """Get a single opportunity by ID (include_archived: also look in the archive). Returns None if not found."""
         doc = await self.model.get_by_id(opportunity_id)
+        if doc is None and include_archived:
+            doc = await self.archive_model.get_by_id(opportunity_id)
         if doc and doc.get("_id") is not None:
             doc["_id"] = str(doc["_id"])
         return doc
 
     async def delete_opportunity(self, opportunity_id: str) -> bool:
-        """Delete an opportunity by ID. Returns True if deleted."""
-        return await self.model.delete_by_id(opportunity_id)
+        """
+        Delete an opportunity by ID. Returns True if deleted. Its vector and speaker matches are removed here,
+        or by the Opportunities change-stream consumer when OPPORTUNITY_CHANGE_STREAM_ENABLED.
+        """
+        deleted = await self.model.delete_by_id(opportunity_id)
+        if deleted and not OPPORTUNITY_CHANGE_STREAM_ENABLED:
+            await asyncio.to_thread(self.pinecone_store.delete_opportunities, [opportunity_id])
+            await self.matched_opportunities_model.remove_opportunity_ids([opportunity_id])
+        return deleted
 
     async def get_matched_opportunities_for_speaker(
         self,
@@ -101,7 +261,7 @@ class OpportunityService:
         Only opportunities with start_date on or after today are returned (no past opportunities).
         Only matches with similarity score >= min_score (env OPPORTUNITY_MIN_SIMILARITY_SCORE or 0.5) are included.
         """
-        profile = await self.speaker_profile_model.get_profile(speaker_profile_id)
+        profile = await self.speaker_profile_model.get_profile(speaker_profile_id, projection="matching")
         if not profile:
             return []
         if not self.pinecone_store.is_configured():
@@ -168,7 +328,7 @@ class OpportunityService:
                 speaker_profile_id, opportunity_ids
             )
 
-        profile = await self.speaker_profile_model.get_profile(speaker_profile_id)
+        profile = await self.speaker_profile_model.get_profile(speaker_profile_id, projection="matching")
         if not profile:
             await _finish([])
             return
@@ -178,10 +338,12 @@ class OpportunityService:
             return
         agent = match_agent or OpportunitySpeakerMatchAgent()
         filtered = []
-        for opp in opportunities:
-            is_match = await asyncio.to_thread(agent.is_match, profile, opp)
-            if is_match:
-                filtered.append(opp)
+        with llm_usage_job(speakerProfileId=speaker_profile_id):
+            for opp in opportunities:
+                is_match = await asyncio.to_thread(agent.is_match, profile, opp)
+                if is_match:
+                    filtered.append(opp)
+        await flush_llm_usage()
         opportunity_ids = [str(o.get("_id")) for o in filtered if o.get("_id") is not None]
         await _finish(opportunity_ids)
 
@@ -199,8 +361,6 @@ class OpportunityService:
         opportunity_ids = doc.get("opportunities") or []
         if not opportunity_ids:
             return [], status
+        # _id is left as ObjectId: the /matched endpoint renders it directly (Utils.create_fast_response)
         opportunities = await self.model.get_by_ids(opportunity_ids)
-        for opp in opportunities:
-            if opp.get("_id") is not None:
-                opp["_id"] = str(opp["_id"])
         return opportunities, status
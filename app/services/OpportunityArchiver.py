@@ -0,0 +1,105 @@
+"""
+Hot/cold split for Opportunities: moves opportunities whose end_date has passed into OpportunitiesArchive,
+so the Opportunities collection, its indexes and counts stay proportional to upcoming events.
+
+A batch is copied to the archive under the same _id (replace/upsert, so a retried batch is harmless) and then
+deleted from Opportunities if its end_date is still past; anything kept hot (edited meanwhile) is removed from
+the archive again, so a document lives in exactly one collection once a batch completes. An expired document
+whose dedupeKey is already archived (an earlier copy of the same event) is dropped instead of archived twice.
+No multi-document transaction is needed, which keeps standalone servers supported.
+
+Archived ids are deletes for Pinecone and matchedOpportunities: the change-stream consumer handles them when
+OPPORTUNITY_CHANGE_STREAM_ENABLED, otherwise they are removed here.
+Runs every OPPORTUNITY_ARCHIVE_INTERVAL_SECONDS from main (OPPORTUNITY_ARCHIVER_ENABLED) or via
+scripts/archive_expired_opportunities.py. Read APIs see archived documents with include_archived=true.
+"""
+import asyncio
+import logging
+import os
+from datetime import date, timedelta
+from typing import Optional
+
+from app.helpers.PineconeOpportunityStore import PineconeOpportunityStore
+from app.models.MatchedOpportunities import MatchedOpportunitiesModel
+from app.models.Opportunity import OpportunityModel
+from app.models.OpportunityArchive import OpportunityArchiveModel
+from app.services.OpportunityChangeStream import OPPORTUNITY_CHANGE_STREAM_ENABLED
+
+logger = logging.getLogger(__name__)
+
+OPPORTUNITY_ARCHIVER_ENABLED = os.getenv("OPPORTUNITY_ARCHIVER_ENABLED", "true").lower() == "true"
+OPPORTUNITY_ARCHIVE_INTERVAL_SECONDS = float(os.getenv("OPPORTUNITY_ARCHIVE_INTERVAL_SECONDS", "3600"))
+OPPORTUNITY_ARCHIVE_BATCH_SIZE = int(os.getenv("OPPORTUNITY_ARCHIVE_BATCH_SIZE", "500"))
+# Days after end_date before an opportunity is archived (end dates are calendar dates without a timezone)
+OPPORTUNITY_ARCHIVE_GRACE_DAYS = int(os.getenv("OPPORTUNITY_ARCHIVE_GRACE_DAYS", "1"))
+
+
+class OpportunityArchiverService:
+    def __init__(
+        self,
+        opportunity_model: OpportunityModel = None,
+        archive_model: OpportunityArchiveModel = None,
+        pinecone_store: PineconeOpportunityStore = None,
+        matched_opportunities_model: MatchedOpportunitiesModel = None,
+        batch_size: int = OPPORTUNITY_ARCHIVE_BATCH_SIZE,
+        grace_days: int = OPPORTUNITY_ARCHIVE_GRACE_DAYS,
+    ):
+        self.model = opportunity_model or OpportunityModel()
+        self.archive_model = archive_model or OpportunityArchiveModel()
+        self.pinecone_store = pinecone_store or PineconeOpportunityStore()
+        self.matched_opportunities_model = matched_opportunities_model or MatchedOpportunitiesModel()
+        self.batch_size = batch_size
+        self.grace_days = grace_days
+
+    def cutoff(self, today: Optional[date] = None) -> str:
+        """Opportunities with an end_date before this ISO date are archived."""
+        return ((today or date.today()) - timedelta(days=self.grace_days)).isoformat()
+
+    async def archive_batch(self, cutoff: str) -> int:
+        """Move one batch of expired opportunities to the archive. Returns the number moved (0 = nothing left)."""
+        docs = await self.model.get_expired_batch(cutoff, self.batch_size)
+        if not docs:
+            return 0
+        ids = [doc["_id"] for doc in docs]
+        await self.archive_model.upsert_many(docs)
+        kept = await self.model.delete_expired_by_ids(ids, cutoff)
+        if kept:
+            await self.archive_model.delete_by_ids(kept)
+        kept_set = set(kept)
+        moved = [str(oid) for oid in ids if oid not in kept_set]
+        if moved and not OPPORTUNITY_CHANGE_STREAM_ENABLED:
+            # Matches first: a Pinecone outage must not leave archived ids in speakers' matchedOpportunities
+            await self.matched_opportunities_model.remove_opportunity_ids(moved)
+            try:
+                await asyncio.to_thread(self.pinecone_store.delete_opportunities, moved)
+            except Exception as e:
+                logger.warning("Pinecone delete of %d archived opportunity(ies) failed: %s", len(moved), e)
+        return len(moved)
+
+    async def archive_expired(self, max_batches: Optional[int] = None, dry_run: bool = False) -> dict:
+        """
+        Archive expired opportunities batch by batch until none are left (or max_batches ran).
+        Returns {cutoff, batches, archived}; with dry_run nothing is moved and archived is the number that would be.
+        """
+        cutoff = self.cutoff()
+        if dry_run:
+            return {"cutoff": cutoff, "batches": 0, "archived": await self.model.count_expired(cutoff)}
+        batches = archived = 0
+        while max_batches is None or batches < max_batches:
+            moved = await self.archive_batch(cutoff)
+            if not moved:
+                break
+            batches += 1
+            archived += moved
+        if archived:
+            logger.info("Archived %d opportunities with end_date before %s in %d batch(es)", archived, cutoff, batches)
+        return {"cutoff": cutoff, "batches": batches, "archived": archived}
+
+    async def run_archiver_loop(self, interval_seconds: float = OPPORTUNITY_ARCHIVE_INTERVAL_SECONDS) -> None:
+        """Background task started from main: archive expired opportunities every interval_seconds until cancelled."""
+        while True:
+            try:
+                await self.archive_expired()
+            except Exception as e:
+                logger.exception("Opportunity archiver tick failed: %s", e)
+            await asyncio.sleep(interval_seconds)
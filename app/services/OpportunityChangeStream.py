@@ -0,0 +1,209 @@
+"""
+Change-stream consumer for the Opportunities collection: keeps Pinecone and matchedOpportunities in step with
+Mongo, outside the ingestion request path.
+
+- insert / replace: qualified opportunities (isQualified) are embedded and upserted; unqualified ones are
+  removed from the index (a replace can unqualify).
+- update: re-embedded only when an embedded field (EMBEDDED_OPPORTUNITY_FIELDS) or isQualified changed.
+- delete: vectors are deleted and the ids are pulled from every speaker's matchedOpportunities.
+Events are handled in batches (CHANGE_STREAM_BATCH_SIZE events or CHANGE_STREAM_BATCH_MAX_WAIT_MS); the resume
+token is saved in changeStreamTokens after each batch, so a restarted consumer continues where it stopped
+(at-least-once: a batch interrupted before its token was saved is replayed, and upserts / deletes are idempotent).
+A batch whose embedding / Pinecone / Mongo side effects fail is retried with backoff (CHANGE_STREAM_RETRY_DELAY_SECONDS,
+doubling up to CHANGE_STREAM_RETRY_MAX_DELAY_SECONDS) and the token is not advanced past it, so an outage delays
+vector updates instead of dropping them.
+
+Requires a replica set (change streams). Run as its own process: scripts/run_opportunity_change_stream.py.
+With OPPORTUNITY_CHANGE_STREAM_ENABLED=true ingestion and deletes leave vector sync to this consumer.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pymongo.errors import OperationFailure
+
+from app.helpers.PineconeOpportunityStore import EMBEDDED_OPPORTUNITY_FIELDS, PineconeOpportunityStore
+from app.models.ChangeStreamToken import ChangeStreamTokenModel
+from app.models.MatchedOpportunities import MatchedOpportunitiesModel
+from app.models.Opportunity import OpportunityModel
+
+logger = logging.getLogger(__name__)
+
+OPPORTUNITY_CHANGE_STREAM_ENABLED = os.getenv("OPPORTUNITY_CHANGE_STREAM_ENABLED", "false").lower() == "true"
+CHANGE_STREAM_BATCH_SIZE = int(os.getenv("CHANGE_STREAM_BATCH_SIZE", "50"))
+CHANGE_STREAM_BATCH_MAX_WAIT_MS = int(os.getenv("CHANGE_STREAM_BATCH_MAX_WAIT_MS", "1000"))
+CHANGE_STREAM_RETRY_DELAY_SECONDS = float(os.getenv("CHANGE_STREAM_RETRY_DELAY_SECONDS", "5"))
+CHANGE_STREAM_RETRY_MAX_DELAY_SECONDS = float(os.getenv("CHANGE_STREAM_RETRY_MAX_DELAY_SECONDS", "300"))
+CONSUMER_NAME = "opportunities.vector_sync"
+
+# Server error codes meaning the saved resume token can no longer be used
+_RESUME_TOKEN_LOST_CODES = {136, 280, 286}
+
+_WATCH_PIPELINE = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+
+
+def _touches_embedding(change: dict) -> bool:
+    description = change.get("updateDescription") or {}
+    changed = list((description.get("updatedFields") or {}).keys()) + list(description.get("removedFields") or [])
+    roots = {field.split(".", 1)[0] for field in changed}
+    return bool(roots & {*EMBEDDED_OPPORTUNITY_FIELDS, "isQualified"})
+
+
+def plan_batch(changes: List[dict]) -> Dict[str, dict]:
+    """
+    Collapse a batch of change events into the final action per opportunity id:
+    {id: {"action": "upsert", "doc": ...} | {"action": "delete"}}. Later events win.
+    """
+    actions: Dict[str, dict] = {}
+    for change in changes:
+        op = change.get("operationType")
+        oid = str((change.get("documentKey") or {}).get("_id"))
+        if op == "delete":
+            actions[oid] = {"action": "delete", "deleted": True}
+            continue
+        if op == "update" and not _touches_embedding(change):
+            continue
+        doc = change.get("fullDocument")
+        if doc is None:
+            # Deleted before the update was looked up; its delete event follows
+            continue
+        actions[oid] = {"action": "upsert", "doc": doc} if doc.get("isQualified") else {"action": "delete", "deleted": False}
+    return actions
+
+
+class OpportunityChangeStreamConsumer:
+    def __init__(
+        self,
+        opportunity_model: OpportunityModel = None,
+        pinecone_store: PineconeOpportunityStore = None,
+        matched_opportunities_model: MatchedOpportunitiesModel = None,
+        token_model: ChangeStreamTokenModel = None,
+        batch_size: int = CHANGE_STREAM_BATCH_SIZE,
+        batch_max_wait_ms: int = CHANGE_STREAM_BATCH_MAX_WAIT_MS,
+        retry_delay_seconds: float = CHANGE_STREAM_RETRY_DELAY_SECONDS,
+        retry_max_delay_seconds: float = CHANGE_STREAM_RETRY_MAX_DELAY_SECONDS,
+        on_batch: Optional[Callable[[dict], Awaitable[None]]] = None,
+    ):
+        self.opportunity_model = opportunity_model or OpportunityModel()
+        self.pinecone_store = pinecone_store or PineconeOpportunityStore()
+        self.matched_opportunities_model = matched_opportunities_model or MatchedOpportunitiesModel()
+        self.token_model = token_model or ChangeStreamTokenModel()
+        self.batch_size = batch_size
+        self.batch_max_wait_ms = batch_max_wait_ms
+        self.retry_delay_seconds = retry_delay_seconds
+        self.retry_max_delay_seconds = retry_max_delay_seconds
+        # Downstream hook: awaited with each batch summary after the side effects ran
+        self.on_batch = on_batch
+
+    async def process_batch(self, changes: List[dict]) -> dict:
+        """
+        Apply one batch of change events. Returns {events, upserted, deleted, matchesInvalidated}.
+        Raises if any side effect failed (the batch is then not fully applied and must be retried).
+        """
+        actions = plan_batch(changes)
+        upserts = [(oid, a["doc"]) for oid, a in actions.items() if a["action"] == "upsert"]
+        removals = [oid for oid, a in actions.items() if a["action"] == "delete"]
+        deleted_docs = [oid for oid, a in actions.items() if a.get("deleted")]
+        upserted = 0
+        if upserts:
+            upserted = await asyncio.to_thread(self.pinecone_store.upsert_opportunities, upserts, True)
+        if removals:
+            await asyncio.to_thread(self.pinecone_store.delete_opportunities, removals, True)
+        invalidated = 0
+        if deleted_docs:
+            invalidated = await self.matched_opportunities_model.remove_opportunity_ids(deleted_docs)
+        summary = {
+            "events": len(changes),
+            "upserted": upserted,
+            "deleted": len(removals),
+            "matchesInvalidated": invalidated,
+        }
+        if self.on_batch:
+            await self.on_batch(summary)
+        return summary
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Consume until stop is set (or the stream is invalidated). Resumes from the saved token."""
+        stop = stop or asyncio.Event()
+        if not self.pinecone_store.is_configured():
+            logger.warning("Pinecone/OpenAI not configured: vector upserts and deletes will be skipped")
+        while not stop.is_set():
+            token = await self.token_model.get_token(CONSUMER_NAME)
+            try:
+                await self._consume(token, stop)
+                return
+            except OperationFailure as e:
+                if token is not None and e.code in _RESUME_TOKEN_LOST_CODES:
+                    logger.error(
+                        "Resume token for %s is no longer in the oplog (%s); restarting from now. Changes made while "
+                        "the consumer was down are not replayed: run a full vector resync.",
+                        CONSUMER_NAME,
+                        e,
+                    )
+                    await self.token_model.clear_token(CONSUMER_NAME)
+                    continue
+                raise
+
+    async def _apply_with_retry(self, batch: List[dict], stop: asyncio.Event) -> bool:
+        """
+        process_batch until it succeeds, backing off between attempts. Returns False if stop was set while the
+        batch was still failing (the caller must then not save the token, so the batch is replayed on restart).
+        """
+        delay = self.retry_delay_seconds
+        while True:
+            try:
+                summary = await self.process_batch(batch)
+                logger.info("Opportunity change batch: %s", summary)
+                return True
+            except Exception as e:
+                if stop.is_set():
+                    logger.warning("Opportunity change batch (%d events) not applied before stop: %s", len(batch), e)
+                    return False
+                logger.warning(
+                    "Opportunity change batch (%d events) failed, retrying in %.1fs: %s", len(batch), delay, e
+                )
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, self.retry_max_delay_seconds)
+
+    async def _consume(self, token: Optional[dict], stop: asyncio.Event) -> None:
+        async with self.opportunity_model.collection.watch(
+            _WATCH_PIPELINE,
+            full_document="updateLookup",
+            resume_after=token,
+            max_await_time_ms=min(self.batch_max_wait_ms, 1000),
+        ) as stream:
+            logger.info("Watching %s (%s)", self.opportunity_model.collection.name, "resumed" if token else "from now")
+            batch: List[dict] = []
+            batch_started = time.monotonic()
+            saved_token = token
+            if saved_token is None and stream.resume_token is not None:
+                # First run ("from now"): persist the starting point, so a batch that fails before the first save
+                # is replayed after a restart instead of skipped by another "from now"
+                saved_token = stream.resume_token
+                await self.token_model.save_token(CONSUMER_NAME, saved_token)
+            while not stop.is_set() and stream.alive:
+                change = await stream.try_next()
+                if change is not None:
+                    if change.get("operationType") == "invalidate":
+                        logger.warning("Change stream invalidated (collection dropped or renamed)")
+                        break
+                    if not batch:
+                        batch_started = time.monotonic()
+                    batch.append(change)
+                waited_ms = (time.monotonic() - batch_started) * 1000
+                if batch and (len(batch) >= self.batch_size or change is None or waited_ms >= self.batch_max_wait_ms):
+                    if not await self._apply_with_retry(batch, stop):
+                        return
+                    batch = []
+                if not batch and stream.resume_token is not None and stream.resume_token != saved_token:
+                    # Everything read so far is applied; the post-batch token also skips events the pipeline filtered out
+                    saved_token = stream.resume_token
+                    await self.token_model.save_token(CONSUMER_NAME, saved_token)
+            if batch:
+                # Stopped or invalidated mid-batch: apply what was read; the token is left for the replay
+                await self._apply_with_retry(batch, stop)
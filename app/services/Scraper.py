@@ -28,13 +28,13 @@ class ScraperService:
         except Exception as e:
             return {"success": False, "data": None, "error": str(e)}
 
-    async def get_list(self, user_id: str, skip: int = 0, limit: int = 100) -> dict:
+    async def get_list(self, user_id: str, skip: int = 0, limit: int = 100, cursor: str = None) -> dict:
         try:
-            items = await self.scraper_model.get_list(user_id, skip=skip, limit=limit)
-            total = await self.scraper_model.count(user_id)
+            items, next_cursor = await self.scraper_model.get_page(user_id, limit=limit, cursor=cursor, skip=skip)
+            total = await self.scraper_model.approximate_count(user_id)
             return {
                 "success": True,
-                "data": {"scrapers": items, "total": total},
+                "data": {"scrapers": items, "total": total, "nextCursor": next_cursor},
             }
         except Exception as e:
             return {"success": False, "data": None, "error": str(e)}
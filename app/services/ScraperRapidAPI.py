@@ -10,7 +10,7 @@ from urllib.parse import urlparse
 from app.models.Scraper import ScraperModel
 from app.helpers.RapidAPIScraper import RapidAPIScraper
 from app.helpers.SpeakingOpportunityExtractor import SpeakingOpportunityExtractor
-from app.helpers.OpportunityQualifier import qualify_opportunities_batch
+from app.helpers.OpportunityQualifier import qualify_opportunities_batch_async
 
 
 class ScraperRapidAPIService:
@@ -98,7 +98,7 @@ class ScraperRapidAPIService:
             # 2. LLM extract speaking opportunities
             opportunities, llm_error = self.opportunity_extractor.extract(content)
             if opportunities:
-                qualify_opportunities_batch(
+                await qualify_opportunities_batch_async(
                     opportunities,
                     scraper=self.rapidapi_scraper,
                     source_page_url=url,
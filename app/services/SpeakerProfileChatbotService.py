@@ -2,6 +2,7 @@
 Speaker Profile Chatbot Service: LLM-driven create/update via tool calls.
 Flow: user message -> LLM -> tool call -> create/update profile -> ChatSession -> return.
 """
+import asyncio
 import json
 import logging
 import os
@@ -13,6 +14,7 @@ from typing import Any, Dict, List, Optional
 from openai import OpenAI
 from pydantic import EmailStr, TypeAdapter, ValidationError
 
+from app.helpers.LLMUsage import flush_llm_usage, llm_usage_job, tracked_chat_completion
 from app.helpers.SpeakerCredentialsEmail import send_speaker_credentials_email
 from app.helpers.Utilities import Utils
 from app.schemas.User import UserType
@@ -267,6 +269,14 @@ _CONVERSATIONAL_ACK_BEFORE_QUESTION = (
 # Onboarding LLM may only offer catalog rows marked system (plus legacy docs without type).
 _CATALOG_TYPE_FOR_LLM = "system"
 
+# Chat history sent to the model: a rolling summary of older turns plus every turn after it verbatim (at least the
+# last CHATBOT_HISTORY_TURNS); the summary is refreshed once CHATBOT_SUMMARY_BATCH_TURNS turns have fallen out of
+# the window, so at most CHATBOT_HISTORY_TURNS + CHATBOT_SUMMARY_BATCH_TURNS - 1 turns are sent verbatim.
+CHATBOT_HISTORY_TURNS = int(os.getenv("CHATBOT_HISTORY_TURNS", "10"))
+CHATBOT_SUMMARY_BATCH_TURNS = int(os.getenv("CHATBOT_SUMMARY_BATCH_TURNS", "5"))
+# Summary refreshes run as background tasks after the reply; at most one per chat session at a time
+_chat_summary_tasks: Dict[str, asyncio.Task] = {}
+
 # Models may batch catalog saves with later optionals; reinforce one upsert per user answer per catalog step.
 _CATALOG_UPSERT_EACH_USER_TURN = (
     "CATALOG FIELDS — SAVE ON EVERY ANSWER (CRITICAL): For topics, speaking_formats, delivery_mode, and target_audiences, "
@@ -988,7 +998,7 @@ class SpeakerProfileChatbotService:
                     )
         if speaker_profile_id:
             saved_fields = _saved_field_keys_from_doc(profile_doc)
-            profile = await self.profile_model.get_profile(speaker_profile_id)
+            profile = await self.profile_model.get_profile(speaker_profile_id, projection="chat_snapshot")
             if not profile:
                 return {"action": "error", "profile": None, "saved_fields": [], "warnings": warnings}
             merged = self._merge_for_update(profile, profile_doc)
@@ -1052,6 +1062,81 @@ class SpeakerProfileChatbotService:
         message: str,
         chat_session_id: Optional[str] = None,
         user_id: Optional[str] = None,
+    ) -> dict:
+        """One chat turn; LLM usage is attributed to the chat session (id resolved after a new session is created)."""
+        with llm_usage_job(chatSessionId=chat_session_id) as usage_job:
+            result = await self._process_chat(message, chat_session_id=chat_session_id, user_id=user_id)
+            if result.get("chat_session_id"):
+                usage_job["chatSessionId"] = str(result["chat_session_id"])
+            if result.get("speaker_profile_id"):
+                usage_job["speakerProfileId"] = str(result["speaker_profile_id"])
+        await flush_llm_usage()
+        return result
+
+    def _schedule_chat_summary(self, client: OpenAI, session: dict, latest_seq: int) -> None:
+        """
+        Start _refresh_chat_summary as a background task once at least CHATBOT_SUMMARY_BATCH_TURNS turns have left
+        the history window, so the chat reply does not wait for the summary call.
+        """
+        through_seq = latest_seq - CHATBOT_HISTORY_TURNS
+        after_seq = int(session.get("summarizedThroughSeq") or 0)
+        if through_seq - after_seq < CHATBOT_SUMMARY_BATCH_TURNS:
+            return
+        session_id = str(session["_id"])
+        running = _chat_summary_tasks.get(session_id)
+        if running is not None and not running.done():
+            return
+        task = asyncio.create_task(self._refresh_chat_summary(client, session, after_seq, through_seq))
+        _chat_summary_tasks[session_id] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _chat_summary_tasks.get(session_id) is done:
+                del _chat_summary_tasks[session_id]
+
+        task.add_done_callback(_forget)
+
+    async def _refresh_chat_summary(self, client: OpenAI, session: dict, after_seq: int, through_seq: int) -> None:
+        """
+        Fold turns after_seq < seq <= through_seq (plus, for the first summary, the legacy embedded conversation)
+        into the session's rolling summary. Failures keep the previous summary.
+        """
+        try:
+            older = await self.chat_session_model.get_turns_for_summary(session["_id"], after_seq, through_seq)
+            transcript = "\n".join(f"{m.get('role', 'user')}: {m.get('content', '')}" for m in older)
+            completion = await asyncio.to_thread(
+                tracked_chat_completion,
+                client,
+                "chatbot.summary",
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "You maintain a running summary of a speaker-profile onboarding chat. Merge the previous "
+                            "summary with the new messages into one concise summary (under 200 words). Keep which "
+                            "questions were already asked, what the user answered or skipped, and any open requests. "
+                            "Return only the summary text."
+                        ),
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Previous summary:\n{session.get('summary') or '(none)'}\n\nNew messages:\n{transcript}",
+                    },
+                ],
+                temperature=0,
+                timeout=15,
+            )
+            summary = (completion.choices[0].message.content or "").strip()
+            if summary:
+                await self.chat_session_model.update_summary(session["_id"], summary, through_seq)
+        except Exception as e:
+            logger.warning("Chat summary refresh failed for session %s: %s", session.get("_id"), e)
+
+    async def _process_chat(
+        self,
+        message: str,
+        chat_session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> dict:
         """
         Flow:
@@ -1079,15 +1164,21 @@ class SpeakerProfileChatbotService:
         history: List[Dict[str, Any]] = []
 
         if chat_session_id:
-            session = await self.chat_session_model.get_by_id(chat_session_id)
+            session = await self.chat_session_model.get_for_prompt(chat_session_id, CHATBOT_HISTORY_TURNS)
             if session:
                 speaker_profile_id = (session.get("speaker_profile_id") or "").strip() or None
                 if speaker_profile_id:
-                    profile = await self.profile_model.get_profile(speaker_profile_id)
+                    profile = await self.profile_model.get_profile(speaker_profile_id, projection="chat_snapshot")
                     if profile:
                         profile["_id"] = str(profile["_id"])
-                conv = session.get("conversation") or []
-                history = [{"role": m.get("role", "user"), "content": m.get("content", "")} for m in conv]
+                if session.get("summary"):
+                    history.append({
+                        "role": "system",
+                        "content": "Summary of the earlier part of this chat (older messages are not shown): " + session["summary"],
+                    })
+                history.extend(
+                    {"role": m.get("role", "user"), "content": m.get("content", "")} for m in session.get("history") or []
+                )
 
         messages = [*history, {"role": "user", "content": message or ""}]
 
@@ -1421,7 +1512,9 @@ class SpeakerProfileChatbotService:
         tool_results = []
         profile_marked_complete = False
         for _ in range(6):
-            completion = client.chat.completions.create(
+            completion = tracked_chat_completion(
+                client,
+                "chatbot.tool_loop",
                 model="gpt-4o-mini",
                 messages=chat_messages,
                 tools=tools,
@@ -1542,7 +1635,9 @@ class SpeakerProfileChatbotService:
                     "STRICTLY FORBIDDEN: any mention of creating a user account, login, password, sign-in, credentials, temporary password, or that they received an email about an account—only discuss the speaker profile onboarding."
                 )
                 try:
-                    s = client.chat.completions.create(
+                    s = tracked_chat_completion(
+                        client,
+                        "chatbot.reply",
                         model="gpt-4o-mini",
                         messages=chat_messages + [{"role": "user", "content": prompt}],
                         temperature=0.5,
@@ -1570,7 +1665,9 @@ class SpeakerProfileChatbotService:
                     prompt = "How can I assist you today to create a speaker profile? I'll need your email address to get started."
                 if not assistant_content:
                     try:
-                        s = client.chat.completions.create(
+                        s = tracked_chat_completion(
+                            client,
+                            "chatbot.reply",
                             model="gpt-4o-mini",
                             messages=chat_messages + [{"role": "user", "content": prompt}],
                             temperature=0.5,
@@ -1599,8 +1696,10 @@ class SpeakerProfileChatbotService:
         # ChatSession: create if new, else append
         chunk = [{"role": "user", "content": message or ""}, {"role": "assistant", "content": assistant_content}]
         if session:
-            await self.chat_session_model.append_messages(chat_session_id, chunk)
+            seq = await self.chat_session_model.append_messages(chat_session_id, chunk)
             chat_session_id_out = chat_session_id
+            if seq:
+                self._schedule_chat_summary(client, session, seq)
             # If profile was just created and session had no speaker_profile_id, update session
             if profile and action == "created":
                 existing_spid = (session.get("speaker_profile_id") or "").strip()
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Union
 from openai import OpenAI
 
 from app.config.speaker_profile_steps import StepDefinition, get_step_by_name
+from app.helpers.LLMUsage import tracked_chat_completion
 
 
 def _allowed_display(allowed: Optional[List[Any]]) -> List[str]:
@@ -310,7 +311,9 @@ def generate_welcome_message(first_step_question: str) -> str:
     }
 
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "conversation.welcome",
             model="gpt-4o-mini",
             messages=[
                 {
@@ -362,7 +365,9 @@ def generate_transition_message(
             "variation_seed": seed,
         }
         try:
-            completion = client.chat.completions.create(
+            completion = tracked_chat_completion(
+                client,
+                "conversation.transition",
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a helpful conversational assistant. Return ONLY the assistant message text. No JSON. Do not ask any question."},
@@ -393,7 +398,9 @@ def generate_transition_message(
     }
 
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "conversation.transition",
             model="gpt-4o-mini",
             messages=[
                 {
@@ -484,7 +491,9 @@ def generate_recovery_message(
     }
 
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "conversation.recovery",
             model="gpt-4o-mini",
             messages=[
                 {
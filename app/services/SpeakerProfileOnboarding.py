@@ -18,6 +18,7 @@ from app.config.speaker_profile_steps import (
     get_first_step,
     STEPS,
 )
+from app.helpers.LLMUsage import tracked_chat_completion
 
 
 # --- URL validation ---
@@ -327,7 +328,9 @@ Is this meaningful content (real answer, real topics, real text) or gibberish/ra
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "GIBBERISH" if INVALID else "OK" }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_gibberish_check",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. One of: {\"status\": \"VALID\", \"reason_code\": \"OK\"} or {\"status\": \"INVALID\", \"reason_code\": \"GIBBERISH\"}"},
@@ -393,7 +396,9 @@ If the answer is meaningful and related to the question, return VALID.
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": one of {allowed_reason_codes}, "normalized_value": null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_intent",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. No extra text."},
@@ -436,7 +441,9 @@ Your goal: Decide if the content is meaningful (not gibberish, random, or spam).
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": one of {allowed_reason_codes}, "normalized_value": array of strings or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_topics_normalize",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. When status is VALID, normalized_value must be a JSON array of strings, e.g. [\"Environment\"], even for a single topic."},
@@ -506,7 +513,9 @@ Extract the person's full name based on user intent. Return it as normalized_val
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "OK" | "REFUSAL" | "INVALID_FULL_NAME", "normalized_value": "Extracted Full Name" or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_full_name_extract",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. Judge user intent: accept any capitalization (e.g. Mike tyson, mike tyson). When status is VALID, normalized_value must be the extracted full name with standard capitalization (First Last). Reject only for REFUSAL or when both first and last are not real-looking names (gibberish). When INVALID, use reason_code REFUSAL if user declined, else INVALID_FULL_NAME. normalized_value must be null when INVALID."},
@@ -543,7 +552,9 @@ Extract the single email address from the text and return it.
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "OK" | "REFUSAL" | "INVALID_EMAIL", "normalized_value": "extracted@email.com" or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_email_extract",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. Extract the email the user gave. Use reason_code REFUSAL when user declines to share; INVALID_EMAIL when no email found. Do not judge if it is temporary or disposable. When status is VALID, normalized_value must be the single extracted email string, lowercase. When INVALID, normalized_value must be null."},
@@ -577,7 +588,9 @@ Decide if they are skipping, deferring to later, or have none to share (e.g. "I'
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "INVALID_URL", "refusal": true only when status is VALID and they declined/deferred }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_linkedin_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. If user skips, defers to profile update later, or has no social URLs, return {\"status\": \"VALID\", \"reason_code\": \"REFUSAL\", \"refusal\": true}. If gibberish or failed URL attempt without clear skip intent, return {\"status\": \"INVALID\", \"reason_code\": \"INVALID_URL\"}. No other fields."},
@@ -608,7 +621,9 @@ Decide if they are declining or have none (e.g. "I don't have any", "I prefer no
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "EMPTY", "refusal": true only when status is VALID and they declined or have none }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_past_speaking_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. If user declines or has no examples, return {\"status\": \"VALID\", \"reason_code\": \"REFUSAL\", \"refusal\": true}. If they provided examples/events, return {\"status\": \"INVALID\", \"reason_code\": \"EMPTY\"}. No other fields."},
@@ -639,7 +654,9 @@ Decide if they are declining or have none (e.g. "I don't have any", "I prefer no
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "INVALID_URL", "refusal": true only when status is VALID and they declined or have none }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_video_links_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. If user declines or has no videos, return {\"status\": \"VALID\", \"reason_code\": \"REFUSAL\", \"refusal\": true}. If they provided URL(s), return {\"status\": \"INVALID\", \"reason_code\": \"INVALID_URL\"}. No other fields."},
@@ -670,7 +687,9 @@ Decide if they are declining or have none (e.g. "I don't have any", "I prefer no
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "EMPTY", "refusal": true only when status is VALID and they declined or have none }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_testimonial_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. If user declines or has no testimonials, return {\"status\": \"VALID\", \"reason_code\": \"REFUSAL\", \"refusal\": true}. If they provided testimonials, return {\"status\": \"INVALID\", \"reason_code\": \"EMPTY\"}. No other fields."},
@@ -701,7 +720,9 @@ Decide if they are skipping or deferring (e.g. "skip", "none", "prefer not", "la
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "EMPTY", "refusal": true only when status is VALID and they skipped }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_talk_description_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. Skip/defer → {\"status\":\"VALID\",\"reason_code\":\"REFUSAL\",\"refusal\":true}. Otherwise → {\"status\":\"INVALID\",\"reason_code\":\"EMPTY\"}."},
@@ -739,7 +760,9 @@ The user was asked to describe their talk or speaking expertise. They replied:
 Return JSON ONLY, no markdown.
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_talk_description_title_overview",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. For VALID, both title and overview must be non-empty strings."},
@@ -777,7 +800,9 @@ Decide if they are skipping (e.g. "skip", "none", "prefer not", "later", "no tak
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "REFUSAL" | "EMPTY", "refusal": true only when VALID and skipped }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_key_takeaways_refusal",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. Skip → {\"status\":\"VALID\",\"reason_code\":\"REFUSAL\",\"refusal\":true}. Else → {\"status\":\"INVALID\",\"reason_code\":\"EMPTY\"}."},
@@ -812,7 +837,9 @@ The user was asked to share testimonials (quotes or feedback) from past speaking
 Return JSON ONLY: {{"status":"VALID","reason_code":"OK","items":["..."]}} or INVALID as above.
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validate_and_extract_testimonials",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. items must be a non-empty array of strings when status is VALID."},
@@ -856,7 +883,9 @@ The user was asked what key takeaways audiences get from their talks. They repli
 Return JSON ONLY: {{"status":"VALID","reason_code":"OK","items":["..."]}} or INVALID as above.
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validate_and_extract_key_takeaways",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. items must be non-empty when VALID."},
@@ -899,7 +928,9 @@ User text:
 
 Return JSON ONLY with shape {schema_hint}. One object per distinct engagement. Use empty string for unknown optional fields. If nothing extractable, return {{"entries": []}}."""
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.extract_past_speaking_structured",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY valid JSON with an 'entries' array. No markdown."},
@@ -938,7 +969,9 @@ Both the first name AND the last name (or every part of the name) must look like
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": "INVALID_FULL_NAME" if INVALID else "OK" }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_full_name_check",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. One of: {\"status\": \"VALID\", \"reason_code\": \"OK\"} or {\"status\": \"INVALID\", \"reason_code\": \"INVALID_FULL_NAME\"}"},
@@ -979,7 +1012,9 @@ Return INVALID only for: empty, gibberish, spam, or completely unrelated input.
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": one of {allowed_reason_codes}, "normalized_value": array of strings from allowed values, or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_enum_intent",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. normalized_value must be a subset of the allowed values when VALID."},
@@ -1033,7 +1068,9 @@ Return INVALID only for: empty, gibberish, spam, or completely unrelated input.
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": one of {allowed_reason_codes}, "normalized_value": array of topic names from allowed list, or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_enum_intent_topics",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. normalized_value must be a subset of the allowed topic names when VALID."},
@@ -1088,7 +1125,9 @@ Return INVALID only for: empty, gibberish, spam, or completely unrelated input.
 Return JSON ONLY: {{ "status": "VALID" | "INVALID", "reason_code": one of {allowed_reason_codes}, "normalized_value": array of audience names from allowed list, or null }}
 """
     try:
-        completion = client.chat.completions.create(
+        completion = tracked_chat_completion(
+            client,
+            "onboarding.validation_enum_intent_target_audiences",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY JSON. normalized_value must be a subset of the allowed audience names when VALID."},
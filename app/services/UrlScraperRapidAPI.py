@@ -5,10 +5,18 @@ No connection with existing Scraper/Scrapers collection.
 Blocking I/O (RapidAPI requests, OpenAI) runs in a thread pool to avoid blocking the event loop.
 PDF URLs are not scraped. Only opportunities with all required fields (link, event_name, location, topics, start_date, end_date, speaking_format, delivery_mode, target_audiences) are saved.
 Qualified opportunities (isQualified) are upserted to Pinecone; unqualified are Mongo-only with reasonForUnqualify.
+Each scrape stores a normalized contentHash and the opportunityIds it produced; when a re-scrape of the same url
+has the same hash, extraction/enrichment/qualification are skipped and the job is marked "unchanged".
+Every finished scrape is recorded in the urlFreshness index under its canonical URL; a job for a URL that any
+job scraped within URL_FRESHNESS_WINDOW_SECONDS links to that result ("reused") without scraping at all.
+Failed jobs are classified (app.helpers.RetryPolicy): permanent errors -> "failed"; retryable ones (429, 5xx,
+timeouts) -> "retry_scheduled" with nextAttemptAt (exponential backoff + jitter), picked up by run_retry_worker_loop,
+and "dead_letter" once SCRAPE_RETRY_MAX_ATTEMPTS attempts have failed.
 """
+import os
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -19,18 +27,41 @@ from app.config.recent_activity import (
     message_opportunities_added,
 )
 from app.models.UrlCollection import UrlCollectionModel
-from app.models.Opportunity import OpportunityModel, opportunity_dedupe_key
+from app.models.UrlFreshness import UrlFreshnessModel
+from app.models.Opportunity import OpportunityModel
 from app.models.RecentActivity import RecentActivityModel
+from app.helpers.ContentFingerprint import normalized_content_hash
+from app.helpers.LLMUsage import flush_llm_usage, llm_usage_job
+from app.helpers.Crawler import Crawler
+from app.helpers.SiteDiscovery import SiteDiscovery
 from app.helpers.RapidAPIScraper import RapidAPIScraper
+from app.helpers.RetryPolicy import (
+    SCRAPE_RETRY_CLAIM_TIMEOUT_SECONDS,
+    SCRAPE_RETRY_MAX_ATTEMPTS,
+    ScrapeError,
+    backoff_delay_seconds,
+    is_retryable_exception,
+)
 from app.helpers.SpeakingOpportunityExtractor import SpeakingOpportunityExtractor
-from app.helpers.SerpHelper import SerpHelper
+from app.helpers.SerpHelper import SerpHelper, close_loop_serp_session
+from app.helpers.UrlCanonical import canonicalize_url
 from app.helpers.PineconeOpportunityStore import PineconeOpportunityStore
-from app.helpers.OpportunityQualifier import qualify_opportunities_batch
+from app.services.OpportunityChangeStream import OPPORTUNITY_CHANGE_STREAM_ENABLED
+from app.helpers.OpportunityQualifier import qualify_opportunities_batch_async
 from app.agents.EventDetailEnricherAgent import EventDetailEnricherAgent
 
 RAPIDAPI_DELAY_SECONDS = 5
 TEDX_CRON_QUERY = "Ted X opportunities"
 TEDX_CRON_TOP_N = 5
+# Jobs for a URL scraped (by any job/user) within this window link to that result instead of re-scraping.
+URL_FRESHNESS_WINDOW_SECONDS = int(os.getenv("URL_FRESHNESS_WINDOW_SECONDS", str(24 * 60 * 60)))
+# UrlCollection statuses whose opportunityIds/topics can be linked to by later jobs; the job must also carry
+# extractionOk (set only after a successful extraction, so jobs completed before extraction errors were raised
+# are never reused)
+REUSABLE_STATUSES = ("completed", "unchanged", "reused")
+# Retry worker: due retries claimed per tick and seconds between ticks
+SCRAPE_RETRY_BATCH_SIZE = int(os.getenv("SCRAPE_RETRY_BATCH_SIZE", "5"))
+SCRAPE_RETRY_POLL_SECONDS = float(os.getenv("SCRAPE_RETRY_POLL_SECONDS", "60"))
 
 logger = logging.getLogger(__name__)
 
@@ -81,28 +112,25 @@ def filter_complete_opportunities(opportunities: List[Dict[str, Any]]) -> List[D
     return result
 
 
-def _sync_scrape_extract_enrich(url: str, delay_seconds: float = 0) -> Optional[dict]:
+def _sync_scrape_page(url: str, delay_seconds: float = 0) -> dict:
     """
-    Synchronous scrape + LLM extract + enrich. Runs in thread pool to avoid blocking event loop.
-    Returns dict with keys: source_name, description, opportunities; or None on failure.
-    Does not scrape URLs that end with .pdf.
-
-    Args:
-        url: URL to scrape
-        delay_seconds: Optional delay before each RapidAPI call (e.g. 5 to avoid rate limits). Default 0.
+    Synchronous RapidAPI scrape only (no LLM). Runs in thread pool.
+    Returns dict with keys: source_name, description, content, content_hash.
+    Raises ScrapeError on failure (retryable for 429/5xx/timeouts). Does not scrape URLs that end with .pdf.
     """
     if is_pdf_url(url):
-        return None
+        raise ScrapeError("PDF URLs are not scraped", retryable=False)
     scraper = RapidAPIScraper(delay_seconds=delay_seconds)
-    extractor = SpeakingOpportunityExtractor()
-    enricher = EventDetailEnricherAgent(rapidapi_scraper=scraper)
-
     result = scraper.scrape(url)
     if not result.get("success"):
-        return None
+        raise ScrapeError(
+            result.get("error") or "Scrape failed",
+            retryable=bool(result.get("retryable")),
+            status_code=result.get("status_code"),
+        )
     content = result.get("data", {}).get("content", "")
     if not content:
-        return None
+        raise ScrapeError("No content returned from scraper", retryable=False)
     data = result.get("data", {})
     source_name = data.get("name") or ""
     if not source_name:
@@ -113,20 +141,33 @@ def _sync_scrape_extract_enrich(url: str, delay_seconds: float = 0) -> Optional[
         description = source_name or DESCRIPTION_FALLBACK
     if len(description) > DESCRIPTION_MAX_LENGTH:
         description = description[:DESCRIPTION_MAX_LENGTH] + "..."
+    return {
+        "source_name": source_name,
+        "description": description,
+        "content": content,
+        "content_hash": normalized_content_hash(content),
+    }
+
 
-    opportunities, llm_error = extractor.extract(content)
-    if llm_error and not opportunities:
-        logger.warning("LLM extraction error: %s", llm_error)
+def _sync_extract_enrich(url: str, content: str, delay_seconds: float = 0) -> dict:
+    """
+    Synchronous LLM extract + enrich for already scraped content. Runs in thread pool; the caller qualifies the
+    result with qualify_opportunities_batch_async on its own loop.
+    Returns dict with keys: opportunities, llm_calls (extraction chunks + enrichment calls made).
+    Extraction errors (OpenAI rate limit, timeout, missing key) propagate so the job is retried or failed,
+    never saved as completed with its contentHash.
+    """
+    scraper = RapidAPIScraper(delay_seconds=delay_seconds)
+    extractor = SpeakingOpportunityExtractor()
+    enricher = EventDetailEnricherAgent(rapidapi_scraper=scraper)
+
+    llm_calls = len(extractor.chunk_content(content))
+    opportunities = extractor.extract_or_raise(content, source_url=url)
     if opportunities:
+        llm_calls += sum(1 for o in opportunities if enricher.needs_enrichment(o))
         opportunities = enricher.enrich_opportunities(opportunities)
-        qualify_opportunities_batch(
-            opportunities,
-            scraper=scraper,
-            source_page_url=url,
-            source_page_content=content,
-        )
 
-    return {"source_name": source_name, "description": description, "opportunities": opportunities or []}
+    return {"opportunities": opportunities or [], "llm_calls": llm_calls}
 
 
 class UrlScraperRapidAPIService:
@@ -137,6 +178,7 @@ class UrlScraperRapidAPIService:
 
     def __init__(self):
         self.url_collection_model = UrlCollectionModel()
+        self.url_freshness_model = UrlFreshnessModel()
         self.opportunity_model = OpportunityModel()
         self.enricher_agent = EventDetailEnricherAgent()
         self.recent_activity_model = RecentActivityModel()
@@ -151,6 +193,7 @@ class UrlScraperRapidAPIService:
             raise ValueError("PDF URLs are not scraped")
         doc = {
             "url": url,
+            "canonicalUrl": canonicalize_url(url),
             "status": "pending",
             "createdAt": datetime.utcnow(),
         }
@@ -162,15 +205,107 @@ class UrlScraperRapidAPIService:
         logger.info("UrlCollection created url_collection_id=%s url=%s", inserted_id, url[:80])
         return inserted_id
 
+    async def crawl_and_enqueue(
+        self,
+        root_url: str,
+        max_depth: int,
+        max_urls: int,
+        user_id: str = None,
+        topics: Optional[list] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Crawl the root URL's site (concurrent frontier, see app.helpers.Crawler) and create one pending
+        UrlCollection job per discovered non-PDF page. Returns [{urlCollectionId, url}]; run them with run_crawl_jobs.
+        """
+        urls = await Crawler().hybrid_crawl_async(root_url, max_depth, max_urls)
+        jobs: List[Dict[str, str]] = []
+        for url in urls:
+            if is_pdf_url(url):
+                continue
+            url_collection_id = await self.create_url_scrape_job(url, user_id=user_id, topics=topics)
+            jobs.append({"urlCollectionId": url_collection_id, "url": url})
+        logger.info("Crawl of %s queued %d UrlCollection job(s)", root_url[:80], len(jobs))
+        return jobs
+
+    async def discover_and_enqueue(
+        self,
+        domain: str,
+        max_urls: int,
+        since_days: int,
+        user_id: str = None,
+        topics: Optional[list] = None,
+    ) -> Dict[str, Any]:
+        """
+        Discover event/CFP pages of domain from robots.txt, sitemaps and RSS/Atom feeds (app.helpers.SiteDiscovery)
+        and create pending UrlCollection jobs only for new or changed URLs: never scraped, or lastmod newer than
+        the urlFreshness lastScrapedAt. URLs that already have a pending job are skipped.
+        Returns {discovered, skipped, jobs: [{urlCollectionId, url, reuseFresh}]}; run jobs with run_crawl_jobs.
+        """
+        discovered = await SiteDiscovery(max_urls=max_urls, since_days=since_days).discover(domain)
+        canonical_urls = [d.canonical_url for d in discovered]
+        last_scraped = await self.url_freshness_model.get_last_scraped(canonical_urls)
+        pending = await self.url_collection_model.find_pending_canonical_urls(canonical_urls)
+
+        jobs: List[Dict[str, Any]] = []
+        skipped = 0
+        for item in discovered:
+            scraped_at = last_scraped.get(item.canonical_url)
+            unchanged = scraped_at is not None and (item.lastmod is None or item.lastmod <= scraped_at)
+            if item.canonical_url in pending or unchanged or is_pdf_url(item.url):
+                skipped += 1
+                continue
+            url_collection_id = await self.create_url_scrape_job(item.url, user_id=user_id, topics=topics)
+            # Changed since the last scrape: do not link to that (stale) result
+            jobs.append({"urlCollectionId": url_collection_id, "url": item.url, "reuseFresh": scraped_at is None})
+        logger.info(
+            "Discovery of %s: %d url(s) found, %d queued, %d skipped (pending/unchanged)",
+            domain[:80], len(discovered), len(jobs), skipped,
+        )
+        return {"discovered": len(discovered), "skipped": skipped, "jobs": jobs}
+
+    async def crawl_and_run(self, root_url: str, max_depth: int, max_urls: int, user_id: str = None, topics: Optional[list] = None) -> None:
+        """Background task for POST /crawl: crawl_and_enqueue, then run_crawl_jobs on the queued jobs."""
+        try:
+            jobs = await self.crawl_and_enqueue(root_url, max_depth, max_urls, user_id=user_id, topics=topics)
+            if jobs:
+                await self.run_crawl_jobs(jobs)
+        except Exception as e:
+            logger.exception("Crawl of %s failed: %s", root_url[:80], e)
+
+    async def discover_and_run(self, domain: str, max_urls: int, since_days: int, user_id: str = None, topics: Optional[list] = None) -> None:
+        """Background task for POST /discover: discover_and_enqueue, then run_crawl_jobs on the queued jobs."""
+        try:
+            result = await self.discover_and_enqueue(domain, max_urls, since_days, user_id=user_id, topics=topics)
+            if result["jobs"]:
+                await self.run_crawl_jobs(result["jobs"])
+        except Exception as e:
+            logger.exception("Discovery of %s failed: %s", domain[:80], e)
+
+    async def run_crawl_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """Background task: scrape+extract crawl/discovery jobs one by one (RapidAPI rate limit). Returns opportunities inserted."""
+        total = 0
+        for i, job in enumerate(jobs):
+            total += await self.run_scrape_and_extract(
+                job["urlCollectionId"],
+                job["url"],
+                delay_seconds=RAPIDAPI_DELAY_SECONDS if i > 0 else 0,
+                reuse_fresh=job.get("reuseFresh", True),
+            )
+        logger.info("Crawl jobs finished: %d job(s), %d opportunity(ies) inserted", len(jobs), total)
+        return total
+
     async def get_url_collection_by_id(self, url_collection_id: str, user_id: str = None):
         """Get a UrlCollection entry by ID."""
         return await self.url_collection_model.get_by_id(url_collection_id, user_id)
 
-    async def get_list(self, skip: int = 0, limit: int = 100) -> dict:
-        """Get list of UrlCollection entries (for get-all-scrapers). No user filter."""
-        items = await self.url_collection_model.get_list(user_id=None, skip=skip, limit=limit)
-        total = await self.url_collection_model.count(user_id=None)
-        return {"success": True, "data": {"scrapers": items, "total": total}}
+    async def get_list(self, skip: int = 0, limit: int = 100, cursor: str = None) -> dict:
+        """
+        Get list of UrlCollection entries (for get-all-scrapers). No user filter.
+        With cursor (a previous nextCursor) skip is ignored and the page costs the same at any depth.
+        """
+        items, next_cursor = await self.url_collection_model.get_page(user_id=None, limit=limit, cursor=cursor, skip=skip)
+        total = await self.url_collection_model.approximate_count(user_id=None)
+        return {"success": True, "data": {"scrapers": items, "total": total, "nextCursor": next_cursor}}
 
     async def get_by_id(self, url_collection_id: str, user_id: str) -> dict:
         """Get a single UrlCollection by ID (for get-scraper)."""
@@ -193,6 +328,7 @@ class UrlScraperRapidAPIService:
         delay_seconds: float = 0,
         from_google_query: bool = False,
         google_search_query: str = "",
+        reuse_fresh: bool = True,
     ) -> int:
         """
         Background task: scrape URL via RapidAPI, extract opportunities via LLM,
@@ -209,6 +345,7 @@ class UrlScraperRapidAPIService:
             from_google_query: If True, opportunities are tagged as found via Google query search; if False, from direct URL scraping.
             Per-URL recent-activity for scraper/opportunities is skipped when True; the caller aggregates one opportunities row.
             google_search_query: When from_google_query is True, the SERP query string (stored on source and included in vector search text).
+            reuse_fresh: If True, link to a result of the same canonical URL scraped within URL_FRESHNESS_WINDOW_SECONDS instead of scraping.
         """
         logger.info("Background job started url_collection_id=%s url=%s", url_collection_id, url[:80])
         try:
@@ -216,142 +353,375 @@ class UrlScraperRapidAPIService:
                 logger.info("Skipping PDF URL url_collection_id=%s", url_collection_id)
                 await self.url_collection_model.update_by_id(url_collection_id, {"status": "failed"})
                 return 0
+            if reuse_fresh and await self.link_fresh_result(url_collection_id, url, from_google_query):
+                return 0
             # Run blocking work (RapidAPI, OpenAI, enricher) in thread pool - prevents blocking event loop
-            parsed = await asyncio.to_thread(_sync_scrape_extract_enrich, url, delay_seconds)
-            if parsed is None:
-                logger.error("Job %s scrape/extract failed", url_collection_id)
-                await self.url_collection_model.update_by_id(url_collection_id, {"status": "failed"})
+            page = await asyncio.to_thread(_sync_scrape_page, url, delay_seconds)
+
+            previous = await self.url_collection_model.find_reusable_by_content_hash(
+                url, page["content_hash"], exclude_id=url_collection_id
+            )
+            if previous is not None:
+                await self.mark_unchanged(url_collection_id, previous, page, from_google_query)
                 return 0
 
-            source_name = parsed["source_name"]
-            description = parsed["description"]
-            opportunities = parsed["opportunities"]
-
-            complete = filter_complete_opportunities(opportunities)
-            dropped = len(opportunities) - len(complete)
-            if dropped:
-                logger.info("Job %s: dropped %d opportunities missing required fields (link, event_name, location, topics, start_date, end_date, speaking_format, delivery_mode, target_audiences)", url_collection_id, dropped)
-
-            # Unique topics from saved opportunities, for UrlCollection
-            extracted_topics = sorted(
-                set(
-                    str(t).strip()
-                    for opp in complete
-                    for t in (opp.get("topics") or [])
-                    if t and str(t).strip()
+            with llm_usage_job(urlCollectionId=url_collection_id):
+                extracted = await asyncio.to_thread(_sync_extract_enrich, url, page["content"], delay_seconds)
+            await flush_llm_usage()
+            opportunities = extracted["opportunities"]
+            llm_calls = extracted["llm_calls"]
+            if opportunities:
+                await qualify_opportunities_batch_async(
+                    opportunities,
+                    scraper=RapidAPIScraper(delay_seconds=delay_seconds),
+                    source_page_url=url,
+                    source_page_content=page["content"],
+                )
+
+            return await self.save_extraction_result(
+                url_collection_id,
+                url,
+                page,
+                opportunities,
+                llm_calls,
+                from_google_query=from_google_query,
+                google_search_query=google_search_query,
+            )
+        except Exception as e:
+            logger.exception("Job %s failed: %s", url_collection_id, e)
+            await self.record_job_failure(
+                url_collection_id,
+                e,
+                retry_args={
+                    "delaySeconds": delay_seconds,
+                    "fromGoogleQuery": from_google_query,
+                    "googleSearchQuery": google_search_query,
+                },
+            )
+            return 0
+
+    async def record_job_failure(self, url_collection_id: str, error: BaseException, retry_args: dict = None) -> str:
+        """
+        Count a failed attempt and set the job status: "failed" (permanent error), "retry_scheduled" with
+        nextAttemptAt (retryable; exponential backoff + jitter) or "dead_letter" after SCRAPE_RETRY_MAX_ATTEMPTS.
+        retry_args (delaySeconds, fromGoogleQuery, googleSearchQuery) are kept so the retry runs like the original.
+        Returns the new status.
+        """
+        retryable = is_retryable_exception(error)
+        attempts = await self.url_collection_model.increment_attempts(url_collection_id)
+        now = datetime.utcnow()
+        update = {
+            "lastError": str(error)[:500],
+            "lastErrorRetryable": retryable,
+            "lastAttemptAt": now,
+        }
+        if not retryable:
+            update["status"] = "failed"
+        elif attempts >= SCRAPE_RETRY_MAX_ATTEMPTS:
+            update["status"] = "dead_letter"
+            update["deadLetteredAt"] = now
+        else:
+            update["status"] = "retry_scheduled"
+            update["nextAttemptAt"] = now + timedelta(seconds=backoff_delay_seconds(attempts))
+            if retry_args:
+                update["retryArgs"] = retry_args
+        await self.url_collection_model.update_by_id(url_collection_id, update)
+        logger.info(
+            "Job %s attempt %d failed (retryable=%s) -> %s%s",
+            url_collection_id,
+            attempts,
+            retryable,
+            update["status"],
+            f" at {update['nextAttemptAt']:%Y-%m-%d %H:%M:%S}" if "nextAttemptAt" in update else "",
+        )
+        return update["status"]
+
+    async def process_due_retries(self, limit: int = SCRAPE_RETRY_BATCH_SIZE) -> dict:
+        """
+        Claim up to `limit` jobs whose nextAttemptAt has passed and re-run them one after another,
+        with RAPIDAPI_DELAY_SECONDS between jobs so retries do not burst against the providers.
+        An expired claim (worker died during the attempt) counts as a failed attempt: the job is rescheduled
+        with backoff, or dead-lettered after SCRAPE_RETRY_MAX_ATTEMPTS, instead of being re-run at once.
+        """
+        claimed = await self.url_collection_model.claim_due_retries(limit, SCRAPE_RETRY_CLAIM_TIMEOUT_SECONDS)
+        summary = {"claimed": len(claimed), "opportunities_inserted": 0, "expired_claims": 0}
+        for i, doc in enumerate(claimed):
+            args = doc.get("retryArgs") or {}
+            if doc.get("status") == "retrying":
+                summary["expired_claims"] += 1
+                await self.record_job_failure(
+                    str(doc["_id"]),
+                    ScrapeError("Retry claim expired (worker stopped during the attempt)", retryable=True),
+                    retry_args=args,
                 )
+                continue
+            delay = max(float(args.get("delaySeconds") or 0), RAPIDAPI_DELAY_SECONDS if i > 0 else 0)
+            summary["opportunities_inserted"] += await self.run_scrape_and_extract(
+                str(doc["_id"]),
+                doc["url"],
+                delay_seconds=delay,
+                from_google_query=bool(args.get("fromGoogleQuery")),
+                google_search_query=args.get("googleSearchQuery") or "",
+            )
+        if claimed:
+            logger.info("Retry worker: %s", summary)
+        return summary
+
+    async def run_retry_worker_loop(self, interval_seconds: float = SCRAPE_RETRY_POLL_SECONDS) -> None:
+        """Background task started from main: process due retries every interval_seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.process_due_retries()
+            except Exception as e:
+                logger.exception("Retry worker tick failed: %s", e)
+
+    async def get_dead_letter_jobs(self, skip: int = 0, limit: int = 100, cursor: str = None) -> dict:
+        """UrlCollection jobs that exhausted their retry attempts."""
+        items, next_cursor = await self.url_collection_model.get_page(status="dead_letter", limit=limit, cursor=cursor, skip=skip)
+        total = await self.url_collection_model.approximate_count(status="dead_letter")
+        return {"success": True, "data": {"scrapers": items, "total": total, "nextCursor": next_cursor}}
+
+    async def requeue_job(self, url_collection_id: str) -> dict:
+        """Move a dead-lettered or failed job back to retry_scheduled (attempts reset, due now)."""
+        requeued = await self.url_collection_model.requeue(url_collection_id)
+        if not requeued:
+            return {"success": False, "data": None, "error": "Scraper not found or not failed/dead-lettered"}
+        return {"success": True, "data": "Scraper requeued"}
+
+    async def save_extraction_result(
+        self,
+        url_collection_id: str,
+        url: str,
+        page: dict,
+        opportunities: List[Dict[str, Any]],
+        llm_calls: int = 0,
+        from_google_query: bool = False,
+        google_search_query: str = "",
+    ) -> int:
+        """
+        Persist extracted (enriched + qualified) opportunities for one scraped page: update UrlCollection,
+        dedupe against Mongo and within the batch, insert, upsert qualified ones to Pinecone,
+        then point the urlFreshness entry for the url at this job.
+        Shared by run_scrape_and_extract and the offline batch extraction mode. Returns inserted count.
+        """
+        inserted = await self._save_extraction_result(
+            url_collection_id, url, page, opportunities, llm_calls, from_google_query, google_search_query
+        )
+        await self._touch_freshness(url, url_collection_id)
+        return inserted
+
+    async def _save_extraction_result(
+        self,
+        url_collection_id: str,
+        url: str,
+        page: dict,
+        opportunities: List[Dict[str, Any]],
+        llm_calls: int,
+        from_google_query: bool,
+        google_search_query: str,
+    ) -> int:
+        source_name = page["source_name"]
+        description = page["description"]
+        content_hash = page["content_hash"]
+
+        complete = filter_complete_opportunities(opportunities)
+        dropped = len(opportunities) - len(complete)
+        if dropped:
+            logger.info("Job %s: dropped %d opportunities missing required fields (link, event_name, location, topics, start_date, end_date, speaking_format, delivery_mode, target_audiences)", url_collection_id, dropped)
+
+        # Unique topics from saved opportunities, for UrlCollection
+        extracted_topics = sorted(
+            set(
+                str(t).strip()
+                for opp in complete
+                for t in (opp.get("topics") or [])
+                if t and str(t).strip()
             )
+        )
 
-            # Description is compulsory for UrlCollection; use fallback if empty
-            description_for_db = (description or "").strip() or DESCRIPTION_FALLBACK
+        # Description is compulsory for UrlCollection; use fallback if empty
+        description_for_db = (description or "").strip() or DESCRIPTION_FALLBACK
+
+        # Async DB ops: update UrlCollection with sourceName, description, status, and extracted topics
+        await self.url_collection_model.update_by_id(url_collection_id, {
+            "sourceName": source_name,
+            "description": description_for_db,
+            "status": "completed",
+            "extractionOk": True,
+            "topics": extracted_topics,
+            "contentHash": content_hash,
+            "llmCalls": llm_calls,
+            "opportunityIds": [],
+        })
+
+        if not from_google_query:
+            await self.recent_activity_model.try_insert_activity(
+                RECENT_ACTIVITY_TYPE_SCRAPER,
+                MESSAGE_SCRAPER_ADDED,
+            )
 
-            # Async DB ops: update UrlCollection with sourceName, description, status, and extracted topics
-            await self.url_collection_model.update_by_id(url_collection_id, {
-                "sourceName": source_name,
-                "description": description_for_db,
-                "status": "completed",
-                "topics": extracted_topics,
-            })
+        if not opportunities:
+            logger.info("Job %s completed with 0 opportunities", url_collection_id)
+            return 0
 
-            if not from_google_query:
-                await self.recent_activity_model.try_insert_activity(
-                    RECENT_ACTIVITY_TYPE_SCRAPER,
-                    MESSAGE_SCRAPER_ADDED,
+        for opp in complete:
+            if "metadata" not in opp or not isinstance(opp["metadata"], dict):
+                opp["metadata"] = {}
+            opp["metadata"]["sourceUrl"] = url
+            opp["metadata"]["urlCollectionId"] = url_collection_id
+            if not opp["metadata"].get("description") or not str(opp["metadata"].get("description", "")).strip():
+                opp["metadata"]["description"] = (description or opp.get("event_name") or "").strip() or ""
+            src: dict = {"google_query": from_google_query, "source_url": url}
+            if from_google_query:
+                q = (google_search_query or "").strip()
+                if q:
+                    src["google_search_query"] = q
+            opp["source"] = src
+
+        if complete:
+            inserted, skipped_duplicates = await self.opportunity_model.insert_deduped(complete)
+            if skipped_duplicates:
+                logger.info(
+                    "Job %s: skipped %d duplicate opportunity(ies) (already in Mongo or repeated within batch)",
+                    url_collection_id,
+                    skipped_duplicates,
                 )
 
-            if not opportunities:
-                logger.info("Job %s completed with 0 opportunities", url_collection_id)
+            if not inserted:
+                logger.info(
+                    "Job %s completed: 0 new opportunities (all duplicates or no valid keys)",
+                    url_collection_id,
+                )
                 return 0
 
-            for opp in complete:
-                if "metadata" not in opp or not isinstance(opp["metadata"], dict):
-                    opp["metadata"] = {}
-                opp["metadata"]["sourceUrl"] = url
-                opp["metadata"]["urlCollectionId"] = url_collection_id
-                if not opp["metadata"].get("description") or not str(opp["metadata"].get("description", "")).strip():
-                    opp["metadata"]["description"] = (description or opp.get("event_name") or "").strip() or ""
-                src: dict = {"google_query": from_google_query, "source_url": url}
-                if from_google_query:
-                    q = (google_search_query or "").strip()
-                    if q:
-                        src["google_search_query"] = q
-                opp["source"] = src
-
-            if complete:
-                existing_keys = await self.opportunity_model.find_existing_dedupe_keys(complete)
-                to_insert: list[dict] = []
-                seen_batch: set[tuple[str, str]] = set()
-                skipped_db = 0
-                skipped_batch = 0
-                for opp in complete:
-                    k = opportunity_dedupe_key(opp)
-                    if not k:
-                        continue
-                    if k in existing_keys:
-                        skipped_db += 1
-                        continue
-                    if k in seen_batch:
-                        skipped_batch += 1
-                        continue
-                    seen_batch.add(k)
-                    to_insert.append(opp)
-
-                if skipped_db or skipped_batch:
+            inserted_ids = [oid for _, oid in inserted]
+            await self.url_collection_model.update_by_id(
+                url_collection_id, {"opportunityIds": [str(oid) for oid in inserted_ids]}
+            )
+            logger.info(
+                "Job %s completed: inserted %d opportunities into Opportunities collection",
+                url_collection_id,
+                len(inserted_ids),
+            )
+            if not from_google_query:
+                await self.recent_activity_model.try_insert_activity(
+                    RECENT_ACTIVITY_TYPE_OPPORTUNITIES,
+                    message_opportunities_added(len(inserted_ids)),
+                )
+            # Push qualified opportunities to Pinecone (vector DB) in a thread to avoid blocking, unless the
+            # Opportunities change-stream consumer (app/services/OpportunityChangeStream.py) does it
+            try:
+                store = PineconeOpportunityStore()
+                if not OPPORTUNITY_CHANGE_STREAM_ENABLED and store.is_configured():
+                    qualified = [(oid, opp) for opp, oid in inserted if opp.get("isQualified")]
+                    n_pinecone = await asyncio.to_thread(store.upsert_opportunities, qualified)
                     logger.info(
-                        "Job %s: skipping %d opportunity(ies) already in Mongo, %d duplicate(s) within batch",
+                        "Job %s: Pinecone upserted %d qualified vector(s); %d not qualified (Mongo only)",
                         url_collection_id,
-                        skipped_db,
-                        skipped_batch,
+                        n_pinecone,
+                        len(inserted) - len(qualified),
                     )
+            except Exception as pin_e:
+                logger.warning("Pinecone upsert failed for job %s: %s", url_collection_id, pin_e)
+            return len(inserted_ids)
+        else:
+            logger.info("Job %s completed with 0 opportunities to insert (all incomplete)", url_collection_id)
+            return 0
 
-                if not to_insert:
-                    logger.info(
-                        "Job %s completed: 0 new opportunities (all duplicates or no valid keys)",
-                        url_collection_id,
-                    )
-                    return 0
+    async def mark_unchanged(
+        self,
+        url_collection_id: str,
+        previous: dict,
+        page: dict,
+        from_google_query: bool = False,
+    ) -> None:
+        """
+        Page content hash matches an earlier scrape of the same url: copy its opportunityIds and topics,
+        mark this job "unchanged" and record the LLM calls that were not made.
+        """
+        llm_calls_saved = previous.get("llmCalls") or previous.get("llmCallsSaved") or 0
+        await self.url_collection_model.update_by_id(url_collection_id, {
+            "sourceName": page["source_name"],
+            "description": (page["description"] or "").strip() or DESCRIPTION_FALLBACK,
+            "status": "unchanged",
+            "extractionOk": True,
+            "topics": previous.get("topics") or [],
+            "contentHash": page["content_hash"],
+            "opportunityIds": previous.get("opportunityIds") or [],
+            "unchangedFromId": str(previous["_id"]),
+            "llmCallsSaved": llm_calls_saved,
+        })
+        await self._touch_freshness(url_collection_id=url_collection_id, url=previous.get("url") or "")
+        if not from_google_query:
+            await self.recent_activity_model.try_insert_activity(
+                RECENT_ACTIVITY_TYPE_SCRAPER,
+                MESSAGE_SCRAPER_ADDED,
+            )
+        logger.info(
+            "Job %s unchanged since %s (contentHash=%s); skipped extraction, saved ~%d LLM call(s)",
+            url_collection_id,
+            previous["_id"],
+            page["content_hash"][:12],
+            llm_calls_saved,
+        )
 
-                inserted_ids = await self.opportunity_model.insert_many(to_insert)
-                logger.info(
-                    "Job %s completed: inserted %d opportunities into Opportunities collection",
-                    url_collection_id,
-                    len(inserted_ids),
-                )
-                if not from_google_query:
-                    await self.recent_activity_model.try_insert_activity(
-                        RECENT_ACTIVITY_TYPE_OPPORTUNITIES,
-                        message_opportunities_added(len(inserted_ids)),
-                    )
-                # Push each inserted opportunity to Pinecone (vector DB) in thread to avoid blocking
-                try:
-                    store = PineconeOpportunityStore()
-                    if store.is_configured():
-                        def _upsert_batch():
-                            n_vec = 0
-                            for opp, oid in zip(to_insert, inserted_ids):
-                                if opp.get("isQualified"):
-                                    if store.upsert_opportunity(oid, opp):
-                                        n_vec += 1
-                            return n_vec
-
-                        n_pinecone = await asyncio.to_thread(_upsert_batch)
-                        n_unqualified = sum(1 for o in to_insert if not o.get("isQualified"))
-                        logger.info(
-                            "Job %s: Pinecone upserted %d qualified vector(s); %d not qualified (Mongo only)",
-                            url_collection_id,
-                            n_pinecone,
-                            n_unqualified,
-                        )
-                except Exception as pin_e:
-                    logger.warning("Pinecone upsert failed for job %s: %s", url_collection_id, pin_e)
-                return len(inserted_ids)
-            else:
-                logger.info("Job %s completed with 0 opportunities to insert (all incomplete)", url_collection_id)
-                return 0
+    async def _touch_freshness(self, url: str, url_collection_id: str) -> None:
+        """
+        Record url_collection_id as the latest result for the canonical url. Only called once the job holds a
+        successful extraction (completed / unchanged), so failed jobs never become the fresh result.
+        Failures are logged only.
+        """
+        try:
+            await self.url_freshness_model.touch(canonicalize_url(url), url, url_collection_id)
         except Exception as e:
-            logger.exception("Job %s failed: %s", url_collection_id, e)
-            await self.url_collection_model.update_by_id(url_collection_id, {"status": "failed"})
-            return 0
+            logger.warning("urlFreshness update failed url_collection_id=%s: %s", url_collection_id, e)
+
+    async def link_fresh_result(self, url_collection_id: str, url: str, from_google_query: bool = False) -> bool:
+        """
+        If the canonical url was scraped within URL_FRESHNESS_WINDOW_SECONDS, copy that job's result
+        (opportunityIds, topics, sourceName, description, contentHash) onto this job, mark it "reused"
+        and return True. No scrape or LLM call is made. Returns False when there is no fresh result.
+        """
+        fresh = await self.url_freshness_model.get_fresh(canonicalize_url(url), URL_FRESHNESS_WINDOW_SECONDS)
+        if not fresh or fresh.get("urlCollectionId") == url_collection_id:
+            return False
+        previous = await self.url_collection_model.get_by_id(fresh["urlCollectionId"])
+        if not previous or previous.get("status") not in REUSABLE_STATUSES or not previous.get("extractionOk"):
+            return False
+        llm_calls_saved = previous.get("llmCalls") or previous.get("llmCallsSaved") or 0
+        await self.url_collection_model.update_by_id(url_collection_id, {
+            "sourceName": previous.get("sourceName") or "",
+            "description": (previous.get("description") or "").strip() or DESCRIPTION_FALLBACK,
+            "status": "reused",
+            "extractionOk": True,
+            "topics": previous.get("topics") or [],
+            "contentHash": previous.get("contentHash"),
+            "opportunityIds": previous.get("opportunityIds") or [],
+            "reusedFromId": str(previous["_id"]),
+            "llmCallsSaved": llm_calls_saved,
+        })
+        if not from_google_query:
+            await self.recent_activity_model.try_insert_activity(
+                RECENT_ACTIVITY_TYPE_SCRAPER,
+                MESSAGE_SCRAPER_ADDED,
+            )
+        logger.info(
+            "Job %s reused result of %s (scraped %s); skipped scrape and ~%d LLM call(s)",
+            url_collection_id,
+            previous["_id"],
+            fresh.get("lastScrapedAt"),
+            llm_calls_saved,
+        )
+        return True
+
+    async def get_change_detection_stats(self) -> dict:
+        """Counts of unchanged re-scrapes and LLM calls spent vs saved by content-hash change detection."""
+        stats = await self.url_collection_model.get_change_detection_stats()
+        spent = stats["llmCalls"]
+        saved = stats["llmCallsSaved"]
+        stats["llmCallsSavedRatio"] = round(saved / (spent + saved), 4) if (spent + saved) else 0.0
+        return {"success": True, "data": stats}
 
     async def _run_tedx_cron_async(self) -> None:
         """
@@ -362,7 +732,7 @@ class UrlScraperRapidAPIService:
         logger.info("TedX cron job started")
         try:
             serp = SerpHelper()
-            urls = serp.search(TEDX_CRON_QUERY)
+            urls = await serp.search_async(TEDX_CRON_QUERY)
             non_pdf = [u for u in (urls or []) if not is_pdf_url(u)]
             top_urls = non_pdf[:TEDX_CRON_TOP_N]
             if not top_urls:
@@ -387,4 +757,11 @@ class UrlScraperRapidAPIService:
         Synchronous entrypoint for APScheduler.
         Runs TedX cron in a new event loop (scheduler runs in background thread).
         """
-        asyncio.run(self._run_tedx_cron_async())
+        asyncio.run(self._run_tedx_cron_in_own_loop())
+
+    async def _run_tedx_cron_in_own_loop(self) -> None:
+        try:
+            await self._run_tedx_cron_async()
+        finally:
+            # The SERP session is bound to this asyncio.run loop; close it before the loop ends
+            await close_loop_serp_session()
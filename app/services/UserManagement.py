@@ -62,21 +62,22 @@ class UserManagementService:
         return get_auth_service()
 
     async def list_users_with_profiles(
-        self, page: int = 1, limit: int = 10
+        self, page: int = 1, limit: int = 10, cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         try:
             filters: dict = {}
-            skip = (page - 1) * limit
-            total, users = await asyncio.gather(
-                self.user_model.get_documents_count(filters),
-                self.user_model.get_users(filters, skip, limit),
+            # With a cursor (previous nextCursor) page is ignored and deep pages cost the same as the first
+            skip = 0 if cursor else (page - 1) * limit
+            total, (users, next_cursor) = await asyncio.gather(
+                self.user_model.get_documents_count_approximate(filters),
+                self.user_model.get_users_page(filters, limit, cursor, skip),
             )
             total_pages = (total + limit - 1) // limit if limit else 0
             user_ids: List[str] = []
             for u in users:
                 ud = u.model_dump(by_alias=True)
                 user_ids.append(str(ud.get("_id")))
-            grouped = await self.profile_model.get_profiles_by_user_ids(user_ids)
+            grouped = await self.profile_model.get_profiles_by_user_ids(user_ids, projection="summary")
 
             out: List[UserWithSpeakerProfiles] = []
             for u, uid in zip(users, user_ids):
@@ -97,6 +98,7 @@ class UserManagementService:
                     totalPages=total_pages,
                     currentPage=page,
                     limit=limit,
+                    nextCursor=next_cursor,
                 ),
             )
             return {
@@ -124,7 +126,7 @@ class UserManagementService:
                     "data": None,
                     "error": "User not found",
                 }
-            profiles = await self.profile_model.get_profiles_by_user_id(user_id)
+            profiles = await self.profile_model.get_profiles_by_user_id(user_id, projection="summary")
             summaries = [_profile_to_summary(p) for p in profiles]
             payload = UserWithSpeakerProfiles(
                 user=_user_to_public(user),
@@ -212,7 +214,7 @@ class UserManagementService:
                 }
             doc = await self.profile_model.create_profile(name, user_id=str(user_id))
             pid = str(doc["_id"])
-            prof = await self.profile_model.get_profile(pid)
+            prof = await self.profile_model.get_profile(pid, projection="summary")
             if not prof:
                 return {
                     "success": False,
@@ -0,0 +1,317 @@
+"""
+Local stand-ins for the paid providers used by the ingestion pipeline, for benchmarking without real spend.
+
+One aiohttp app per provider, each on its own 127.0.0.1 port, served from a background thread
+(so provider latency does not compete with the pipeline's event loop):
+- rapidapi:   POST /scrape                  -> {content, name, description, urls, ogUrl} from page fixtures
+- brightdata: POST /request                 -> {"body": "{\"organic\": [{link}, ...]}"}
+- openai:     POST /v1/chat/completions     -> canned extractor (JSON array) / enricher (JSON object) answers
+              POST /v1/embeddings           -> deterministic vectors (float list or base64 float32)
+- pinecone:   POST /vectors/upsert          -> {"upsertedCount": n}
+
+Each provider has configurable latency (ms, with +/- jitter) and error rate (HTTP 429 / 503).
+Request counts per provider/route are kept in `counters` for the report.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+EMBEDDING_DIMENSION = 3072
+_URL_IN_PROMPT_RE = re.compile(r"Website URL:\s*(\S+)")
+
+
+@dataclass
+class ProviderBehavior:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    async def apply(self) -> Optional[web.Response]:
+        """Sleep for the configured latency; return an error response (429/503) at error_rate, else None."""
+        delay = max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            status = random.choice((429, 503))
+            return web.json_response({"error": {"message": "injected failure", "code": status}}, status=status)
+        return None
+
+
+@dataclass
+class FakeProviderConfig:
+    rapidapi: ProviderBehavior = field(default_factory=ProviderBehavior)
+    brightdata: ProviderBehavior = field(default_factory=ProviderBehavior)
+    openai: ProviderBehavior = field(default_factory=ProviderBehavior)
+    pinecone: ProviderBehavior = field(default_factory=ProviderBehavior)
+    serp_results: int = 5
+    opportunities_per_page: int = 3
+
+
+def load_page_fixtures(fixtures_dir: str) -> List[str]:
+    """Markdown page bodies from fixtures_dir/*.md (sorted)."""
+    pages = []
+    for name in sorted(os.listdir(fixtures_dir)):
+        if name.endswith(".md"):
+            with open(os.path.join(fixtures_dir, name), encoding="utf-8") as f:
+                pages.append(f.read())
+    if not pages:
+        raise ValueError(f"No .md page fixtures in {fixtures_dir}")
+    return pages
+
+
+def _stable_int(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:12], 16)
+
+
+class FakeProviders:
+    """Starts/stops the provider stand-ins. Use base_urls after start() to point the app at them."""
+
+    def __init__(self, config: FakeProviderConfig, pages: List[str]):
+        self.config = config
+        self.pages = pages
+        self.counters: Counter = Counter()
+        self._counter_lock = threading.Lock()
+        self.base_urls: Dict[str, str] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runners: List[web.AppRunner] = []
+        self._started = threading.Event()
+
+    # ---- bookkeeping -------------------------------------------------------------------------------
+
+    def _count(self, key: str) -> None:
+        with self._counter_lock:
+            self.counters[key] += 1
+
+    def reset_counters(self) -> Dict[str, int]:
+        """Return counters so far and start from zero."""
+        with self._counter_lock:
+            snapshot = dict(self.counters)
+            self.counters.clear()
+        return snapshot
+
+    # ---- handlers ----------------------------------------------------------------------------------
+
+    def _page_for(self, url: str) -> str:
+        body = self.pages[_stable_int(url) % len(self.pages)]
+        # URL-specific header so every URL has its own content hash
+        return f"# {url}\n\n{body}"
+
+    async def _rapidapi_scrape(self, request: web.Request) -> web.Response:
+        self._count("rapidapi.scrape")
+        failure = await self.config.rapidapi.apply()
+        if failure is not None:
+            self._count("rapidapi.errors")
+            return failure
+        payload = await request.json()
+        url = payload.get("url") or ""
+        return web.json_response({
+            "content": self._page_for(url),
+            "name": f"Bench page {_stable_int(url) % 10000}",
+            "description": "Benchmark fixture page with speaking opportunities.",
+            "urls": [],
+            "ogUrl": url,
+        })
+
+    async def _brightdata_request(self, request: web.Request) -> web.Response:
+        self._count("brightdata.request")
+        failure = await self.config.brightdata.apply()
+        if failure is not None:
+            self._count("brightdata.errors")
+            return failure
+        payload = await request.json()
+        seed = _stable_int(payload.get("url") or "")
+        organic = [
+            {"link": f"https://bench-{seed % 100000}.example.org/events/{i}", "title": f"Result {i}"}
+            for i in range(self.config.serp_results)
+        ]
+        return web.json_response({"status_code": 200, "body": json.dumps({"organic": organic})})
+
+    def _extractor_answer(self, user_prompt: str) -> str:
+        match = _URL_IN_PROMPT_RE.search(user_prompt)
+        page_url = match.group(1) if match else "https://bench.example.org/events"
+        start = date.today() + timedelta(days=60)
+        opportunities = []
+        for i in range(self.config.opportunities_per_page):
+            opp = {
+                # Even opportunities share the page URL as landing link (one qualification scrape for all of them)
+                "link": page_url if i % 2 == 0 else f"{page_url}/session-{i}",
+                "event_name": f"Bench Summit {_stable_int(page_url) % 10000} Track {i}",
+                "location": "Berlin, Germany",
+                "topics": ["AI"],
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=1)).isoformat(),
+                "speaking_format": "Keynote",
+                "delivery_mode": "In-person",
+                "target_audiences": ["Executives"],
+                "application_submission_deadline": None if i % 2 == 0 else (start - timedelta(days=30)).isoformat(),
+                "application_submission_closed": False,
+                "metadata": {"description": "Call for speakers for a benchmark conference track."},
+            }
+            if i == self.config.opportunities_per_page - 1 and i > 0:
+                opp["location"] = ""  # incomplete -> exercises the enricher
+            opportunities.append(opp)
+        return json.dumps(opportunities)
+
+    def _enricher_answer(self) -> str:
+        start = date.today() + timedelta(days=60)
+        return json.dumps({
+            "event_name": "Bench Summit (enriched)",
+            "location": "Lisbon, Portugal",
+            "topics": ["AI"],
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=1)).isoformat(),
+            "speaking_format": "Keynote",
+            "delivery_mode": "In-person",
+            "target_audiences": ["Executives"],
+            "metadata": {"description": "Enriched benchmark event."},
+        })
+
+    async def _openai_chat(self, request: web.Request) -> web.Response:
+        self._count("openai.chat")
+        failure = await self.config.openai.apply()
+        if failure is not None:
+            self._count("openai.errors")
+            return failure
+        payload = await request.json()
+        messages = payload.get("messages") or []
+        system = next((m.get("content") or "" for m in messages if m.get("role") == "system"), "")
+        user = next((m.get("content") or "" for m in messages if m.get("role") == "user"), "")
+        if "SPEAKING opportunities" in system:
+            self._count("openai.chat.extractor")
+            content = self._extractor_answer(user)
+        elif "extracting event details" in system:
+            self._count("openai.chat.enricher")
+            content = self._enricher_answer()
+        else:
+            content = "{}"
+        prompt_tokens = sum(len(m.get("content") or "") for m in messages) // 4
+        completion_tokens = len(content) // 4
+        return web.json_response({
+            "id": f"chatcmpl-bench-{random.getrandbits(32):08x}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model") or "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    async def _openai_embeddings(self, request: web.Request) -> web.Response:
+        self._count("openai.embeddings")
+        failure = await self.config.openai.apply()
+        if failure is not None:
+            self._count("openai.errors")
+            return failure
+        payload = await request.json()
+        inputs = payload.get("input")
+        if not isinstance(inputs, list) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        dimension = int(payload.get("dimensions") or EMBEDDING_DIMENSION)
+        data = []
+        for i, item in enumerate(inputs):
+            rng = random.Random(_stable_int(json.dumps(item)))
+            vector = [rng.uniform(-1, 1) for _ in range(dimension)]
+            if payload.get("encoding_format") == "base64":
+                embedding = base64.b64encode(struct.pack(f"<{dimension}f", *vector)).decode("ascii")
+            else:
+                embedding = vector
+            data.append({"object": "embedding", "index": i, "embedding": embedding})
+        return web.json_response({
+            "object": "list",
+            "data": data,
+            "model": payload.get("model") or "text-embedding-3-large",
+            "usage": {"prompt_tokens": 8 * len(inputs), "total_tokens": 8 * len(inputs)},
+        })
+
+    async def _pinecone_upsert(self, request: web.Request) -> web.Response:
+        self._count("pinecone.upsert")
+        failure = await self.config.pinecone.apply()
+        if failure is not None:
+            self._count("pinecone.errors")
+            return failure
+        payload = await request.json()
+        return web.json_response({"upsertedCount": len(payload.get("vectors") or [])})
+
+    # ---- lifecycle ---------------------------------------------------------------------------------
+
+    def _apps(self) -> Dict[str, web.Application]:
+        rapidapi = web.Application()
+        rapidapi.router.add_post("/scrape", self._rapidapi_scrape)
+        brightdata = web.Application()
+        brightdata.router.add_post("/request", self._brightdata_request)
+        openai = web.Application()
+        openai.router.add_post("/v1/chat/completions", self._openai_chat)
+        openai.router.add_post("/v1/embeddings", self._openai_embeddings)
+        pinecone = web.Application()
+        pinecone.router.add_post("/vectors/upsert", self._pinecone_upsert)
+        return {"rapidapi": rapidapi, "brightdata": brightdata, "openai": openai, "pinecone": pinecone}
+
+    async def _start_servers(self) -> None:
+        for name, app in self._apps().items():
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.base_urls[name] = f"http://127.0.0.1:{port}"
+            self._runners.append(runner)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start_servers())
+        self._started.set()
+        self._loop.run_forever()
+        for runner in self._runners:
+            self._loop.run_until_complete(runner.cleanup())
+        self._loop.close()
+
+    def start(self) -> Dict[str, str]:
+        self._thread = threading.Thread(target=self._run, name="fake-providers", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout=10):
+            raise RuntimeError("Fake providers did not start")
+        return self.base_urls
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables that point the app's provider clients at these stand-ins."""
+        openai_base = f"{self.base_urls['openai']}/v1"
+        return {
+            "RAPIDAPI_SCRAPE_URL": f"{self.base_urls['rapidapi']}/scrape",
+            "RAPIDAPI_KEY": "bench",
+            "BRIGHTDATA_REQUEST_URL": f"{self.base_urls['brightdata']}/request",
+            "BRIGHTDATA_SERP_KEY": "bench",
+            "OPENAI_BASE_URL": openai_base,
+            "OPENAI_API_BASE": openai_base,
+            "OPENAI_API_KEY": "bench",
+            "PINECONE_API_KEY": "bench",
+            "PINECONE_INDEX": "bench",
+            "PINECONE_INDEX_HOST": self.base_urls["pinecone"],
+        }
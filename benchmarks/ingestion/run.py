@@ -0,0 +1,258 @@
+"""
+End-to-end ingestion throughput benchmark against local provider stand-ins (benchmarks/ingestion/fake_providers.py).
+
+Scenarios (each repeated per --concurrency level):
+- url_scrape:   N UrlCollection jobs through UrlScraperRapidAPIService.run_scrape_and_extract, `c` at a time
+- google_query: M pending GoogleQueries through GoogleQueryScraperService.process_pending_batch, `c` workers
+Reported per scenario: wall time, URLs/minute, p50/p95/max job latency, job statuses, provider calls
+(scrapes, SERP, chat/extractor/enricher, embeddings, upserts) and LLM calls per URL. Written as JSON for
+regression comparison between commits.
+
+Needs a reachable MongoDB (MONGODB_CONNECTION_STRING). Everything is written to --db-name (default
+hd_ai_benchmark), which is dropped before and after the run unless --keep-db is given.
+
+Run from project root:
+  python benchmarks/ingestion/run.py
+  python benchmarks/ingestion/run.py --urls 100 --concurrency 1,4,16 --openai-latency-ms 800 --error-rate 0.02
+  python benchmarks/ingestion/run.py --output benchmarks/ingestion/reports/$(git rev-parse --short HEAD).json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from fake_providers import FakeProviderConfig, FakeProviders, ProviderBehavior, load_page_fixtures
+
+logger = logging.getLogger("benchmarks.ingestion")
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile (pct in 0..100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(latencies_ms) -> dict:
+    return {
+        "p50": round(percentile(latencies_ms, 50), 1),
+        "p95": round(percentile(latencies_ms, 95), 1),
+        "max": round(max(latencies_ms), 1) if latencies_ms else 0.0,
+    }
+
+
+def scenario_report(name: str, concurrency: int, urls: int, wall_seconds: float, latencies_ms, statuses, calls) -> dict:
+    llm_calls = calls.get("openai.chat", 0)
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "urls": urls,
+        "wall_seconds": round(wall_seconds, 3),
+        "urls_per_minute": round(urls / wall_seconds * 60, 1) if wall_seconds else 0.0,
+        "job_latency_ms": latency_summary(latencies_ms),
+        "statuses": dict(statuses),
+        "provider_calls": calls,
+        "llm_calls_per_url": round(llm_calls / urls, 3) if urls else 0.0,
+    }
+
+
+async def run_url_scrape(providers: FakeProviders, run_id: str, n_urls: int, concurrency: int) -> dict:
+    from app.services.UrlScraperRapidAPI import UrlScraperRapidAPIService
+
+    service = UrlScraperRapidAPIService()
+    jobs = []
+    for i in range(n_urls):
+        url = f"https://bench-{run_id}.example.org/c{concurrency}/events/{i}"
+        jobs.append((await service.create_url_scrape_job(url), url))
+    providers.reset_counters()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies_ms = []
+
+    async def one(url_collection_id: str, url: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await service.run_scrape_and_extract(url_collection_id, url)
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(job_id, url) for job_id, url in jobs))
+    wall = time.perf_counter() - started
+
+    statuses = Counter()
+    for job_id, _url in jobs:
+        doc = await service.url_collection_model.get_by_id(job_id)
+        statuses[(doc or {}).get("status") or "missing"] += 1
+    return scenario_report("url_scrape", concurrency, n_urls, wall, latencies_ms, statuses, providers.reset_counters())
+
+
+async def run_google_queries(providers: FakeProviders, run_id: str, n_queries: int, concurrency: int) -> dict:
+    from app.models.GoogleQuery import GoogleQueryModel
+    from app.services.GoogleQueryScraper import GoogleQueryScraperService
+
+    model = GoogleQueryModel()
+    query_ids = []
+    for i in range(n_queries):
+        now = datetime.utcnow()
+        query_ids.append(await model.create({
+            "query": f"bench {run_id} c{concurrency} call for speakers {i}",
+            "status": "pending",
+            "createdAt": now,
+            "updatedAt": now,
+        }))
+    providers.reset_counters()
+
+    service = GoogleQueryScraperService()
+    latencies_ms = []
+
+    async def worker() -> None:
+        # One query per claim so that latency is measured per GoogleQuery
+        while True:
+            started = time.perf_counter()
+            summary = await service.process_pending_batch(limit=1)
+            if not summary["claimed"]:
+                return
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    statuses = Counter()
+    n_urls = 0
+    for query_id in query_ids:
+        doc = await model.get_by_id(query_id)
+        statuses[(doc or {}).get("status") or "missing"] += 1
+        n_urls += len((doc or {}).get("urlCollectionIds") or [])
+    report = scenario_report("google_query", concurrency, n_urls, wall, latencies_ms, statuses, providers.reset_counters())
+    report["google_queries"] = n_queries
+    return report
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Ingestion throughput benchmark with local provider stand-ins.")
+    parser.add_argument("--urls", type=int, default=30, help="UrlCollection jobs per url_scrape run (default: 30).")
+    parser.add_argument("--google-queries", type=int, default=6, help="GoogleQueries per google_query run (default: 6).")
+    parser.add_argument("--concurrency", default="1,4,8", help="Comma-separated concurrency levels (default: 1,4,8).")
+    parser.add_argument("--scenarios", default="url_scrape,google_query", help="Comma-separated scenarios to run.")
+    parser.add_argument("--serp-results", type=int, default=5, help="Organic results returned by the fake SERP.")
+    parser.add_argument("--opportunities-per-page", type=int, default=3, help="Opportunities in each fake extraction answer.")
+    parser.add_argument("--rapidapi-latency-ms", type=float, default=400)
+    parser.add_argument("--brightdata-latency-ms", type=float, default=800)
+    parser.add_argument("--openai-latency-ms", type=float, default=600)
+    parser.add_argument("--pinecone-latency-ms", type=float, default=50)
+    parser.add_argument("--jitter", type=float, default=0.25, help="Latency jitter as a fraction of latency (default: 0.25).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected 429/503 rate for every provider (default: 0).")
+    parser.add_argument("--rapidapi-delay", type=float, default=0, help="Seconds between RapidAPI calls in GoogleQuery jobs (production: 5).")
+    parser.add_argument("--fixtures-dir", default=FIXTURES_DIR, help="Directory with .md page fixtures.")
+    parser.add_argument("--db-name", default="hd_ai_benchmark", help="Scratch database (must start with 'bench' or contain 'benchmark').")
+    parser.add_argument("--keep-db", action="store_true", help="Do not drop the scratch database after the run.")
+    parser.add_argument("--output", default=None, help="Write the JSON report here (default: stdout only).")
+    return parser.parse_args()
+
+
+def behavior(latency_ms: float, jitter: float, error_rate: float) -> ProviderBehavior:
+    return ProviderBehavior(latency_ms=latency_ms, jitter_ms=latency_ms * jitter, error_rate=error_rate)
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    logger.setLevel(logging.INFO)
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    if not connection_string:
+        logger.error("Missing MONGODB_CONNECTION_STRING in environment")
+        sys.exit(1)
+    if not (args.db_name.startswith("bench") or "benchmark" in args.db_name):
+        logger.error("Refusing to use database %r: name must start with 'bench' or contain 'benchmark'", args.db_name)
+        sys.exit(1)
+
+    config = FakeProviderConfig(
+        rapidapi=behavior(args.rapidapi_latency_ms, args.jitter, args.error_rate),
+        brightdata=behavior(args.brightdata_latency_ms, args.jitter, args.error_rate),
+        openai=behavior(args.openai_latency_ms, args.jitter, args.error_rate),
+        pinecone=behavior(args.pinecone_latency_ms, args.jitter, args.error_rate),
+        serp_results=args.serp_results,
+        opportunities_per_page=args.opportunities_per_page,
+    )
+    providers = FakeProviders(config, load_page_fixtures(args.fixtures_dir))
+    providers.start()
+    # Provider endpoints, keys and DB_NAME are read at import time, so set them before importing app modules
+    os.environ.update(providers.environment())
+    os.environ["DB_NAME"] = args.db_name
+    os.environ["SCRAPE_RETRY_WORKER_ENABLED"] = "false"
+
+    from app.helpers.Database import MongoDB
+    from app.helpers.SerpHelper import close_serp_sessions
+    import app.services.GoogleQueryScraper as google_query_scraper
+
+    google_query_scraper.RAPIDAPI_DELAY_SECONDS = args.rapidapi_delay
+
+    MongoDB.connect(connection_string)
+    await MongoDB.client.drop_database(args.db_name)
+    run_id = uuid.uuid4().hex[:8]
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    results = []
+    try:
+        for concurrency in levels:
+            if "url_scrape" in scenarios:
+                results.append(await run_url_scrape(providers, run_id, args.urls, concurrency))
+                logger.info("url_scrape c=%d: %s", concurrency, results[-1]["urls_per_minute"])
+            if "google_query" in scenarios:
+                results.append(await run_google_queries(providers, run_id, args.google_queries, concurrency))
+                logger.info("google_query c=%d: %s", concurrency, results[-1]["urls_per_minute"])
+    finally:
+        if not args.keep_db:
+            await MongoDB.client.drop_database(args.db_name)
+        await close_serp_sessions()
+        MongoDB.client.close()
+        providers.stop()
+
+    report = {
+        "benchmark": "ingestion",
+        "createdAt": datetime.utcnow().isoformat() + "Z",
+        "gitCommit": git_commit(),
+        "runId": run_id,
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "keep_db")},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        logger.info("Report written to %s", args.output)
+    print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
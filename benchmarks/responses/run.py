@@ -0,0 +1,223 @@
+"""
+Response serialization micro-benchmark: the cost of turning a list payload into response bytes.
+
+Paths (each a FastAPI route with response_model=ServerResponse, called in-process over ASGI, no network):
+- create_response:          Utils.create_response + response_model validation + json rendering (pre-FastJSON app)
+- create_response_fastjson: the same with FastJSONResponse as default response class (current app for non-list routes)
+- create_fast_response:     Utils.create_fast_response (current list endpoints)
+The payload mimics GET /api/v1/opportunities: --items opportunity documents with ObjectId _id, datetime
+createdAt/updatedAt, topics and metadata. Reported per path: p50/p95/mean ms per response, body size, and the
+speedup of each path over create_response; all bodies are checked to decode to the same JSON.
+
+Needs no MongoDB or provider keys.
+
+Run from project root:
+  python benchmarks/responses/run.py
+  python benchmarks/responses/run.py --items 1000 --repeat 200
+  python benchmarks/responses/run.py --output benchmarks/responses/reports/$(git rev-parse --short HEAD).json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from bson import ObjectId
+from fastapi import FastAPI
+
+from app.helpers.FastJSON import FastJSONResponse, orjson
+from app.helpers.Utilities import Utils
+from app.schemas.ServerResponse import ServerResponse
+
+logger = logging.getLogger("benchmarks.responses")
+
+PATHS = ("create_response", "create_response_fastjson", "create_fast_response")
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile (pct in 0..100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def opportunity_payload(n_items: int) -> dict:
+    """list_opportunities-shaped result with n_items documents as they come out of Motor."""
+    created = datetime(2025, 1, 1, 9, 30, 15, 123000)
+    opportunities = []
+    for i in range(n_items):
+        opportunities.append({
+            "_id": ObjectId(),
+            "link": f"https://events.example.org/{i}/call-for-speakers",
+            "event_name": f"Example Summit {i}",
+            "location": "Berlin, Germany",
+            "topics": ["Artificial Intelligence", "Leadership", "Product Management"],
+            "start_date": "2026-03-15",
+            "end_date": "2026-03-16",
+            "speaking_format": "Keynote",
+            "delivery_mode": "In-person",
+            "target_audiences": ["Executives", "Engineers"],
+            "source": "url_scraper_rapidapi",
+            "isQualified": True,
+            "reasonForUnqualify": None,
+            "dedupeKey": f"https://events.example.org/{i}/call-for-speakers\nexample summit {i}",
+            "metadata": {
+                "description": "Annual gathering for practitioners. " * 6,
+                "organizer": "Example Org",
+                "urlCollectionId": str(ObjectId()),
+                "deadline": "2026-01-31",
+            },
+            "createdAt": created + timedelta(minutes=i),
+            "updatedAt": created + timedelta(minutes=i, seconds=30),
+        })
+    return {
+        "opportunities": opportunities,
+        "total": n_items * 10,
+        "page": 1,
+        "limit": n_items,
+        "totalPages": 10,
+        "nextCursor": "eyJzIjogWyJfaWQiXSwgInYiOiBbXX0",
+    }
+
+
+def build_apps(payload: dict) -> dict:
+    """One app per path; each route returns the same payload."""
+    apps = {}
+    for name in PATHS:
+        app = FastAPI(default_response_class=FastJSONResponse) if name != "create_response" else FastAPI()
+        fast = name == "create_fast_response"
+
+        @app.get("/opportunities", response_model=ServerResponse)
+        async def list_opportunities(fast=fast):
+            if fast:
+                return Utils.create_fast_response(payload, True)
+            return Utils.create_response(payload, True)
+
+        apps[name] = app
+    return apps
+
+
+async def call(app, path: str = "/opportunities") -> bytes:
+    """GET path on an ASGI app in-process; returns the response body."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 80),
+    }
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app, repeat: int, warmup: int) -> tuple[list, bytes]:
+    for _ in range(warmup):
+        await call(app)
+    timings_ms = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await call(app)
+        timings_ms.append((time.perf_counter() - started) * 1000)
+    return timings_ms, body
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Response serialization micro-benchmark.")
+    parser.add_argument("--items", default="10,100,1000", help="Comma-separated list sizes (default: 10,100,1000).")
+    parser.add_argument("--repeat", type=int, default=100, help="Timed responses per path and size (default: 100).")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed responses before each measurement (default: 10).")
+    parser.add_argument("--output", default=None, help="Write the JSON report here (default: stdout only).")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    logger.setLevel(logging.INFO)
+
+    results = []
+    for n_items in [int(n) for n in args.items.split(",") if n.strip()]:
+        apps = build_apps(opportunity_payload(n_items))
+        rows, bodies = {}, {}
+        for name, app in apps.items():
+            timings_ms, bodies[name] = await measure(app, args.repeat, args.warmup)
+            rows[name] = {
+                "path": name,
+                "items": n_items,
+                "p50_ms": round(percentile(timings_ms, 50), 3),
+                "p95_ms": round(percentile(timings_ms, 95), 3),
+                "mean_ms": round(sum(timings_ms) / len(timings_ms), 3),
+                "body_bytes": len(bodies[name]),
+            }
+        baseline = json.loads(bodies["create_response"])
+        for name, row in rows.items():
+            row["speedup_p50"] = round(rows["create_response"]["p50_ms"] / row["p50_ms"], 2) if row["p50_ms"] else 0.0
+            row["same_json"] = json.loads(bodies[name]) == baseline
+            if not row["same_json"]:
+                logger.warning("%s body differs from create_response for %d items", name, n_items)
+            results.append(row)
+        logger.info(
+            "items=%d: p50 %s",
+            n_items,
+            ", ".join(f"{name} {rows[name]['p50_ms']}ms" for name in PATHS),
+        )
+
+    report = {
+        "benchmark": "responses",
+        "createdAt": datetime.utcnow().isoformat() + "Z",
+        "gitCommit": git_commit(),
+        "serializer": "orjson" if orjson is not None else "json",
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        logger.info("Report written to %s", args.output)
+    print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
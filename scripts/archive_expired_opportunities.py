@@ -0,0 +1,61 @@
+"""
+Move opportunities whose end_date has passed from Opportunities to OpportunitiesArchive
+(the same pass the API runs every OPPORTUNITY_ARCHIVE_INTERVAL_SECONDS; see app/services/OpportunityArchiver.py).
+Safe to re-run and to run next to the API: batches are idempotent.
+
+Run from project root:
+  python scripts/archive_expired_opportunities.py --dry-run
+  python scripts/archive_expired_opportunities.py
+  python scripts/archive_expired_opportunities.py --batch-size 1000 --max-batches 10
+
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME (plus Pinecone / OpenAI keys to drop archived vectors
+when the change-stream consumer is not running).
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("archive_expired_opportunities")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Archive opportunities whose end_date has passed.")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the opportunities that would be archived.")
+    parser.add_argument("--batch-size", type=int, default=None, help="Opportunities per batch (default: OPPORTUNITY_ARCHIVE_BATCH_SIZE or 500).")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches (default: until none are left).")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.services.OpportunityArchiver import OPPORTUNITY_ARCHIVE_BATCH_SIZE, OpportunityArchiverService
+
+    MongoDB.connect(connection_string)
+    try:
+        service = OpportunityArchiverService(batch_size=args.batch_size or OPPORTUNITY_ARCHIVE_BATCH_SIZE)
+        summary = await service.archive_expired(max_batches=args.max_batches, dry_run=args.dry_run)
+        logger.info("%s: %s", "Dry run" if args.dry_run else "Archive finished", summary)
+        print(summary)
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
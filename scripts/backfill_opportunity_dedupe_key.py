@@ -0,0 +1,72 @@
+"""
+Backfill Opportunities.dedupeKey (opportunity_dedupe_key_string: link + normalized event name) for documents
+inserted before the field existed, and create the unique dedupeKey_1 index used by
+OpportunityModel.insert_deduped. API startup does the same (ensure_indexes runs OpportunityModel.after_ensure_indexes
+when MONGO_ENSURE_INDEXES is on); this script is for deployments that bootstrap indexes separately.
+
+The index is created first (it is partial on dedupeKey being a string, so it builds even over legacy documents).
+Each legacy document then gets its key; a key already held by another document is set to null and counted as an
+existing duplicate (nothing is deleted). Idempotent: only documents without dedupeKey are read.
+
+Run from project root:
+  python scripts/backfill_opportunity_dedupe_key.py --dry-run
+  python scripts/backfill_opportunity_dedupe_key.py
+
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("backfill_opportunity_dedupe_key")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Backfill Opportunities.dedupeKey and create its unique index.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many opportunities need the field.")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.helpers.MongoIndexes import ensure_indexes
+    from app.models.Opportunity import OpportunityModel
+
+    MongoDB.connect(connection_string)
+    try:
+        model = OpportunityModel()
+        if args.dry_run:
+            summary = await model.backfill_dedupe_keys(dry_run=True)
+            logger.info("Opportunities without dedupeKey: %d", summary["pending"])
+            return
+        # Creates dedupeKey_1, then runs the backfill (OpportunityModel.after_ensure_indexes)
+        result = await ensure_indexes([model])
+        errors = result.get(model.collection.name, {}).get("errors")
+        if errors:
+            logger.error("Index creation or backfill failed: %s", errors)
+            sys.exit(2)
+        summary = await model.backfill_dedupe_keys(dry_run=True)
+        logger.info("Backfill finished; opportunities still without dedupeKey: %d", summary["pending"])
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""
+Backfill speaker_profiles.email_lower (stripped, lowercased email) for profiles written before the field existed,
+then create the email_lower index used by SpeakerProfileModel.get_profile_by_email / update_chatbot_profile.
+
+Idempotent: only documents with a string email and no email_lower are updated (one server-side pipeline update),
+so it is safe to re-run, e.g. right after deploying the code that maintains email_lower on every write.
+Index bootstrap at API start (SpeakerProfileModel.after_ensure_indexes) runs the same backfill once; this script
+is for deployments with MONGO_ENSURE_INDEXES=false or to check progress.
+
+Run from project root:
+  python scripts/backfill_speaker_profile_email_lower.py --dry-run
+  python scripts/backfill_speaker_profile_email_lower.py
+
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("backfill_speaker_profile_email_lower")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Backfill speaker_profiles.email_lower and create its index.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many profiles need the field.")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.helpers.MongoIndexes import ensure_indexes
+    from app.models.SpeakerProfile import SpeakerProfileModel
+
+    MongoDB.connect(connection_string)
+    try:
+        model = SpeakerProfileModel()
+        summary = await model.backfill_email_lower(dry_run=True)
+        logger.info("Profiles without email_lower: %d", summary["pending"])
+        if args.dry_run:
+            return
+        summary = await model.backfill_email_lower()
+        logger.info("Backfilled email_lower on %d profile(s)", summary["updated"])
+        await ensure_indexes([model])
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
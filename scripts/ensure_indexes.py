@@ -0,0 +1,70 @@
+"""
+Create the Mongo indexes declared on the models (INDEXES) and optionally check the hot queries (HOT_QUERIES)
+with explain(), reporting any that still scan the whole collection or sort in memory.
+
+The API does the same index creation at startup unless MONGO_ENSURE_INDEXES=false.
+
+Run from project root:
+  python scripts/ensure_indexes.py
+  python scripts/ensure_indexes.py --verify
+  python scripts/ensure_indexes.py --verify-only
+
+Exits with status 2 when an index could not be created or (with --verify) a hot query is not index-backed.
+
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("ensure_indexes")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Create declared Mongo indexes and verify hot queries.")
+    parser.add_argument("--verify", action="store_true", help="After creating indexes, explain() every hot query.")
+    parser.add_argument("--verify-only", action="store_true", help="Only explain() hot queries; create nothing.")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.helpers.MongoIndexes import ensure_indexes, verify_hot_queries
+
+    MongoDB.connect(connection_string)
+    failed = False
+    try:
+        output = {}
+        if not args.verify_only:
+            output["indexes"] = await ensure_indexes()
+            failed = any(r["errors"] for r in output["indexes"].values())
+        if args.verify or args.verify_only:
+            output["hotQueries"] = await verify_hot_queries()
+            failed = failed or any(r["collscan"] or r["inMemorySort"] for r in output["hotQueries"])
+        print(json.dumps(output, indent=2))
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+    if failed:
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
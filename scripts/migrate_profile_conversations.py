@@ -0,0 +1,93 @@
+"""
+Move the onboarding transcript out of speaker_profiles.conversation (embedded array) into the bucketed
+profileConversations collection (app/models/ProfileConversation.py), then $unset the array.
+
+Safe to run while the app is serving: turns appended after the deploy already live in buckets, and the legacy
+messages are inserted ahead of them. Idempotent: a profile whose legacy buckets exist (e.g. the previous run
+stopped before the $unset) only gets the $unset.
+
+Run from project root:
+  python scripts/migrate_profile_conversations.py --dry-run
+  python scripts/migrate_profile_conversations.py --batch-size 200
+
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("migrate_profile_conversations")
+
+PENDING_FILTER = {"conversation": {"$exists": True}}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Move speaker_profiles.conversation into profileConversations buckets.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many profiles still embed a conversation.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Profiles read per batch (default: 100).")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.helpers.MongoIndexes import ensure_indexes
+    from app.models.SpeakerProfile import SpeakerProfileModel
+
+    MongoDB.connect(connection_string)
+    try:
+        model = SpeakerProfileModel()
+        conversations = model.conversations
+        pending = await model.collection.count_documents(PENDING_FILTER)
+        logger.info("Profiles with an embedded conversation: %d", pending)
+        if args.dry_run:
+            return
+        # The unique speaker_profile_id+seq index must exist before buckets are written
+        await ensure_indexes([conversations])
+
+        moved_profiles = moved_buckets = 0
+        last_id = None
+        while True:
+            query = dict(PENDING_FILTER)
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            batch = await model.collection.find(query, {"conversation": 1}).sort("_id", 1).limit(args.batch_size).to_list(
+                length=args.batch_size
+            )
+            if not batch:
+                break
+            for doc in batch:
+                profile_id = str(doc["_id"])
+                messages = doc.get("conversation") or []
+                if messages and not await conversations.has_legacy_buckets(profile_id):
+                    moved_buckets += await conversations.insert_legacy(profile_id, messages)
+                await model.collection.update_one(
+                    {"_id": doc["_id"], "conversation": doc.get("conversation")},
+                    {"$unset": {"conversation": ""}},
+                )
+                moved_profiles += 1
+            last_id = batch[-1]["_id"]
+            logger.info("Migrated %d/%d profile(s), %d bucket(s) written", moved_profiles, pending, moved_buckets)
+        logger.info("Done: %d profile(s), %d bucket(s)", moved_profiles, moved_buckets)
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
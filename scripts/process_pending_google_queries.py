@@ -11,6 +11,11 @@ Run from project root:
   python scripts/process_pending_google_queries.py
   python scripts/process_pending_google_queries.py --limit 10
 
+Bulk mode (--batch): all extraction prompts of the claimed batch, then all enrichment prompts, are written
+to JSONL request files under --work-dir and run through a batch provider instead of interactive calls:
+  python scripts/process_pending_google_queries.py --batch --limit 200
+  python scripts/process_pending_google_queries.py --batch --provider fixture --fixture-dir fixtures/batch
+
 Requires .env: MONGODB_CONNECTION_STRING, DB_NAME, plus the same keys as the app (SERP, RapidAPI, OpenAI, Pinecone, etc.).
 """
 import argparse
@@ -40,6 +45,20 @@ async def main():
         default=10,
         help="Maximum number of pending GoogleQueries to claim and process this run (default: 10).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Offline batch-extraction mode: submit LLM prompts as JSONL batches instead of interactive calls.",
+    )
+    parser.add_argument(
+        "--provider",
+        choices=["openai", "fixture"],
+        default="openai",
+        help="Batch provider for --batch (default: openai). 'fixture' replays responses from --fixture-dir.",
+    )
+    parser.add_argument("--fixture-dir", default=None, help="Fixture directory for --provider fixture.")
+    parser.add_argument("--work-dir", default=None, help="Directory for JSONL request files (default: BATCH_EXTRACTION_WORK_DIR or batch_runs).")
+    parser.add_argument("--poll-interval", type=float, default=30, help="Seconds between batch status polls (default: 30).")
     args = parser.parse_args()
 
     connection_string = os.getenv("MONGODB_CONNECTION_STRING")
@@ -49,15 +68,29 @@ async def main():
         sys.exit(1)
 
     from app.helpers.Database import MongoDB
+    from app.helpers.SerpHelper import close_serp_sessions
     from app.services.GoogleQueryScraper import GoogleQueryScraperService
 
     MongoDB.connect(connection_string)
     try:
-        service = GoogleQueryScraperService()
-        summary = await service.process_pending_batch(limit=args.limit)
+        if args.batch:
+            from app.helpers.BatchExtraction import get_batch_provider
+            from app.services.GoogleQueryBatchExtraction import GoogleQueryBatchExtractionService
+
+            provider = get_batch_provider(args.provider, fixture_dir=args.fixture_dir)
+            service = GoogleQueryBatchExtractionService(provider, work_dir=args.work_dir)
+            summary = await service.process_pending_batch(
+                limit=args.limit,
+                poll_interval_seconds=args.poll_interval,
+            )
+        else:
+            service = GoogleQueryScraperService()
+            summary = await service.process_pending_batch(limit=args.limit)
         logger.info("Batch finished: %s", summary)
         print(summary)
     finally:
+        # The SERP aiohttp session is bound to this asyncio.run loop; close it before the loop ends
+        await close_serp_sessions()
         if MongoDB.client:
             MongoDB.client.close()
 
@@ -0,0 +1,72 @@
+"""
+Run the Opportunities change-stream consumer (app/services/OpportunityChangeStream.py): keeps Pinecone vectors
+and matchedOpportunities in step with inserts, updates and deletes on the Opportunities collection.
+
+Run one instance per database, next to the API (which should have OPPORTUNITY_CHANGE_STREAM_ENABLED=true so
+ingestion and deletes skip the inline vector work). Stops cleanly on SIGINT / SIGTERM after the current batch.
+
+Run from project root:
+  python scripts/run_opportunity_change_stream.py
+  python scripts/run_opportunity_change_stream.py --from-now
+
+Requires a replica set (a local single-node one is enough: mongod --replSet rs0, then rs.initiate()).
+Requires .env: MONGODB_CONNECTION_STRING, DB_NAME, plus OpenAI / Pinecone keys for embeddings.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("run_opportunity_change_stream")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Sync Pinecone and matchedOpportunities from the Opportunities change stream.")
+    parser.add_argument(
+        "--from-now",
+        action="store_true",
+        help="Discard the saved resume token and start from the current end of the stream.",
+    )
+    args = parser.parse_args()
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    db_name = os.getenv("DB_NAME")
+    if not connection_string or not db_name:
+        logger.error("Missing MONGODB_CONNECTION_STRING or DB_NAME in environment")
+        sys.exit(1)
+
+    from app.helpers.Database import MongoDB
+    from app.services.OpportunityChangeStream import CONSUMER_NAME, OpportunityChangeStreamConsumer
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    MongoDB.connect(connection_string)
+    try:
+        consumer = OpportunityChangeStreamConsumer()
+        if args.from_now:
+            await consumer.token_model.clear_token(CONSUMER_NAME)
+            logger.info("Resume token cleared; consuming from now")
+        await consumer.run(stop)
+        logger.info("Change-stream consumer stopped")
+    finally:
+        if MongoDB.client:
+            MongoDB.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -97,6 +97,7 @@ async def main():
         sys.exit(1)
 
     from app.helpers.Database import MongoDB
+    from app.models.SpeakerOptionCatalog import CATALOG_VERSIONS_COLLECTION
 
     MongoDB.connect(connection_string)
     db = MongoDB.get_database(db_name)
@@ -109,6 +110,10 @@ async def main():
 
     await topics_coll.insert_many(topic_docs)
     # await audience_coll.insert_many(audience_docs)
+    # Running API workers reload their cached catalog when the version changes
+    await db[CATALOG_VERSIONS_COLLECTION].update_one(
+        {"_id": SPEAKER_TOPICS_COLLECTION}, {"$inc": {"version": 1}}, upsert=True
+    )
 
     print("Inserted %d documents into %s" % (len(topic_docs), SPEAKER_TOPICS_COLLECTION))
     for d in topic_docs:
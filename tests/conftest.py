@@ -0,0 +1,50 @@
+"""
+Shared fixtures. Tests that need MongoDB run against a single-node local replica set (change streams need one):
+
+  mongod --replSet rs0 --port 27018 --dbpath /tmp/rs0 --bind_ip 127.0.0.1
+  mongosh --port 27018 --eval "rs.initiate()"
+  MONGODB_REPLSET_URI="mongodb://127.0.0.1:27018/?replicaSet=rs0" python -m pytest tests
+
+Without MONGODB_REPLSET_URI those tests are skipped. They share one throwaway database (TEST_DB_NAME), dropped
+after each test; DB_NAME is set here, before any app module is imported, because models read it as a default
+argument at import time.
+"""
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MONGODB_REPLSET_URI = os.getenv("MONGODB_REPLSET_URI")
+TEST_DB_NAME = f"test_{uuid.uuid4().hex[:12]}"
+os.environ["DB_NAME"] = TEST_DB_NAME
+
+
+@pytest.fixture
+def replset_db():
+    """
+    Run a coroutine against an empty test database on the replica set: replset_db(fn) calls await fn(db_name)
+    inside one event loop with MongoDB.client connected, then drops the database.
+    """
+    if not MONGODB_REPLSET_URI:
+        pytest.skip("MONGODB_REPLSET_URI not set (needs a single-node replica set)")
+    from app.helpers.Database import MongoDB
+
+    db_name = TEST_DB_NAME
+
+    def run(fn):
+        async def scenario():
+            MongoDB.connect(MONGODB_REPLSET_URI)
+            try:
+                return await fn(db_name)
+            finally:
+                await MongoDB.client.drop_database(db_name)
+                MongoDB.client.close()
+                MongoDB.client = None
+
+        return asyncio.run(scenario())
+
+    return run
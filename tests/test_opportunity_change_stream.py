@@ -0,0 +1,257 @@
+"""
+OpportunityChangeStream: plan_batch, process_batch and resume-token handling.
+The stream tests need a single-node replica set (see conftest.py); Pinecone is replaced by FakeVectorStore.
+"""
+import asyncio
+import time
+
+import pytest
+from bson import ObjectId
+
+from app.services.OpportunityChangeStream import (
+    _WATCH_PIPELINE,
+    CONSUMER_NAME,
+    OpportunityChangeStreamConsumer,
+    plan_batch,
+)
+
+
+class FakeVectorStore:
+    """Records upserts / deletes in memory; fail=True makes every call raise like a Pinecone outage."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.attempts = 0
+        self.upserted = {}
+        self.deleted = set()
+
+    def is_configured(self) -> bool:
+        return True
+
+    def upsert_opportunities(self, items, raise_on_error=False):
+        self.attempts += 1
+        if self.fail:
+            raise RuntimeError("pinecone unavailable")
+        for oid, doc in items:
+            self.upserted[str(oid)] = doc
+        return len(items)
+
+    def delete_opportunities(self, opportunity_ids, raise_on_error=False):
+        self.attempts += 1
+        if self.fail:
+            raise RuntimeError("pinecone unavailable")
+        self.deleted.update(str(oid) for oid in opportunity_ids)
+        return True
+
+
+def _opportunity(**fields) -> dict:
+    doc = {
+        "_id": ObjectId(),
+        "link": "https://events.example.org/cfp",
+        "event_name": "Example Summit",
+        "topics": ["Leadership"],
+        "isQualified": True,
+    }
+    doc.update(fields)
+    return doc
+
+
+def _change(op: str, oid, doc=None, updated=None) -> dict:
+    change = {"operationType": op, "documentKey": {"_id": oid}}
+    if op != "delete":
+        change["fullDocument"] = doc
+    if op == "update":
+        change["updateDescription"] = {"updatedFields": updated or {}, "removedFields": []}
+    return change
+
+
+async def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.05)
+
+
+async def _read_changes(stream, count: int, timeout: float = 10.0) -> list:
+    changes = []
+    deadline = time.monotonic() + timeout
+    while len(changes) < count and time.monotonic() < deadline:
+        change = await stream.try_next()
+        if change is not None:
+            changes.append(change)
+    assert len(changes) == count
+    return changes
+
+
+async def _saved_token(consumer: OpportunityChangeStreamConsumer, timeout: float = 10.0) -> dict:
+    """Wait until the running consumer has opened its stream and saved a starting token."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        token = await consumer.token_model.get_token(CONSUMER_NAME)
+        if token is not None:
+            return token
+        await asyncio.sleep(0.05)
+    raise AssertionError("no resume token saved in time")
+
+
+def _consumer(store: FakeVectorStore, **kwargs) -> OpportunityChangeStreamConsumer:
+    return OpportunityChangeStreamConsumer(
+        pinecone_store=store,
+        batch_max_wait_ms=100,
+        retry_delay_seconds=0.05,
+        retry_max_delay_seconds=0.1,
+        **kwargs,
+    )
+
+
+# plan_batch
+
+
+def test_plan_batch_later_events_win():
+    doc = _opportunity()
+    oid = doc["_id"]
+    actions = plan_batch([_change("insert", oid, doc), _change("delete", oid)])
+    assert actions == {str(oid): {"action": "delete", "deleted": True}}
+
+
+def test_plan_batch_skips_updates_to_unembedded_fields():
+    doc = _opportunity()
+    oid = doc["_id"]
+    assert plan_batch([_change("update", oid, doc, {"event_name": "Renamed"})]) == {}
+    actions = plan_batch([_change("update", oid, doc, {"topics.0": "AI"})])
+    assert actions[str(oid)]["action"] == "upsert"
+
+
+def test_plan_batch_unqualified_document_is_removed_from_index_only():
+    doc = _opportunity(isQualified=False)
+    actions = plan_batch([_change("replace", doc["_id"], doc)])
+    assert actions == {str(doc["_id"]): {"action": "delete", "deleted": False}}
+
+
+def test_plan_batch_ignores_update_of_already_deleted_document():
+    oid = ObjectId()
+    assert plan_batch([_change("update", oid, None, {"topics": []})]) == {}
+
+
+def test_plan_batch_on_replica_set_events(replset_db):
+    async def scenario(db_name):
+        consumer = _consumer(FakeVectorStore())
+        collection = consumer.opportunity_model.collection
+        kept, dropped = _opportunity(), _opportunity()
+        async with collection.watch(_WATCH_PIPELINE, full_document="updateLookup") as stream:
+            await collection.insert_many([kept, dropped])
+            await collection.update_one({"_id": kept["_id"]}, {"$set": {"event_name": "Renamed"}})
+            await collection.update_one({"_id": kept["_id"]}, {"$set": {"topics": ["AI"]}})
+            await collection.delete_one({"_id": dropped["_id"]})
+            changes = await _read_changes(stream, 5)
+        actions = plan_batch(changes)
+        assert actions[str(kept["_id"])]["action"] == "upsert"
+        assert actions[str(kept["_id"])]["doc"]["topics"] == ["AI"]
+        assert actions[str(dropped["_id"])] == {"action": "delete", "deleted": True}
+
+    replset_db(scenario)
+
+
+# process_batch
+
+
+def test_process_batch_applies_vectors_and_invalidates_matches(replset_db):
+    async def scenario(db_name):
+        store = FakeVectorStore()
+        consumer = _consumer(store)
+        collection = consumer.opportunity_model.collection
+        kept, dropped = _opportunity(), _opportunity()
+        await consumer.matched_opportunities_model.collection.insert_one(
+            {"speaker_id": "s1", "opportunities": [str(kept["_id"]), str(dropped["_id"])], "status": "completed"}
+        )
+        async with collection.watch(_WATCH_PIPELINE, full_document="updateLookup") as stream:
+            await collection.insert_many([kept, dropped])
+            await collection.delete_one({"_id": dropped["_id"]})
+            changes = await _read_changes(stream, 3)
+
+        summary = await consumer.process_batch(changes)
+
+        assert summary == {"events": 3, "upserted": 1, "deleted": 1, "matchesInvalidated": 1}
+        assert set(store.upserted) == {str(kept["_id"])}
+        assert store.deleted == {str(dropped["_id"])}
+        matched = await consumer.matched_opportunities_model.collection.find_one({"speaker_id": "s1"})
+        assert matched["opportunities"] == [str(kept["_id"])]
+
+    replset_db(scenario)
+
+
+def test_process_batch_raises_when_vector_store_fails(replset_db):
+    async def scenario(db_name):
+        consumer = _consumer(FakeVectorStore(fail=True))
+        doc = _opportunity()
+        with pytest.raises(RuntimeError):
+            await consumer.process_batch([_change("insert", doc["_id"], doc)])
+
+    replset_db(scenario)
+
+
+# Resume tokens
+
+
+def test_consumer_saves_token_and_resumes_after_restart(replset_db):
+    async def scenario(db_name):
+        first_store = FakeVectorStore()
+        first = _consumer(first_store)
+        collection = first.opportunity_model.collection
+        stop = asyncio.Event()
+        task = asyncio.create_task(first.run(stop))
+        start_token = await _saved_token(first)
+
+        before = _opportunity()
+        await collection.insert_one(before)
+        await _wait_for(lambda: str(before["_id"]) in first_store.upserted)
+        stop.set()
+        await asyncio.wait_for(task, 10)
+        token = await first.token_model.get_token(CONSUMER_NAME)
+        assert token != start_token
+
+        # Written while no consumer runs: picked up from the saved token, the earlier insert is not replayed
+        during = _opportunity()
+        await collection.insert_one(during)
+        second_store = FakeVectorStore()
+        second = _consumer(second_store)
+        stop = asyncio.Event()
+        task = asyncio.create_task(second.run(stop))
+        await _wait_for(lambda: str(during["_id"]) in second_store.upserted)
+        stop.set()
+        await asyncio.wait_for(task, 10)
+        assert str(before["_id"]) not in second_store.upserted
+        assert await second.token_model.get_token(CONSUMER_NAME) != token
+
+    replset_db(scenario)
+
+
+def test_failed_batch_does_not_advance_token(replset_db):
+    async def scenario(db_name):
+        failing_store = FakeVectorStore(fail=True)
+        first = _consumer(failing_store)
+        collection = first.opportunity_model.collection
+        stop = asyncio.Event()
+        task = asyncio.create_task(first.run(stop))
+        token = await _saved_token(first)
+
+        doc = _opportunity()
+        await collection.insert_one(doc)
+        # Retried with backoff, never applied
+        await _wait_for(lambda: failing_store.attempts >= 3)
+        stop.set()
+        await asyncio.wait_for(task, 10)
+        assert await first.token_model.get_token(CONSUMER_NAME) == token
+
+        # After the outage the restarted consumer replays the batch from the saved token
+        healthy_store = FakeVectorStore()
+        second = _consumer(healthy_store)
+        stop = asyncio.Event()
+        task = asyncio.create_task(second.run(stop))
+        await _wait_for(lambda: str(doc["_id"]) in healthy_store.upserted)
+        stop.set()
+        await asyncio.wait_for(task, 10)
+        assert await second.token_model.get_token(CONSUMER_NAME) != token
+
+    replset_db(scenario)